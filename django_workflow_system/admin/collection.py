@@ -1,22 +1,18 @@
 """Admin interface implementation collection-related models."""
-from itertools import chain, count
-
-
 from django.contrib import admin
-from django.db import IntegrityError
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..utils.admin_utils import IsActiveCollectionFilter
+from ..utils.cloning import clone_collection
 from ..models import (
-    Workflow,
     WorkflowCollection,
     WorkflowCollectionMember,
-    WorkflowStep,
-    WorkflowStepDependencyGroup,
-    WorkflowStepDependencyDetail,
     WorkflowCollectionAssignment,
     WorkflowCollectionEngagement,
     WorkflowCollectionImage,
+    WorkflowCollectionSubscription,
 )
 from .collection_dependency import WorkflowCollectionDependencyInline
 
@@ -45,7 +41,9 @@ class WorkflowCollectionAdmin(admin.ModelAdmin):
         "open_subscriptions",
     )
     filter_horizontal = ["metadata"]
-    search_fields = ["name", "category"]
+    raw_id_fields = ["created_by"]
+    search_fields = ["name", "code", "category"]
+    ordering = ["name"]
 
     # I don't know why this works
     # https://github.com/django/django/blob/1b4d1675b230cd6d47c2ffce41893d1881bf447b/django/contrib/auth/admin.py#L25
@@ -88,7 +86,47 @@ class WorkflowCollectionAdmin(admin.ModelAdmin):
     actions = ["copy", "deep_copy", "kill_stragglers"]
     list_filter = [IsActiveCollectionFilter]
 
+    def get_queryset(self, request):
+        """
+        Count the open assignments and subscriptions of every collection in
+        the same query that loads the collections.
+
+        Each count is a correlated subquery of its own, rather than a join,
+        so the two tables are never multiplied together.
+        """
+
+        def count_open(model, **filters):
+            return Coalesce(
+                Subquery(
+                    model.objects.filter(workflow_collection=OuterRef("pk"), **filters)
+                    .order_by()
+                    .values("workflow_collection")
+                    .annotate(count=Count("pk"))
+                    .values("count")
+                ),
+                0,
+            )
+
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                open_assignment_count=count_open(
+                    WorkflowCollectionAssignment,
+                    status__in=(
+                        WorkflowCollectionAssignment.ASSIGNED,
+                        WorkflowCollectionAssignment.IN_PROGRESS,
+                    ),
+                ),
+                open_subscription_count=count_open(
+                    WorkflowCollectionSubscription, active=True
+                ),
+            )
+        )
+
     def open_assignments(self, instance: WorkflowCollection):
+        if hasattr(instance, "open_assignment_count"):
+            return instance.open_assignment_count
         return instance.workflowcollectionassignment_set.filter(
             status__in=(
                 WorkflowCollectionAssignment.ASSIGNED,
@@ -96,9 +134,15 @@ class WorkflowCollectionAdmin(admin.ModelAdmin):
             )
         ).count()
 
+    open_assignments.admin_order_field = "open_assignment_count"
+
     def open_subscriptions(self, instance: WorkflowCollection):
+        if hasattr(instance, "open_subscription_count"):
+            return instance.open_subscription_count
         return instance.workflowcollectionsubscription_set.filter(active=True).count()
 
+    open_subscriptions.admin_order_field = "open_subscription_count"
+
     def copy(self, request, queryset):
         """
         This method copies the workflow collection,
@@ -106,61 +150,8 @@ class WorkflowCollectionAdmin(admin.ModelAdmin):
         every dependency and dependency detail,
         and LINKS to metadata
         """
-        workflow_collection: WorkflowCollection
         for workflow_collection in queryset:
-            old_workflow_collection = WorkflowCollection.objects.get(
-                pk=workflow_collection.pk
-            )
-            workflow_collection.pk = None
-            workflow_collection.code += "_copy"
-            workflow_collection.name += " (copy)"
-            try:
-                workflow_collection.save()  # our new collection gets a primary key here
-            except IntegrityError:
-                for num_existing_copies in count(1):
-                    workflow_collection.code = "{}_copy_{}".format(
-                        old_workflow_collection.code, num_existing_copies
-                    )
-                    workflow_collection.name = "{} (copy {})".format(
-                        old_workflow_collection.name, num_existing_copies
-                    )
-                    try:
-                        workflow_collection.save()
-                    except IntegrityError:
-                        pass
-                    else:
-                        break
-
-            member: WorkflowCollectionMember
-            for member in old_workflow_collection.workflowcollectionmember_set.all():
-                member.pk = None
-                member.workflow_collection = workflow_collection
-                member.save()
-
-            workflow_step_dependency_group: WorkflowStepDependencyGroup
-            for (
-                workflow_step_dependency_group
-            ) in old_workflow_collection.workflowstepdependencygroup_set.all():
-                old_workflow_step_dependency_group = (
-                    WorkflowStepDependencyGroup.objects.get(
-                        pk=workflow_step_dependency_group.pk
-                    )
-                )
-                workflow_step_dependency_group.pk = None
-                workflow_step_dependency_group.workflow_collection = workflow_collection
-                workflow_step_dependency_group.save()
-
-                dependency_detail: WorkflowStepDependencyDetail
-                for (
-                    dependency_detail
-                ) in (
-                    old_workflow_step_dependency_group.workflowstepdependencydetail_set.all()
-                ):
-                    dependency_detail.id = None
-                    dependency_detail.dependency_group = workflow_step_dependency_group
-                    dependency_detail.save()
-
-            workflow_collection.metadata.set(old_workflow_collection.metadata.all())
+            clone_collection(workflow_collection)
 
     copy.short_description = "Copy selected workflow collections"
     copy.allowed_permissions = ("add",)
@@ -172,105 +163,8 @@ class WorkflowCollectionAdmin(admin.ModelAdmin):
         every dependency and dependency detail,
         and LINKS to metadata
         """
-        workflow_collection: WorkflowCollection
         for workflow_collection in queryset:
-            old_workflow_collection = WorkflowCollection.objects.get(
-                pk=workflow_collection.pk
-            )
-            workflow_collection.pk = None
-            workflow_collection.code += "_copy"
-            workflow_collection.name += " (copy)"
-            try:
-                workflow_collection.save()  # our new collection gets a primary key here
-            except IntegrityError:
-                for num_existing_copies in count(1):
-                    workflow_collection.code = "{}_copy_{}".format(
-                        old_workflow_collection.code, num_existing_copies
-                    )
-                    workflow_collection.name = "{} (copy {})".format(
-                        old_workflow_collection.name, num_existing_copies
-                    )
-                    try:
-                        workflow_collection.save()
-                    except IntegrityError:
-                        pass
-                    else:
-                        break
-
-            member: WorkflowCollectionMember
-            for member in old_workflow_collection.workflowcollectionmember_set.all():
-
-                old_workflow = Workflow.objects.get(pk=member.workflow.pk)
-                new_workflow = Workflow.objects.get(pk=member.workflow.pk)
-
-                new_workflow.pk = None
-                new_workflow.code += "_copy"
-                new_workflow.name += " (copy)"
-                new_workflow.save()  # our new workflow gets a primary key here
-
-                member.pk = None
-                member.workflow = new_workflow
-                member.workflow_collection = workflow_collection
-                member.save()
-
-                old_to_new_step = {}
-                for step in old_workflow.workflowstep_set.all():
-                    old_step = WorkflowStep.objects.get(pk=step.pk)
-                    step.pk = None  # creates a new instance when saved
-                    step.workflow = new_workflow
-                    step.save()  # our new step gets a primary key here
-
-                    old_to_new_step[old_step] = step
-
-                    for metadata in old_step.metadata.all():
-                        step.metadata.add(metadata)
-
-                    step_media_iterator = chain(
-                        old_step.workflowstepaudio_set.all(),
-                        old_step.workflowstepvideo_set.all(),
-                        old_step.workflowstepimage_set.all(),
-                        old_step.workflowstepinput_set.all(),
-                        old_step.workflowsteptext_set.all(),
-                    )
-                    for step_media in step_media_iterator:
-                        step_media.pk = None  # creates a new instance when saved
-                        step_media.workflow_step = step
-                        step_media.save()  # our new step gets a primary key here
-
-                workflow_step_dependency_group: WorkflowStepDependencyGroup
-                for (
-                    workflow_step_dependency_group
-                ) in old_workflow_collection.workflowstepdependencygroup_set.all():
-                    old_workflow_step_dependency_group = (
-                        WorkflowStepDependencyGroup.objects.get(
-                            pk=workflow_step_dependency_group.pk
-                        )
-                    )
-                    workflow_step_dependency_group.pk = None
-                    workflow_step_dependency_group.workflow_collection = (
-                        workflow_collection
-                    )
-                    workflow_step_dependency_group.workflow_step = old_to_new_step[
-                        workflow_step_dependency_group.workflow_step
-                    ]
-                    workflow_step_dependency_group.save()
-
-                    dependency_detail: WorkflowStepDependencyDetail
-                    for (
-                        dependency_detail
-                    ) in (
-                        old_workflow_step_dependency_group.workflowstepdependencydetail_set.all()
-                    ):
-                        dependency_detail.id = None
-                        dependency_detail.dependency_group = (
-                            workflow_step_dependency_group
-                        )
-                        dependency_detail.dependency_step = old_to_new_step[
-                            dependency_detail.dependency_step
-                        ]
-                        dependency_detail.save()
-
-            workflow_collection.metadata.set(old_workflow_collection.metadata.all())
+            clone_collection(workflow_collection, deep=True)
 
     deep_copy.short_description = "Copy selected workflow collections and its workflows"
     deep_copy.allowed_permissions = ("add",)
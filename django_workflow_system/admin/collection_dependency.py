@@ -10,9 +10,12 @@ class WorkflowCollectionDependencyAdmin(admin.ModelAdmin):
         "source",
         "target",
     ]
+    list_select_related = ["source", "target"]
+    autocomplete_fields = ["source", "target"]
 
 
 class WorkflowCollectionDependencyInline(admin.StackedInline):
     model = WorkflowCollectionDependency
     extra = 1
     fk_name = "source"
+    autocomplete_fields = ["target"]
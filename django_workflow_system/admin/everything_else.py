@@ -1,11 +1,17 @@
 """
 Admin interface implementation for every workflow model not deserving of its own file
 """
-from itertools import chain, count
-
 from django.contrib import admin
-from django.db import IntegrityError
-from django.db.models import Case, When, Value, IntegerField, QuerySet, Count
+from django.db.models import (
+    Case,
+    When,
+    Value,
+    IntegerField,
+    QuerySet,
+    Exists,
+    OuterRef,
+    Prefetch,
+)
 from django.http import HttpRequest
 from django.utils.safestring import mark_safe
 
@@ -14,6 +20,7 @@ from ..utils.admin_utils import (
     MeOrAllFilter,
     USER_SEARCH_FIELDS,
 )
+from ..utils.cloning import clone_workflows
 from ..models import (
     JSONSchema,
     Workflow,
@@ -44,8 +51,16 @@ class WorkflowCollectionAssignmentAdmin(admin.ModelAdmin):
         "status",
         "engagement",
     ]
+    list_select_related = [
+        "workflow_collection",
+        "user",
+        "engagement__workflow_collection",
+        "engagement__user",
+    ]
     list_filter = [MeOrAllFilter, "workflow_collection", "status"]
     search_fields = USER_SEARCH_FIELDS + ("workflow_collection__code",)
+    autocomplete_fields = ["workflow_collection"]
+    raw_id_fields = ["user"]
 
     readonly_fields = ["engagement"]
 
@@ -56,8 +71,10 @@ class WorkflowCollectionAssignmentAdmin(admin.ModelAdmin):
 @admin.register(WorkflowAuthor)
 class AuthorAdmin(admin.ModelAdmin):
     list_display = ("user", "title")
+    list_select_related = ["user"]
     list_editable = ["title"]
     search_fields = USER_SEARCH_FIELDS
+    raw_id_fields = ["user"]
 
 
 def make_ordering():
@@ -155,20 +172,23 @@ class HasDetailsFilter(admin.SimpleListFilter):
         return [("true", "True"), ("false", "False")]
 
     def queryset(self, request: HttpRequest, queryset: QuerySet):
+        # EXISTS stops at the first detail instead of grouping every engagement.
+        has_details = Exists(
+            WorkflowCollectionEngagementDetail.objects.filter(
+                workflow_collection_engagement=OuterRef("pk")
+            )
+        )
         if self.value() == "true":
-            queryset = queryset.annotate(
-                Count("workflowcollectionengagementdetail")
-            ).exclude(workflowcollectionengagementdetail__count=0)
+            queryset = queryset.filter(has_details)
         elif self.value() == "false":
-            queryset = queryset.annotate(
-                Count("workflowcollectionengagementdetail")
-            ).filter(workflowcollectionengagementdetail__count=0)
+            queryset = queryset.filter(~has_details)
         return queryset
 
 
 @admin.register(WorkflowCollectionEngagement)
 class WorkflowCollectionEngagementAdmin(admin.ModelAdmin):
     list_display = ["workflow_collection", "user", "started", "finished"]
+    list_select_related = ["workflow_collection", "user"]
     list_filter = [
         "workflow_collection",
         IsFinishedFilter,
@@ -176,7 +196,9 @@ class WorkflowCollectionEngagementAdmin(admin.ModelAdmin):
         MeOrAllFilter,
     ]
     inlines = [WorkflowCollectionEngagementDetailInline]
-    search_fields = USER_SEARCH_FIELDS
+    search_fields = USER_SEARCH_FIELDS + ("workflow_collection__code",)
+    autocomplete_fields = ["workflow_collection"]
+    raw_id_fields = ["user"]
 
 
 @admin.register(WorkflowCollectionEngagementDetail)
@@ -188,11 +210,17 @@ class WorkflowCollectionEngagementDetailAdmin(admin.ModelAdmin):
         "started",
         "finished",
     ]
+    list_select_related = [
+        "workflow_collection_engagement__workflow_collection",
+        "workflow_collection_engagement__user",
+        "step__workflow",
+    ]
     search_fields = [
         "workflow_collection_engagement__" + field for field in USER_SEARCH_FIELDS
     ] + [
         "workflow_collection_engagement__workflow_collection__code",
     ]
+    autocomplete_fields = ["workflow_collection_engagement", "step"]
 
     def user(self, obj: WorkflowCollectionEngagementDetail):
         return obj.workflow_collection_engagement.user.username
@@ -220,9 +248,12 @@ class WorkflowCollectionSubscriptionScheduleInline(admin.TabularInline):
 @admin.register(WorkflowCollectionSubscription)
 class WorkflowCollectionSubscriptionAdmin(admin.ModelAdmin):
     list_display = ["workflow_collection", "user", "active"]
+    list_select_related = ["workflow_collection", "user"]
     inlines = [WorkflowCollectionSubscriptionScheduleInline]
     list_filter = ["active", "workflow_collection"]
     search_fields = USER_SEARCH_FIELDS + ("workflow_collection__code",)
+    autocomplete_fields = ["workflow_collection"]
+    raw_id_fields = ["user"]
 
 
 # workflow.py
@@ -254,6 +285,7 @@ class WorkflowImageInline(admin.StackedInline):
 @admin.register(Workflow)
 class WorkflowAdmin(admin.ModelAdmin):
     list_display = ["name", "code", "author", "category"]
+    list_select_related = ["author__user"]
     inlines = [StepInLine, WorkflowImageInline]
     actions = ["copy"]
     list_filter = [
@@ -264,6 +296,8 @@ class WorkflowAdmin(admin.ModelAdmin):
     search_fields = ["name", "code"] + [
         "author__" + field for field in USER_SEARCH_FIELDS
     ]
+    autocomplete_fields = ["author"]
+    raw_id_fields = ["created_by"]
     # I don't know why this works
     # https://github.com/django/django/blob/1b4d1675b230cd6d47c2ffce41893d1881bf447b/django/contrib/auth/admin.py#L25
     # Line 31
@@ -287,8 +321,22 @@ class WorkflowAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ["image_preview"]
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .prefetch_related(
+                Prefetch(
+                    "workflowcollectionmember_set",
+                    queryset=WorkflowCollectionMember.objects.select_related(
+                        "workflow_collection"
+                    ),
+                )
+            )
+        )
+
     def category(self, obj):
-        member = WorkflowCollectionMember.objects.filter(workflow=obj)
+        member = obj.workflowcollectionmember_set.all()
         # NOTE(Adam): I found that some workflows belong to more than one collection, and thus may have
         #             multiple categories as well. I think it might be best to add category as a 1-n column?
         return ", ".join(set(map(lambda m: m.workflow_collection.category, member)))
@@ -300,49 +348,7 @@ class WorkflowAdmin(admin.ModelAdmin):
             return ""
 
     def copy(self, request, queryset):
-        workflow: Workflow
-        for workflow in queryset:
-            old_workflow = Workflow.objects.get(pk=workflow.pk)
-            workflow.pk = None
-            workflow.code += "_copy"
-            workflow.name += " (copy)"
-            try:
-                workflow.save()  # our new workflow gets a primary key here
-            except IntegrityError:
-                for num_existing_copies in count(1):
-                    workflow.code = "{}_copy_{}".format(
-                        old_workflow.code, num_existing_copies
-                    )
-                    workflow.name = "{} (copy {})".format(
-                        old_workflow.name, num_existing_copies
-                    )
-                    try:
-                        workflow.save()
-                    except IntegrityError:
-                        pass
-                    else:
-                        break
-
-            for step in old_workflow.workflowstep_set.all():
-                old_step = WorkflowStep.objects.get(pk=step.pk)
-                step.pk = None  # creates a new instance when saved
-                step.workflow = workflow
-                step.save()  # our new step gets a primary key here
-
-                for metadata in old_step.metadata.all():
-                    step.metadata.add(metadata)
-
-                step_media_iterator = chain(
-                    old_step.workflowstepaudio_set.all(),
-                    old_step.workflowstepvideo_set.all(),
-                    old_step.workflowstepimage_set.all(),
-                    old_step.workflowstepuserinput_set.all(),
-                    old_step.workflowsteptext_set.all(),
-                )
-                for step_media in step_media_iterator:
-                    step_media.pk = None  # creates a new instance when saved
-                    step_media.workflow_step = step
-                    step_media.save()  # our new step gets a primary key here
+        clone_workflows(queryset)
 
     copy.short_description = "Copy selected workflows"
     copy.allowed_permissions = ("add",)
@@ -367,5 +373,8 @@ class WorkflowImageTypeAdmin(admin.ModelAdmin):
 @admin.register(WorkflowCollectionRecommendation)
 class WorkflowCollectionRecommendationAdmin(admin.ModelAdmin):
     list_display = ["user", "workflow_collection", "start", "end"]
+    list_select_related = ["user", "workflow_collection"]
     ordering = ["user"]
     search_fields = USER_SEARCH_FIELDS + ("workflow_collection__code",)
+    autocomplete_fields = ["workflow_collection"]
+    raw_id_fields = ["user"]
@@ -79,6 +79,7 @@ class StepExternalLinkInline(admin.TabularInline):
 @admin.register(WorkflowStep)
 class WorkflowStepAdmin(admin.ModelAdmin):
     list_display = ["workflow", "code", "order", "ui_template"]
+    list_select_related = ["workflow", "ui_template"]
     inlines = [
         StepUserInputInLine,
         SteptextInline,
@@ -229,13 +230,20 @@ class WorkflowStepDependencyGroupForm(forms.ModelForm):
 @admin.register(WorkflowStepDependencyGroup)
 class WorkflowStepDependencyGroupAdmin(admin.ModelAdmin):
     list_display = ["workflow_step", "workflow_collection"]
+    list_select_related = ["workflow_step__workflow", "workflow_collection"]
     inlines = [WorkflowStepDependencyDetailInline]
     form = WorkflowStepDependencyGroupForm
+    autocomplete_fields = ["workflow_collection"]
 
 
 @admin.register(WorkflowStepDependencyDetail)
 class WorkflowStepDependencyDetailAdmin(admin.ModelAdmin):
     list_display = ["dependency_group", "dependency_step"]
+    list_select_related = [
+        "dependency_group__workflow_step",
+        "dependency_group__workflow_collection",
+        "dependency_step__workflow",
+    ]
 
 
 @admin.register(WorkflowStepUserInputType)
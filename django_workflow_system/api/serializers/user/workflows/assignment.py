@@ -1,6 +1,7 @@
 """DRF Serialzier Definition."""
 from rest_framework import serializers
 
+from ...utils import SparseFieldsMixin
 from .....models import (
     WorkflowCollectionEngagement,
     WorkflowCollectionAssignment,
@@ -8,7 +9,9 @@ from .....models import (
 )
 
 
-class WorkflowCollectionAssignmentSummarySerializer(serializers.ModelSerializer):
+class WorkflowCollectionAssignmentSummarySerializer(
+    SparseFieldsMixin, serializers.ModelSerializer
+):
     """ModelSerializer for operations on multiple WorkflowAssignment objects."""
 
     detail = serializers.HyperlinkedIdentityField(
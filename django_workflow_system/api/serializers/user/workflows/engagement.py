@@ -1,26 +1,66 @@
 """DRF Serialzier Definition."""
 import logging
 
+from django.db import IntegrityError, transaction
 from django.urls import reverse
 from django.urls.exceptions import NoReverseMatch
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
 from django_workflow_system.models.collections.engagement import EngagementStateType
 
 from .....models import WorkflowCollection, WorkflowCollectionEngagement
 from .engagement_detail import WorkflowCollectionEngagementDetailSerializer
+from ...utils import SparseFieldsMixin
 
 logger = logging.getLogger(__name__)
 
+OPEN_ENGAGEMENT_EXISTS = (
+    "The user has an existing incomplete engagement for this workflow collection."
+)
 
-class WorkflowCollectionEngagementBaseSerializer(serializers.ModelSerializer):
+
+class WorkflowCollectionEngagementBaseSerializer(
+    SparseFieldsMixin, serializers.ModelSerializer
+):
     """Base serializer for common methods/fields between Detailed and Summary serializers"""
 
+    def save(self, **kwargs):
+        """
+        Save the engagement.
+
+        Users can only have one unfinished engagement per workflow collection.
+        Rather than looking for one before every save, the database enforces
+        this with a constraint, and a violation is reported as a validation
+        error with the "unique" code.
+        """
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError:
+            data = {**self.validated_data, **kwargs}
+            user = data["user"] if "user" in data else self.instance.user
+            workflow_collection = (
+                data["workflow_collection"]
+                if "workflow_collection" in data
+                else self.instance.workflow_collection
+            )
+            open_engagements = WorkflowCollectionEngagement.objects.filter(
+                user=user, workflow_collection=workflow_collection, finished=None
+            )
+            if self.instance:
+                open_engagements = open_engagements.exclude(pk=self.instance.pk)
+            if open_engagements.exists():
+                raise serializers.ValidationError(
+                    {api_settings.NON_FIELD_ERRORS_KEY: [OPEN_ENGAGEMENT_EXISTS]},
+                    code="unique",
+                )
+            raise
+
     def validate(self, data):
         """
-        Check that the user does not have an existing unfinished engagement for the same
-        workflow collection, also ensure that the finish date is later than
-        the start date.
+        Ensure that the finish date is later than the start date, and that the
+        engagement and its assignment belong together.
         """
 
         def getattr_patched(attr_name):
@@ -67,19 +107,8 @@ class WorkflowCollectionEngagementBaseSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError(
                     "The Engagement and Assignment Users are not the same"
                 )
-        # Check if the user has an existing incomplete engagement to the same workflow collection
-
-        existing_engagement = WorkflowCollectionEngagement.objects.filter(
-            user=user,
-            workflow_collection=workflow_collection,
-            finished__isnull=True,
-        )
-        if self.instance:
-            existing_engagement = existing_engagement.exclude(pk=self.instance.pk)
-        if existing_engagement:
-            raise serializers.ValidationError(
-                "The user has an existing incomplete engagement for this workflow collection."
-            )
+        # An existing incomplete engagement to the same workflow collection is
+        # caught by a database constraint when saving, see `save`.
 
         if finished is not None:
             # Clean the finished engagement by deleting unfinished details
@@ -206,6 +235,12 @@ class WorkflowCollectionEngagementAndDetailsSerializer(
     Summary level Serializer for WorkflowCollectionEngagementDetail objects.
     """
 
+    prefetch_plan = {
+        "workflowcollectionengagementdetail_set": [
+            "workflowcollectionengagementdetail_set"
+        ],
+    }
+
     workflowcollectionengagementdetail_set = (
         WorkflowCollectionEngagementDetailSerializer(
             many=True,
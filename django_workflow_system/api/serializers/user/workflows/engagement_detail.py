@@ -4,6 +4,8 @@ import jsonschema
 from rest_framework import serializers
 
 from django_workflow_system.models.collections.engagement import EngagementStateType
+from django_workflow_system.utils.profiling import JSONSCHEMA_VALIDATIONS, count
+from django_workflow_system.utils.response_schemas import get_response_schema
 
 
 from .....models import (
@@ -12,9 +14,12 @@ from .....models import (
     WorkflowStep,
     WorkflowCollection,
 )
+from ...utils import SparseFieldsMixin
 
 
-class WorkflowCollectionEngagementDetailSerializer(serializers.ModelSerializer):
+class WorkflowCollectionEngagementDetailSerializer(
+    SparseFieldsMixin, serializers.ModelSerializer
+):
     """
     Summary level serializer for WorkflowEngagementDetail objects.
 
@@ -245,11 +250,11 @@ class WorkflowCollectionEngagementDetailSerializer(serializers.ModelSerializer):
                 responses_to_input = collected_user_inputs_by_step_input_id[
                     step_input_id
                 ]
+                response_schema = get_response_schema(step_input)
                 for index, response in responses_to_input.items():
+                    count(JSONSCHEMA_VALIDATIONS)
                     try:
-                        jsonschema.validate(
-                            instance=response, schema=step_input.response_schema
-                        )
+                        jsonschema.validate(instance=response, schema=response_schema)
                     except jsonschema.ValidationError:
                         # This answer is not valid
                         for entry in user_responses[index]["inputs"]:
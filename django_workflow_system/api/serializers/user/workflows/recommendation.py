@@ -1,13 +1,16 @@
 """DRF Serializer Definition"""
 from rest_framework import serializers
 
+from ...utils import SparseFieldsMixin
 from .....models import (
     WorkflowCollection,
     WorkflowCollectionRecommendation,
 )
 
 
-class WorkflowCollectionRecommendationSerializer(serializers.ModelSerializer):
+class WorkflowCollectionRecommendationSerializer(
+    SparseFieldsMixin, serializers.ModelSerializer
+):
     """Serializer for WorkflowCollectionRecommendation objects"""
 
     detail = serializers.HyperlinkedIdentityField(
@@ -1,6 +1,9 @@
 """DRF Serialzier Definition."""
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers, exceptions as drf_exceptions
 
+from ...utils import SparseFieldsMixin
 from .....models import (
     WorkflowCollectionSubscription,
     WorkflowCollectionSubscriptionSchedule,
@@ -18,9 +21,17 @@ class WorkflowCollectionSubscriptionScheduleSummarySerializer(
         fields = ["time_of_day", "day_of_week", "weekly_interval"]
 
 
-class WorkflowCollectionSubscriptionSummarySerializer(serializers.ModelSerializer):
+class WorkflowCollectionSubscriptionSummarySerializer(
+    SparseFieldsMixin, serializers.ModelSerializer
+):
     """ModelSerializer for Workflow Collection Subscription Objects."""
 
+    prefetch_plan = {
+        "workflowcollectionsubscriptionschedule_set": [
+            "workflowcollectionsubscriptionschedule_set"
+        ],
+    }
+
     detail = serializers.HyperlinkedIdentityField(
         view_name="user-workflow-collection-subscription", lookup_field="id"
     )
@@ -47,6 +58,20 @@ class WorkflowCollectionSubscriptionSummarySerializer(serializers.ModelSerialize
             "workflowcollectionsubscriptionschedule_set",
         ]
 
+    def validate_workflowcollectionsubscriptionschedule_set(self, value):
+        """
+        Make sure that no more than one schedule is given for each day of the week.
+
+        Catching this here lets us return a 400 before anything is written
+        instead of tripping over the unique constraint part way through a save.
+        """
+        days_of_week = [schedule["day_of_week"] for schedule in value]
+        if len(days_of_week) != len(set(days_of_week)):
+            raise serializers.ValidationError(
+                "Only one schedule may be provided for each day of the week."
+            )
+        return value
+
     def create(self, validated_data):
         """
         Override create() method to be able to handle nested
@@ -66,8 +91,6 @@ class WorkflowCollectionSubscriptionSummarySerializer(serializers.ModelSerialize
             "workflowcollectionsubscriptionschedule_set"
         )
 
-        # TODO: This doesn't handle a user submitting multiple schedules for the same day.
-        # Should raise an appropriate validation error.
         for subscription in workflowcollectionsubscriptionschedule_data:
             subscription[
                 "workflow_collection_subscription"
@@ -97,19 +120,74 @@ class WorkflowCollectionSubscriptionSummarySerializer(serializers.ModelSerialize
                 The modified WorkflowCollectionSubscription object.
 
         """
-        instance.workflowcollectionsubscriptionschedule_set.all().delete()
-
         instance.active = validated_data["active"]
 
         workflowcollectionsubscriptionschedule_data = validated_data.pop(
             "workflowcollectionsubscriptionschedule_set"
         )
 
-        # TODO: This doesn't handle a user submitting multiple schedules for the same day.
-        # Should raise an appropriate validation error.
-        for subscription in workflowcollectionsubscriptionschedule_data:
-            subscription["workflow_collection_subscription"] = instance
-            WorkflowCollectionSubscriptionSchedule.objects.create(**subscription)
+        with transaction.atomic():
+            instance.save()
+            self._sync_schedules(instance, workflowcollectionsubscriptionschedule_data)
 
-        instance.save()
         return instance
+
+    @staticmethod
+    def _sync_schedules(instance, schedule_data):
+        """
+        Make the subscription's schedules match `schedule_data`.
+
+        Incoming schedules are matched to existing ones by `day_of_week`.
+        Changed schedules are updated in place, new days are inserted and
+        days that are no longer present are deleted, each with a single
+        query. Schedules that did not change are not written at all.
+
+        Parameters:
+            instance (WorkflowCollectionSubscription): The subscription being updated.
+            schedule_data (list): Validated schedule dictionaries. Days of the
+                                  week are expected to be unique.
+        """
+        now = timezone.now()
+        existing = {
+            schedule.day_of_week: schedule
+            for schedule in instance.workflowcollectionsubscriptionschedule_set.all()
+        }
+        to_create = []
+        to_update = []
+
+        for data in schedule_data:
+            schedule = existing.pop(data["day_of_week"], None)
+            if schedule is None:
+                schedule = WorkflowCollectionSubscriptionSchedule(
+                    workflow_collection_subscription=instance, **data
+                )
+                to_create.append(schedule)
+            else:
+                # Omitted fields fall back to their defaults, as they would on create.
+                changes = {
+                    field: data.get(field, schedule._meta.get_field(field).default)
+                    for field in ("time_of_day", "weekly_interval")
+                }
+                if all(
+                    getattr(schedule, field) == value
+                    for field, value in changes.items()
+                ):
+                    continue
+                for field, value in changes.items():
+                    setattr(schedule, field, value)
+                schedule.modified_date = now
+                to_update.append(schedule)
+            # Bulk writes skip save(), so keep next_fire_at current here.
+            schedule.next_fire_at = schedule.get_next_fire_at(now)
+
+        if existing:
+            WorkflowCollectionSubscriptionSchedule.objects.filter(
+                pk__in=[schedule.pk for schedule in existing.values()]
+            ).delete()
+        if to_update:
+            WorkflowCollectionSubscriptionSchedule.objects.bulk_update(
+                to_update,
+                ["time_of_day", "weekly_interval", "next_fire_at", "modified_date"],
+            )
+        if to_create:
+            WorkflowCollectionSubscriptionSchedule.objects.bulk_create(to_create)
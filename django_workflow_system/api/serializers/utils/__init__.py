@@ -2,3 +2,4 @@
 Convenience Import/Export
 """
 from .get_images_helper import get_images_helper
+from .sparse_fields import SparseFieldsMixin, get_sparse_fields
@@ -0,0 +1,86 @@
+from django.db.models import Model, QuerySet, prefetch_related_objects
+from rest_framework.exceptions import ValidationError
+
+
+def get_sparse_fields(request) -> dict:
+    """
+    Read the `fields` and `exclude` query parameters of a request.
+
+    Parameters:
+        request : The request being handled.
+
+    Returns:
+        A dict of keyword arguments for a serializer using SparseFieldsMixin,
+        e.g. {"fields": ["id", "name"]} for `?fields=id,name`.
+    """
+    sparse_fields = {}
+    for param in ("fields", "exclude"):
+        value = request.query_params.get(param)
+        if value:
+            sparse_fields[param] = [
+                name.strip() for name in value.split(",") if name.strip()
+            ]
+    return sparse_fields
+
+
+class SparseFieldsMixin:
+    """
+    Serializer mixin for leaving fields out of a representation.
+
+    Serializers using it accept `fields` and `exclude` keyword arguments,
+    naming the fields to keep and the fields to drop. Fields are removed
+    before anything is serialized, so a dropped SerializerMethodField is
+    never called.
+
+    `prefetch_plan` maps field names to the lookups which should be
+    prefetched for them, so that the number of queries doesn't grow with the
+    number of related objects. They are prefetched when a queryset is
+    serialized with `many=True`, or when a single object is serialized by a
+    serializer which isn't nested in another. Only the lookups of the fields
+    that are kept are prefetched.
+    """
+
+    prefetch_plan = {}
+
+    def __init__(self, *args, fields=None, exclude=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        for param, names in (("fields", fields), ("exclude", exclude)):
+            unknown = [name for name in names or () if name not in self.fields]
+            if unknown:
+                raise ValidationError(
+                    {param: [f"Unknown fields: {', '.join(unknown)}"]}, "invalid"
+                )
+
+        for name in list(self.fields):
+            if (fields is not None and name not in fields) or name in (exclude or ()):
+                self.fields.pop(name)
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_serializer = super().many_init(*args, **kwargs)
+        if isinstance(list_serializer.instance, QuerySet):
+            lookups = list_serializer.child.get_prefetch_lookups()
+            if lookups:
+                list_serializer.instance = list_serializer.instance.prefetch_related(
+                    *lookups
+                )
+        return list_serializer
+
+    def to_representation(self, instance):
+        if self.parent is None and isinstance(instance, Model):
+            lookups = self.get_prefetch_lookups()
+            if lookups:
+                prefetch_related_objects([instance], *lookups)
+        return super().to_representation(instance)
+
+    def get_prefetch_lookups(self) -> list:
+        """
+        Return the lookups to prefetch for the fields being serialized.
+        """
+        lookups = []
+        for name in self.fields:
+            for lookup in self.prefetch_plan.get(name, ()):
+                if lookup not in lookups:
+                    lookups.append(lookup)
+        return lookups
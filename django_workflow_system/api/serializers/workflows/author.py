@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
 from ....models import Workflow, WorkflowAuthor
+from ..utils import SparseFieldsMixin
 
 
 User = get_user_model()
@@ -33,7 +34,7 @@ class WorkflowForeignKeyAuthorSummarySerializer(serializers.ModelSerializer):
         fields = ["name", "detail"]
 
 
-class WorkflowAuthorSummarySerializer(serializers.ModelSerializer):
+class WorkflowAuthorSummarySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Summary level serializer for WorkflowAuthor objects.
     """
@@ -44,12 +45,14 @@ class WorkflowAuthorSummarySerializer(serializers.ModelSerializer):
 
     user = UserTerseSerializer()
 
+    prefetch_plan = {"user": ["user"]}
+
     class Meta:
         model = WorkflowAuthor
         fields = ("id", "user", "detail", "title", "image")
 
 
-class WorkflowAuthorDetailedSerializer(serializers.ModelSerializer):
+class WorkflowAuthorDetailedSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Detailed level serializer for WorkflowAuthor objects.
     """
@@ -58,6 +61,8 @@ class WorkflowAuthorDetailedSerializer(serializers.ModelSerializer):
 
     workflow_set = WorkflowForeignKeyAuthorSummarySerializer(many=True)
 
+    prefetch_plan = {"user": ["user"], "workflow_set": ["workflow_set"]}
+
     self_detail = serializers.HyperlinkedIdentityField(
         view_name="workflow-author", lookup_field="id"
     )
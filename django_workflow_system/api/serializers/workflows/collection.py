@@ -2,13 +2,22 @@ from rest_framework import serializers
 from rest_framework.reverse import reverse
 
 from .author import WorkflowAuthorSummarySerializer
-from .workflow import WorkflowTerseSerializer, ChildWorkflowDetailedSerializer
-from ..utils import get_images_helper
+from .workflow import (
+    ChildWorkflowDetailedSerializer,
+    WorkflowTerseSerializer,
+    get_workflow_prefetch_lookups,
+)
+from ..utils import SparseFieldsMixin, get_images_helper
 from ....models import (
     WorkflowCollectionMember,
     WorkflowCollection,
-    WorkflowCollectionEngagement,
 )
+from ....utils.collection_dependencies import (
+    dependencies_completed,
+    get_completed_collection_ids,
+    get_dependency_graph,
+)
+from ....utils.metadata_hierarchies import get_metadata_hierarchies
 
 
 class WorkflowCollectionMemberSummarySerializer(serializers.ModelSerializer):
@@ -41,9 +50,15 @@ class WorkflowCollectionMemberDetailedSerializer(serializers.ModelSerializer):
         )
 
 
-class WorkflowCollectionBaseSerializer(serializers.ModelSerializer):
+class WorkflowCollectionBaseSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Summary level serializer for WorkflowCollection objects."""
 
+    prefetch_plan = {
+        "authors": ["workflowcollectionmember_set__workflow__author__user"],
+        "images": ["workflowcollectionimage_set__type"],
+        "metadata": ["metadata"],
+    }
+
     authors = serializers.SerializerMethodField()
     metadata = serializers.SerializerMethodField()
     newer_version = serializers.SerializerMethodField()
@@ -103,29 +118,23 @@ class WorkflowCollectionBaseSerializer(serializers.ModelSerializer):
             return None
 
     def get_dependencies_completed(self, instance):
-        """Determine if collection dependencies are fullfilled."""
-        request = self.context.get("request")
-        status = False
-
-        # If there are no dependencies, we just say they are completed.
-        if not instance.collection_dependencies.all():
-            status = True
-
-        else:
-            # Determine if there is at least one complete engagement
-            # for each of the dependencies.
-            dependency_engagement_records = [
-                WorkflowCollectionEngagement.objects.filter(
-                    user=request.user,
-                    workflow_collection=dependency,
-                    finished__isnull=False,
-                )
-                for dependency in instance.collection_dependencies.all()
-            ]
+        """
+        Determine if collection dependencies are fullfilled.
 
-            status = all(dependency_engagement_records)
+        Notes:
+            The requesting user's completed collections are loaded once and
+            kept in the serializer context, and the dependency graph is
+            cached between requests, so serializing a whole catalog costs
+            at most two queries rather than a few per collection.
+        """
+        if "collection_dependencies" not in self.context:
+            self.context["collection_dependencies"] = (
+                get_dependency_graph().dependencies,
+                get_completed_collection_ids(self.context["request"].user),
+            )
+        dependency_map, completed_ids = self.context["collection_dependencies"]
 
-        return status
+        return dependencies_completed(instance.id, dependency_map, completed_ids)
 
 
 class WorkflowCollectionSummarySerializer(WorkflowCollectionBaseSerializer):
@@ -171,6 +180,11 @@ class WorkflowCollectionDetailedSerializer(WorkflowCollectionBaseSerializer):
         view_name="workflow-collection", lookup_field="id"
     )
 
+    prefetch_plan = {
+        **WorkflowCollectionBaseSerializer.prefetch_plan,
+        "workflowcollectionmember_set": ["workflowcollectionmember_set__workflow"],
+    }
+
     class Meta:
         model = WorkflowCollection
         fields = (
@@ -206,6 +220,13 @@ class WorkflowCollectionWithStepsSerializer(WorkflowCollectionBaseSerializer):
         view_name="workflow-collection", lookup_field="id"
     )
 
+    prefetch_plan = {
+        **WorkflowCollectionBaseSerializer.prefetch_plan,
+        "workflowcollectionmember_set": get_workflow_prefetch_lookups(
+            "workflowcollectionmember_set__workflow__", steps=True
+        ),
+    }
+
     class Meta:
         model = WorkflowCollection
         fields = (
@@ -266,8 +287,4 @@ def get_metadata_helper(instance):
     Returns:
         List of Lists of Metadata associated with the Collection
     """
-    metadata_list = []
-    for hierarchy in instance.metadata.all():
-        metadata_list.append(hierarchy.group_hierarchy)
-
-    return metadata_list
+    return get_metadata_hierarchies(instance.metadata.all())
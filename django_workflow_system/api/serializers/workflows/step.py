@@ -9,6 +9,19 @@ from ....models import (
     WorkflowStepVideo,
     WorkflowStepExternalLink,
 )
+from ....utils.response_schemas import get_response_schema
+
+
+# Everything WorkflowStepSerializer reads from other tables, relative to a step.
+STEP_PREFETCH_LOOKUPS = (
+    "ui_template",
+    "workflowstepuserinput_set__type",
+    "workflowsteptext_set",
+    "workflowstepaudio_set",
+    "workflowstepimage_set",
+    "workflowstepvideo_set",
+    "workflowstepexternallink_set",
+)
 
 
 class WorkflowStepTextSerializer(serializers.ModelSerializer):
@@ -32,9 +45,16 @@ class WorkflowStepExternalLinkSerializer(serializers.ModelSerializer):
 
 
 class WorkflowStepUserInputSerializer(serializers.ModelSerializer):
-    """Summary level serializer for WorkflowStepUserInput objects."""
+    """
+    Summary level serializer for WorkflowStepUserInput objects.
+
+    When the serializer context has `include_response_schema` set, each input
+    also includes the JSON schema responses to it are validated against, so
+    that clients can check answers before submitting them.
+    """
 
     type = serializers.SlugRelatedField(slug_field="name", read_only=True)
+    response_schema = serializers.SerializerMethodField()
 
     class Meta:
         model = WorkflowStepUserInput
@@ -45,8 +65,18 @@ class WorkflowStepUserInputSerializer(serializers.ModelSerializer):
             "required",
             "type",
             "specification",
+            "response_schema",
         )
 
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.context.get("include_response_schema"):
+            fields.pop("response_schema")
+        return fields
+
+    def get_response_schema(self, instance):
+        return get_response_schema(instance)
+
 
 class WorkflowStepAudioSerializer(serializers.ModelSerializer):
     """
@@ -1,9 +1,33 @@
 from rest_framework import serializers
 
 from .author import WorkflowAuthorSummarySerializer
-from .step import WorkflowStepSerializer
-from ..utils import get_images_helper
+from .step import STEP_PREFETCH_LOOKUPS, WorkflowStepSerializer
+from ..utils import SparseFieldsMixin, get_images_helper
 from ....models import Workflow
+from ....utils.metadata_hierarchies import get_metadata_hierarchies
+
+
+def get_workflow_prefetch_lookups(prefix="", steps=False) -> list:
+    """
+    Return the lookups a detailed or summary Workflow serializer needs.
+
+    Parameters:
+        prefix (str): The path to the workflows, ending in "__".
+        steps (bool): Whether to include the workflows' steps.
+
+    Returns:
+        list
+    """
+    lookups = [
+        f"{prefix}author__user",
+        f"{prefix}workflowimage_set__type",
+        f"{prefix}metadata",
+    ]
+    if steps:
+        lookups.extend(
+            f"{prefix}workflowstep_set__{lookup}" for lookup in STEP_PREFETCH_LOOKUPS
+        )
+    return lookups
 
 
 class WorkflowTerseSerializer(serializers.ModelSerializer):
@@ -20,7 +44,7 @@ class WorkflowTerseSerializer(serializers.ModelSerializer):
         fields = ("name", "detail")
 
 
-class WorkflowSummarySerializer(serializers.ModelSerializer):
+class WorkflowSummarySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Summary level serializer for Workflow objects.
     """
@@ -33,6 +57,12 @@ class WorkflowSummarySerializer(serializers.ModelSerializer):
     images = serializers.SerializerMethodField()
     metadata = serializers.SerializerMethodField()
 
+    prefetch_plan = {
+        "author": ["author__user"],
+        "images": ["workflowimage_set__type"],
+        "metadata": ["metadata"],
+    }
+
     class Meta:
         model = Workflow
         fields = ("id", "name", "detail", "images", "author", "metadata")
@@ -62,14 +92,10 @@ class WorkflowSummarySerializer(serializers.ModelSerializer):
         Returns:
             List of Lists of Metadata associated with the Collection
         """
-        metadata_list = []
-        for hierarchy in instance.metadata.all():
-            metadata_list.append(hierarchy.group_hierarchy)
-
-        return metadata_list
+        return get_metadata_hierarchies(instance.metadata.all())
 
 
-class WorkflowDetailedSerializer(serializers.ModelSerializer):
+class WorkflowDetailedSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Detailed level serializer for Workflow objects.
     """
@@ -82,6 +108,15 @@ class WorkflowDetailedSerializer(serializers.ModelSerializer):
     images = serializers.SerializerMethodField()
     metadata = serializers.SerializerMethodField()
 
+    prefetch_plan = {
+        "author": ["author__user"],
+        "images": ["workflowimage_set__type"],
+        "workflowstep_set": [
+            f"workflowstep_set__{lookup}" for lookup in STEP_PREFETCH_LOOKUPS
+        ],
+        "metadata": ["metadata"],
+    }
+
     class Meta:
         model = Workflow
         fields = (
@@ -120,11 +155,7 @@ class WorkflowDetailedSerializer(serializers.ModelSerializer):
         Returns:
             List of Lists of Metadata associated with the Collection
         """
-        metadata_list = []
-        for hierarchy in instance.metadata.all():
-            metadata_list.append(hierarchy.group_hierarchy)
-
-        return metadata_list
+        return get_metadata_hierarchies(instance.metadata.all())
 
 
 class ChildWorkflowDetailedSerializer(serializers.ModelSerializer):
@@ -178,8 +209,4 @@ class ChildWorkflowDetailedSerializer(serializers.ModelSerializer):
         Returns:
             List of Lists of Metadata associated with the Collection
         """
-        metadata_list = []
-        for hierarchy in instance.metadata.all():
-            metadata_list.append(hierarchy.group_hierarchy)
-
-        return metadata_list
+        return get_metadata_hierarchies(instance.metadata.all())
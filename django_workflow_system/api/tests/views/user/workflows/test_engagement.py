@@ -1,3 +1,5 @@
+from unittest import mock
+
 import dateutil
 from django.test import TestCase
 
@@ -10,6 +12,9 @@ from django_workflow_system.api.tests.factories import (
     WorkflowCollectionEngagementFactory,
     WorkflowCollectionFactory,
 )
+from django_workflow_system.api.serializers.user.workflows.engagement import (
+    WorkflowCollectionEngagementDetailedSerializer,
+)
 from django_workflow_system.api.views.user.workflows import (
     WorkflowCollectionEngagementView,
 )
@@ -65,6 +70,33 @@ class TestWorkflowCollectionEngagementView(TestCase):
             self.workflow_engagement.started,
         )
 
+    def test_get__sparse_fields(self):
+        """Fields which are left out are not computed."""
+        request = self.factory.get(
+            self.view_url.format(self.workflow_engagement.id), {"exclude": "state"}
+        )
+        request.user = self.user_with_engagement
+        with mock.patch.object(
+            WorkflowCollectionEngagementDetailedSerializer, "get_state"
+        ) as get_state:
+            response = self.view(request, self.workflow_engagement.id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("state", response.data)
+        get_state.assert_not_called()
+
+        # `proceed` is still worked out when the details are left out.
+        request = self.factory.get(
+            self.view_url.format(self.workflow_engagement.id),
+            {"fields": "started,state"},
+        )
+        request.user = self.user_with_engagement
+        response = self.view(request, self.workflow_engagement.id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertListEqual(list(response.data.keys()), ["started", "state"])
+        self.assertTrue(response.data["state"]["proceed"])
+
     def test_patch__unauthenticated_engagement(self):
         """Return 404 error if trying to patch unknown engagement."""
         fake_uuiid = "4f84f799-9cc5-43d3-0000-24840b7eb8ce"
@@ -91,3 +123,28 @@ class TestWorkflowCollectionEngagementView(TestCase):
         response = self.view(request, self.workflow_engagement.id)
 
         self.assertEqual(response.status_code, 200)
+
+    def test_patch__reopen_with_existing_incomplete_engagement(self):
+        """Reopening an engagement while another one is unfinished returns a 400."""
+        finished_engagement = WorkflowCollectionEngagementFactory(
+            user=self.user_with_engagement,
+            workflow_collection=self.workflow_collection,
+            finished=timezone.now(),
+        )
+        request = self.factory.patch(
+            self.view_url.format(finished_engagement.id),
+            data={"finished": None},
+            format="json",
+        )
+        request.user = self.user_with_engagement
+        response = self.view(request, finished_engagement.id)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data["non_field_errors"],
+            [
+                "The user has an existing incomplete engagement for this workflow collection."
+            ],
+        )
+        finished_engagement.refresh_from_db()
+        self.assertIsNotNone(finished_engagement.finished)
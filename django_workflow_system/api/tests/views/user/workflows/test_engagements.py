@@ -1,5 +1,7 @@
 from dateutil.relativedelta import relativedelta
+from django.db import IntegrityError, transaction
 from django.test import TestCase
+from django.utils import timezone
 
 from rest_framework.test import APIRequestFactory
 
@@ -129,6 +131,25 @@ class TestWorkflowCollectionEngagementsView(TestCase):
         response = self.view(request)
 
         self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            response.data["detail"],
+            "The user has an existing incomplete engagement for this workflow collection.",
+        )
+
+    def test_post__only_one_open_engagement_in_database(self):
+        """The database rejects a second unfinished engagement."""
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            WorkflowCollectionEngagementFactory(
+                user=self.user_with_engagement,
+                workflow_collection=self.workflow_collection,
+            )
+
+        # Finished engagements of the same collection are fine.
+        WorkflowCollectionEngagementFactory(
+            user=self.user_with_engagement,
+            workflow_collection=self.workflow_collection,
+            finished=timezone.now(),
+        )
 
     def test_post__finish_before_start(self):
         """
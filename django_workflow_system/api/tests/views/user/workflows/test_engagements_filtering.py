@@ -102,8 +102,9 @@ class TestWorkflowCollectionEngagementsViewFiltering(TestCase):
             user=self.user,
             started=timezone.now(),
         )
+        # A user can only have one open engagement of each collection.
         wce2 = WorkflowCollectionEngagementFactory(
-            workflow_collection=self.workflow_collection,
+            workflow_collection=WorkflowCollectionFactory(),
             user=self.user,
             started=timezone.now() - timedelta(10),
         )
@@ -131,8 +132,9 @@ class TestWorkflowCollectionEngagementsViewFiltering(TestCase):
             user=self.user,
             started=timezone.now() - timedelta(10),
         )
+        # A user can only have one open engagement of each collection.
         wce2 = WorkflowCollectionEngagementFactory(
-            workflow_collection=self.workflow_collection,
+            workflow_collection=WorkflowCollectionFactory(),
             user=self.user,
             started=timezone.now(),
         )
@@ -0,0 +1,143 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from rest_framework.test import APIRequestFactory
+
+from django_workflow_system.api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionAssignmentFactory,
+    WorkflowCollectionEngagementFactory,
+    WorkflowCollectionFactory,
+    WorkflowCollectionRecommendationFactory,
+    WorkflowCollectionSubscriptionFactory,
+)
+from django_workflow_system.api.views.user.workflows import (
+    WorkflowCollectionAssignmentsView,
+    WorkflowCollectionEngagementsView,
+    WorkflowCollectionRecommendationsView,
+    WorkflowCollectionSubscriptionsView,
+    WorkflowHomeView,
+)
+from django_workflow_system.api.views.workflows import WorkflowCollectionsView
+from django_workflow_system.models import (
+    WorkflowCollectionAssignment,
+    WorkflowCollectionDependency,
+)
+
+
+class TestWorkflowHomeView(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.view = WorkflowHomeView.as_view()
+        self.factory = APIRequestFactory()
+        self.url = "/users/self/workflows/home/"
+        self.user = UserFactory()
+
+        self.assigned_v1 = WorkflowCollectionFactory(
+            code="assigned", version=1, active=False
+        )
+        self.assigned_v2 = WorkflowCollectionFactory(code="assigned", version=2)
+        self.subscribed = WorkflowCollectionFactory()
+        self.dependent = WorkflowCollectionFactory()
+        WorkflowCollectionDependency.objects.create(
+            source=self.dependent, target=self.subscribed
+        )
+
+        WorkflowCollectionAssignmentFactory(
+            workflow_collection=self.assigned_v1, user=self.user
+        )
+        WorkflowCollectionSubscriptionFactory(
+            workflow_collection=self.subscribed, user=self.user
+        )
+        WorkflowCollectionEngagementFactory(
+            workflow_collection=self.subscribed, user=self.user
+        )
+        WorkflowCollectionRecommendationFactory(
+            user=self.user,
+            workflow_collection=self.dependent,
+            start=timezone.now() - timedelta(days=1),
+        )
+
+    def get(self, view, query=None):
+        request = self.factory.get(self.url, query)
+        request.user = self.user
+        return view(request)
+
+    def test_get__unauthenticated(self):
+        """Unauthenticated users cannot access GET method."""
+        response = self.view(self.factory.get(self.url))
+        self.assertEqual(response.status_code, 403)
+
+    def test_get__all_sections(self):
+        """Each section matches the response of its own endpoint."""
+        response = self.get(self.view)
+        self.assertEqual(response.status_code, 200)
+
+        for section, view in (
+            ("assignments", WorkflowCollectionAssignmentsView),
+            ("engagements", WorkflowCollectionEngagementsView),
+            ("subscriptions", WorkflowCollectionSubscriptionsView),
+            ("recommendations", WorkflowCollectionRecommendationsView),
+            ("collections", WorkflowCollectionsView),
+        ):
+            with self.subTest(section=section):
+                self.assertEqual(response.data[section], self.get(view.as_view()).data)
+
+        self.assertEqual(
+            {collection["id"] for collection in response.data["collections"]},
+            {
+                str(self.assigned_v1.id),
+                str(self.subscribed.id),
+                str(self.dependent.id),
+            },
+        )
+
+    def test_get__sections(self):
+        """Only the requested sections are returned."""
+        response = self.get(self.view, {"sections": "recommendations,assignments"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data), {"assignments", "recommendations"})
+
+        response = self.get(self.view, {"sections": "assignments,unknown"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("unknown", str(response.data["sections"]))
+
+    def test_get__eligible_only(self):
+        """Collections whose dependencies aren't completed can be left out."""
+        response = self.get(self.view, {"eligible_only": "true"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["collections"],
+            self.get(WorkflowCollectionsView.as_view(), {"eligible_only": "true"}).data,
+        )
+        self.assertNotIn(
+            str(self.dependent.id),
+            {collection["id"] for collection in response.data["collections"]},
+        )
+
+        response = self.get(self.view, {"eligible_only": "maybe"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_get__shared_context(self):
+        """Open assignments are loaded once for all sections."""
+        assignment_table = WorkflowCollectionAssignment._meta.db_table
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(
+                self.view, {"sections": "assignments,subscriptions,collections"}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries
+                    if f'FROM "{assignment_table}"' in query["sql"]
+                ]
+            ),
+            1,
+        )
@@ -11,6 +11,7 @@ from django_workflow_system.api.tests.factories import (
     WorkflowCollectionFactory,
     WorkflowCollectionSubscriptionScheduleFactory,
 )
+from django_workflow_system.models import WorkflowCollectionSubscriptionSchedule
 from django_workflow_system.api.views.user.workflows import (
     WorkflowCollectionSubscriptionsView,
     WorkflowCollectionSubscriptionView,
@@ -133,6 +134,26 @@ class TestWorkflowSubscriptionsView(TestCase):
 
         self.assertEqual(response.status_code, 409)
 
+    def test_post__duplicate_days(self):
+        """Multiple schedules for the same day of the week return 400."""
+        request = self.factory.post(
+            self.view_url,
+            data={
+                "workflow_collection": f"http://testserver/api/workflow_system/collections/{self.workflow_collection.id}/",
+                "active": True,
+                "workflowcollectionsubscriptionschedule_set": [
+                    {"time_of_day": "12:00:00", "day_of_week": 2, "weekly_interval": 1},
+                    {"time_of_day": "13:00:00", "day_of_week": 2, "weekly_interval": 1},
+                ],
+            },
+            format="json",
+        )
+        request.user = self.user_without_subscription
+        response = self.view(request)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("workflowcollectionsubscriptionschedule_set", response.data)
+
 
 class TestWorkflowCollectionSubscriptionView(TestCase):
     def setUp(self):
@@ -256,3 +277,91 @@ class TestWorkflowCollectionSubscriptionView(TestCase):
         response = self.view(request, self.workflow_collection_subscription.id)
 
         self.assertEqual(response.status_code, 400)
+
+    def _put_schedules(self, schedules):
+        request = self.factory.put(
+            f"/users/self/workflows/subscriptions/{self.workflow_collection_subscription.id}",
+            data={
+                "workflow_collection": f"http://testserver/api/workflow_system/collections/{self.workflow_collection.id}/",
+                "active": True,
+                "workflowcollectionsubscriptionschedule_set": schedules,
+            },
+            format="json",
+        )
+        request.user = self.user_with_subscription
+        return self.view(request, self.workflow_collection_subscription.id)
+
+    def test_put__schedules_are_diffed_by_day(self):
+        """Unchanged schedules are kept, others are updated, added or removed."""
+        today = self.workflow_collection_subscription_schedule.day_of_week
+        tomorrow = (today + 1) % 7
+        removed = WorkflowCollectionSubscriptionScheduleFactory(
+            workflow_collection_subscription=self.workflow_collection_subscription,
+            day_of_week=(today + 2) % 7,
+        )
+        unchanged = WorkflowCollectionSubscriptionSchedule.objects.get(
+            pk=self.workflow_collection_subscription_schedule.pk
+        )
+
+        response = self._put_schedules(
+            [
+                {"time_of_day": "12:00:00", "day_of_week": today, "weekly_interval": 1},
+                {
+                    "time_of_day": "08:30:00",
+                    "day_of_week": tomorrow,
+                    "weekly_interval": 2,
+                },
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        schedules = {
+            schedule.day_of_week: schedule
+            for schedule in self.workflow_collection_subscription.workflowcollectionsubscriptionschedule_set.all()
+        }
+        self.assertEqual(set(schedules), {today, tomorrow})
+        self.assertFalse(
+            WorkflowCollectionSubscriptionSchedule.objects.filter(
+                pk=removed.pk
+            ).exists()
+        )
+        # The unchanged schedule was not rewritten.
+        self.assertEqual(schedules[today].pk, unchanged.pk)
+        self.assertEqual(schedules[today].modified_date, unchanged.modified_date)
+        self.assertEqual(schedules[tomorrow].time_of_day, datetime.time(8, 30))
+        self.assertEqual(schedules[tomorrow].weekly_interval, 2)
+        self.assertIsNotNone(schedules[tomorrow].next_fire_at)
+
+        # Changing the existing day updates the row in place.
+        response = self._put_schedules(
+            [{"time_of_day": "09:15:00", "day_of_week": tomorrow}]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        updated = (
+            self.workflow_collection_subscription.workflowcollectionsubscriptionschedule_set.get()
+        )
+        self.assertEqual(updated.pk, schedules[tomorrow].pk)
+        self.assertEqual(updated.time_of_day, datetime.time(9, 15))
+        self.assertEqual(updated.weekly_interval, 1)
+        self.assertEqual(updated.next_fire_at.time(), datetime.time(9, 15))
+
+    def test_put__duplicate_days(self):
+        """Multiple schedules for the same day of the week return 400 and change nothing."""
+        day = self.workflow_collection_subscription_schedule.day_of_week
+        response = self._put_schedules(
+            [
+                {"time_of_day": "12:00:00", "day_of_week": day, "weekly_interval": 1},
+                {"time_of_day": "13:00:00", "day_of_week": day, "weekly_interval": 1},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            list(
+                self.workflow_collection_subscription.workflowcollectionsubscriptionschedule_set.values_list(
+                    "pk", flat=True
+                )
+            ),
+            [self.workflow_collection_subscription_schedule.pk],
+        )
@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.exceptions import ErrorDetail
 
 from rest_framework.test import APIRequestFactory
@@ -75,6 +77,19 @@ class TestWorkflowAuthorsView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, [])
 
+    def test_get__constant_queries(self):
+        """The number of queries doesn't grow with the number of authors."""
+        request = self.factory.get("/workflows/authors/")
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            self.view(request)
+
+        AuthorFactory()
+        AuthorFactory()
+        with self.assertNumQueries(len(queries)):
+            response = self.view(request)
+        self.assertEqual(len(response.data), 4)
+
 
 class TestWorkflowAuthorView(TestCase):
     """Test WorkflowAuthorView class."""
@@ -117,3 +132,16 @@ class TestWorkflowAuthorView(TestCase):
             response.data,
             {"detail": ErrorDetail(string="Not found.", code="not_found")},
         )
+
+    def test_get__constant_queries(self):
+        """The number of queries doesn't grow with the author's workflows."""
+        request = self.factory.get(f"/workflows/authors/{self.author.id}/")
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            self.view(request, self.author.id)
+
+        WorkflowFactory(author=self.author)
+        WorkflowFactory(author=self.author)
+        with self.assertNumQueries(len(queries)):
+            response = self.view(request, self.author.id)
+        self.assertEqual(len(response.data["workflow_set"]), 3)
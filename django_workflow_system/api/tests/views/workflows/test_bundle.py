@@ -0,0 +1,214 @@
+import hashlib
+import io
+import json
+import tempfile
+import zipfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIRequestFactory
+
+from django_workflow_system.api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionFactory,
+    WorkflowFactory,
+    WorkflowStepFactory,
+)
+from django_workflow_system.api.views.workflows import WorkflowCollectionBundleView
+from django_workflow_system.models import WorkflowStepImage
+from django_workflow_system.tests.utils import commit_immediately
+from django_workflow_system.utils.bundles import BUNDLE_LOCATION, CollectionBundle
+
+
+def read_archive(content) -> dict:
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        return {name: json.loads(archive.read(name)) for name in archive.namelist()}
+
+
+class TestWorkflowCollectionBundleView(TestCase):
+    """Test WorkflowCollectionBundleView class."""
+
+    def setUp(self):
+        commit_immediately(self)
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+
+        self.view = WorkflowCollectionBundleView.as_view()
+        self.factory = APIRequestFactory()
+        self.user = UserFactory()
+
+        self.workflow = WorkflowFactory()
+        self.step = WorkflowStepFactory(
+            workflow=self.workflow, workflowstepuserinput_set=[{}]
+        )
+        self.step_image = WorkflowStepImage(
+            workflow_step=self.step, ui_identifier="photo"
+        )
+        self.step_image.url.save("photo.png", ContentFile(b"first photo"))
+        self.workflow_collection = WorkflowCollectionFactory(
+            workflow_set=[self.workflow]
+        )
+        self.url = f"/workflows/collections/{self.workflow_collection.id}/bundle/"
+
+    def get(self, query=None):
+        request = self.factory.get(self.url, query)
+        request.user = self.user
+        return self.view(request, self.workflow_collection.id)
+
+    def test_get__success(self):
+        """The archive holds the collection, its schemas and its media."""
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/zip")
+
+        bundle = read_archive(response.content)
+        content_version = bundle["bundle.json"]["content_version"]
+        self.assertEqual(response["ETag"], f'"{content_version}"')
+        self.assertFalse(bundle["bundle.json"]["delta"])
+        self.assertEqual(
+            bundle["collection.json"]["workflowcollectionmember_set"][0]["workflow"][
+                "id"
+            ],
+            str(self.workflow.id),
+        )
+        self.assertEqual(
+            list(bundle["response_schemas.json"]),
+            [str(self.step.workflowstepuserinput_set.get().id)],
+        )
+        self.assertIn(
+            {
+                "name": self.step_image.url.name,
+                "url": f"http://testserver{self.step_image.url.url}",
+                "sha256": hashlib.sha256(b"first photo").hexdigest(),
+            },
+            bundle["media.json"]["files"],
+        )
+        self.assertEqual(bundle["media.json"]["removed"], [])
+
+        # The archive is stored, and the same bytes are served again.
+        self.assertTrue(
+            default_storage.exists(
+                BUNDLE_LOCATION.format(self.workflow_collection.id, content_version)
+            )
+        )
+        self.assertEqual(self.get().content, response.content)
+
+    def test_get__not_modified(self):
+        """A client with the current content version gets a 304."""
+        etag = self.get()["ETag"]
+
+        response = self.get({"since": etag.strip('"')})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        request = self.factory.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        request.user = self.user
+        response = self.view(request, self.workflow_collection.id)
+        self.assertEqual(response.status_code, 304)
+
+    def test_get__content_version_cached(self):
+        """The bundle isn't built again until its content changes."""
+        response = self.get()
+        etag = response["ETag"]
+
+        with mock.patch.object(
+            CollectionBundle, "build", side_effect=AssertionError
+        ) as build:
+            self.assertEqual(self.get({"since": etag.strip('"')}).status_code, 304)
+            self.assertEqual(self.get().content, response.content)
+        build.assert_not_called()
+
+        self.workflow.name = "Renamed"
+        self.workflow.save()
+        response = self.get({"since": etag.strip('"')})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_get__author_name_changes(self):
+        """Only changes to authors' names outdate the bundle."""
+        etag = self.get()["ETag"]
+        since = {"since": etag.strip('"')}
+
+        self.user.first_name = "Not an author"
+        self.user.save()
+        author = self.workflow.author.user
+        author.email = "author@example.com"
+        author.save()
+        with mock.patch.object(
+            CollectionBundle, "build", side_effect=AssertionError
+        ) as build:
+            self.assertEqual(self.get(since).status_code, 304)
+        build.assert_not_called()
+
+        author.first_name = "Renamed"
+        author.save()
+        response = self.get(since)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_get__stored_once(self):
+        """A request storing an archive another one already stored keeps one copy."""
+        bundle = CollectionBundle.build(
+            self.workflow_collection, self.factory.get(self.url)
+        )
+        with mock.patch(
+            "django_workflow_system.utils.bundles.load_bundle_archive",
+            return_value=None,
+        ):
+            bundle.save()
+            bundle.save()
+        directory = f"workflow_system/bundles/{self.workflow_collection.id}"
+        self.assertEqual(
+            default_storage.listdir(directory)[1],
+            [f"{bundle.content_version}.zip"],
+        )
+
+    def test_get__delta(self):
+        """Only media added or changed since a known version is listed."""
+        previous = read_archive(self.get().content)
+        old_url = f"http://testserver{self.step_image.url.url}"
+
+        self.step_image.url.save("photo.png", ContentFile(b"second photo"))
+        response = self.get({"since": previous["bundle.json"]["content_version"]})
+        self.assertEqual(response.status_code, 200)
+
+        bundle = read_archive(response.content)
+        self.assertTrue(bundle["bundle.json"]["delta"])
+        self.assertNotEqual(
+            bundle["bundle.json"]["content_version"],
+            previous["bundle.json"]["content_version"],
+        )
+        # The author's image isn't stored, so it can't be hashed and is always
+        # listed.
+        self.assertEqual(
+            [
+                entry["name"]
+                for entry in bundle["media.json"]["files"]
+                if entry["sha256"] is not None
+            ],
+            [self.step_image.url.name],
+        )
+        self.assertEqual(bundle["media.json"]["removed"], [old_url])
+
+    def test_get__unknown_since(self):
+        """A version that was never stored gets the full bundle."""
+        for since in ("0" * 64, "../../settings"):
+            with self.subTest(since=since):
+                response = self.get({"since": since})
+                self.assertEqual(response.status_code, 200)
+                self.assertFalse(read_archive(response.content)["bundle.json"]["delta"])
+
+    def test_get__nonexistent_workflow_collection(self):
+        """A nonexistent collection returns a 404."""
+        request = self.factory.get(self.url)
+        request.user = self.user
+        response = self.view(request, "4f84f799-9cc5-43d3-0000-24840b7eb8ce")
+        self.assertEqual(response.status_code, 404)
@@ -1,5 +1,7 @@
 from django.conf import settings
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework.test import APIRequestFactory
 
@@ -153,6 +155,56 @@ class TestWorkflowCollectionsView(TestCase):
         self.assertCountEqual(response.data[1]["images"], [self.image_3_dict])
         self.assertEqual(response.data[1]["metadata"][0][0], "Bacon")
 
+    def test_get__sparse_fields(self):
+        """Fields can be picked with the `fields` and `exclude` parameters."""
+        request = self.factory.get("/workflows/collections/", {"fields": "id,name"})
+        request.user = self.user
+        response = self.view(request)
+
+        self.assertEqual(response.status_code, 200)
+        for result in response.data:
+            self.assertListEqual(list(result.keys()), ["id", "name"])
+
+        request = self.factory.get(
+            "/workflows/collections/", {"exclude": "authors,newer_version"}
+        )
+        request.user = self.user
+        response = self.view(request)
+
+        self.assertEqual(response.status_code, 200)
+        for result in response.data:
+            self.assertNotIn("authors", result)
+            self.assertNotIn("newer_version", result)
+            self.assertIn("images", result)
+
+    def test_get__sparse_fields_unknown(self):
+        """Unknown field names are rejected."""
+        request = self.factory.get("/workflows/collections/", {"fields": "id,wumbo"})
+        request.user = self.user
+        response = self.view(request)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("wumbo", str(response.data["fields"]))
+
+    def test_get__sparse_fields_queries(self):
+        """Fields which are left out cost no queries, and images are prefetched."""
+        WorkflowCollectionFactory()
+
+        request = self.factory.get("/workflows/collections/", {"fields": "id,name"})
+        request.user = self.user
+        with CaptureQueriesContext(connection) as sparse_queries:
+            self.view(request)
+
+        request = self.factory.get("/workflows/collections/", {"fields": "id,images"})
+        request.user = self.user
+        with CaptureQueriesContext(connection) as image_queries:
+            response = self.view(request)
+
+        self.assertEqual(len(image_queries), len(sparse_queries) + 2)
+        self.assertCountEqual(
+            response.data[0]["images"], [self.image_1_dict, self.image_2_dict]
+        )
+
 
 class TestWorkflowCollectionView(TestCase):
     """Test WorkflowCollectionView class."""
@@ -1,5 +1,7 @@
 """Unit test for collection dependency."""
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework.test import APIRequestFactory
 
@@ -125,3 +127,49 @@ class TestWorkflowCollectionsDependencyView(TestCase):
         request.user = self.user
         response = self.view(request)
         self.assertEqual(response.data[4]["dependencies_completed"], False)
+
+    def test_dependencies_completed__constant_queries(self):
+        """Dependency status doesn't cost extra queries per collection."""
+        for _ in range(5):
+            collection = WorkflowCollectionFactory()
+            WorkflowCollectionDependency.objects.create(
+                source=collection, target=self.workflow_collection_1
+            )
+        request = self.factory.get("/workflows/collections/")
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            self.view(request)
+
+        dependency_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "workflow_system_collection_dependency" in query["sql"]
+            or "workflow_system_collection_engagement" in query["sql"]
+        ]
+        self.assertEqual(len(dependency_queries), 2)
+
+    def test_eligible_only(self):
+        """Only collections whose dependencies are met are returned."""
+        request = self.factory.get("/workflows/collections/?eligible_only=true")
+        request.user = self.user
+        response = self.view(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [collection["id"] for collection in response.data],
+            [
+                str(self.workflow_collection_1.id),
+                str(self.workflow_collection_2.id),
+                str(self.workflow_collection_4.id),
+            ],
+        )
+        for collection in response.data:
+            self.assertTrue(collection["dependencies_completed"])
+
+    def test_eligible_only__invalid(self):
+        """Invalid values for eligible_only return a 400."""
+        request = self.factory.get("/workflows/collections/?eligible_only=maybe")
+        request.user = self.user
+        response = self.view(request)
+
+        self.assertEqual(response.status_code, 400)
@@ -1,5 +1,7 @@
 from django.conf import settings
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIRequestFactory
 
 from django_workflow_system.api.tests.factories import (
@@ -18,13 +20,37 @@ from django_workflow_system.api.tests.factories.workflows.workflow_image import
     WorkflowImageFactory,
 )
 from django_workflow_system.api.views.workflows import WorkflowsView, WorkflowView
-from django_workflow_system.models import WorkflowAuthor
+from django_workflow_system.models import WorkflowAuthor, WorkflowStepUserInput
+from django_workflow_system.tests.utils import commit_immediately
+
+
+def add_workflow_content(workflow):
+    """Give a workflow another image, metadata and a step with all content."""
+    metadata = WorkflowMetadataFactory()
+    for _ in range(4):
+        metadata = WorkflowMetadataFactory(parent_group=metadata)
+    workflow.metadata.add(metadata)
+    WorkflowImageFactory(
+        type=WorkflowImageTypeFactory(type="Gallery"),
+        image=settings.MEDIA_ROOT + "/wumbo.jpg",
+        workflow=workflow,
+    )
+    step = WorkflowStepFactory(
+        workflow=workflow,
+        workflowsteptext_set=[{}, {}],
+        workflowstepimage_set=[{}],
+        workflowstepaudio_set=[{}],
+        workflowstepuserinput_set=[{}],
+        workflowstepexternallink_set=[{"link": "https://www.google.com"}],
+    )
+    _WorkflowStepVideoFactory(workflow_step=step)
 
 
 class TestWorkflowsView(TestCase):
     """Test WorkflowsView class."""
 
     def setUp(self):
+        commit_immediately(self)
         self.view = WorkflowsView.as_view()
         self.factory = APIRequestFactory()
         self.workflow = WorkflowFactory()
@@ -118,12 +144,26 @@ class TestWorkflowsView(TestCase):
                 self.assertCountEqual(result["images"], [self.image_3_dict])
                 self.assertEqual(result["metadata"][0][0], "Bacon")
 
+    def test_get__constant_queries(self):
+        """The number of queries doesn't grow with the number of workflows."""
+        request = self.factory.get("/workflows/workflows/")
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            self.view(request)
+
+        add_workflow_content(self.workflow)
+        add_workflow_content(WorkflowFactory())
+        with self.assertNumQueries(len(queries)):
+            response = self.view(request)
+        self.assertEqual(len(response.data), 3)
+
 
 class TestWorkflowView(TestCase):
     """Test WorkflowView class."""
 
     #
     def setUp(self):
+        commit_immediately(self)
         self.view = WorkflowView.as_view()
         self.factory = APIRequestFactory()
 
@@ -206,3 +246,47 @@ class TestWorkflowView(TestCase):
         response = self.view(request, made_up_uuiid)
 
         self.assertEqual(response.status_code, 404)
+
+    def test_get__constant_queries(self):
+        """The number of queries doesn't grow with the number of steps."""
+        add_workflow_content(self.workflow)
+        request = self.factory.get(f"/workflows/workflows/{self.workflow.id}/")
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            self.view(request, self.workflow.id)
+
+        add_workflow_content(self.workflow)
+        add_workflow_content(self.workflow)
+        with self.assertNumQueries(len(queries)):
+            response = self.view(request, self.workflow.id)
+        self.assertEqual(len(response.data["workflowstep_set"]), 4)
+        self.assertEqual(
+            len(response.data["workflowstep_set"][1]["workflowsteptext_set"]), 2
+        )
+
+    def test_get__include_response_schemas(self):
+        """Step inputs include their response schema when asked to."""
+        add_workflow_content(self.workflow)
+        url = f"/workflows/workflows/{self.workflow.id}/"
+
+        request = self.factory.get(url)
+        request.user = self.user
+        response = self.view(request, self.workflow.id)
+        step = response.data["workflowstep_set"][1]
+        step_input = step["workflowstepuserinput_set"][0]
+        self.assertNotIn("response_schema", step_input)
+
+        request = self.factory.get(url, {"include_response_schemas": "true"})
+        request.user = self.user
+        response = self.view(request, self.workflow.id)
+        step = response.data["workflowstep_set"][1]
+        step_input = step["workflowstepuserinput_set"][0]
+        self.assertEqual(
+            step_input["response_schema"],
+            WorkflowStepUserInput.objects.get(id=step_input["id"]).response_schema,
+        )
+
+        request = self.factory.get(url, {"include_response_schemas": "maybe"})
+        request.user = self.user
+        response = self.view(request, self.workflow.id)
+        self.assertEqual(response.status_code, 400)
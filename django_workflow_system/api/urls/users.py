@@ -17,6 +17,11 @@ from ..views.user.workflows import workflow_user_data_api_root
 # Workflow User Endpoints
 user_endpoints = [
     path("", workflow_user_data_api_root, name="workflow-user-data-root"),
+    path(
+        "self/workflows/home/",
+        user.workflows.WorkflowHomeView.as_view(),
+        name="user-workflow-home",
+    ),
     path(
         "self/workflows/engagements/",
         user.workflows.WorkflowCollectionEngagementsView.as_view(),
@@ -25,4 +25,9 @@ workflow_endpoints = [
         workflows.WorkflowCollectionView.as_view(),
         name="workflow-collection",
     ),
+    path(
+        "collections/<uuid:id>/bundle/",
+        workflows.WorkflowCollectionBundleView.as_view(),
+        name="workflow-collection-bundle",
+    ),
 ]
@@ -15,6 +15,7 @@ from .engagement_detail import (
     WorkflowCollectionEngagementDetailsView,
     WorkflowCollectionEngagementDetailView,
 )
+from .home import WorkflowHomeView
 
 from .recommendation import (
     WorkflowCollectionRecommendationsView,
@@ -38,6 +39,7 @@ __all__ = [
     "WorkflowCollectionRecommendationView",
     "WorkflowCollectionSubscriptionsView",
     "WorkflowCollectionSubscriptionView",
+    "WorkflowHomeView",
     "workflow_user_data_api_root",
 ]
 
@@ -61,5 +63,8 @@ def workflow_user_data_api_root(request, format=None):
             "user-workflow-collection-subscriptions": reverse(
                 "user-workflow-collection-subscriptions", request=request, format=format
             ),
+            "user-workflow-home": reverse(
+                "user-workflow-home", request=request, format=format
+            ),
         }
     )
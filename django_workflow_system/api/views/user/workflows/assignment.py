@@ -11,6 +11,7 @@ from .....utils.logging_utils import generate_extra
 from ....serializers.user.workflows.assignment import (
     WorkflowCollectionAssignmentSummarySerializer,
 )
+from ....serializers.utils import get_sparse_fields
 from .....models import WorkflowCollectionAssignment
 
 import logging
@@ -52,7 +53,10 @@ class WorkflowCollectionAssignmentsView(APIView):
         )
 
         serializer = WorkflowCollectionAssignmentSummarySerializer(
-            user_assignments, many=True, context={"request": request}
+            user_assignments,
+            many=True,
+            context={"request": request},
+            **get_sparse_fields(request),
         )
 
         return Response(data=serializer.data)
@@ -117,6 +121,7 @@ class WorkflowCollectionAssignmentView(APIView):
         serializer = WorkflowCollectionAssignmentSummarySerializer(
             self.user_workflow_collection_assignment(request, id),
             context={"request": request},
+            **get_sparse_fields(request),
         )
 
         return Response(data=serializer.data)
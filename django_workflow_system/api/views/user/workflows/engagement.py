@@ -17,6 +17,10 @@ from ....serializers.user.workflows.engagement import (
     WorkflowCollectionEngagementSerializer,
     WorkflowCollectionEngagementAndDetailsSerializer,
 )
+from ....serializers.user.workflows.engagement_detail import (
+    WorkflowCollectionEngagementDetailSerializer,
+)
+from ....serializers.utils import get_sparse_fields
 
 
 logger = logging.getLogger(__name__)
@@ -116,11 +120,17 @@ class WorkflowCollectionEngagementsView(APIView):
 
         if include_details in (True, "True", "true"):
             serializer = WorkflowCollectionEngagementAndDetailsSerializer(
-                engagements, many=True, context={"request": request}
+                engagements,
+                many=True,
+                context={"request": request},
+                **get_sparse_fields(request),
             )
         else:
             serializer = WorkflowCollectionEngagementSerializer(
-                engagements, many=True, context={"request": request}
+                engagements,
+                many=True,
+                context={"request": request},
+                **get_sparse_fields(request),
             )
 
         return Response(data=serializer.data)
@@ -184,36 +194,36 @@ class WorkflowCollectionEngagementsView(APIView):
 
         try:
             serializer.is_valid(raise_exception=True)
+            # Saving fails if the user already has an unfinished engagement.
+            instance: WorkflowCollectionEngagement = serializer.save()
         except ValidationError as e:
             logger.error(
                 "Error validating Workflow Collection Engagement",
                 exc_info=e,
                 extra=generate_extra(
                     request=request,
-                    serializer_errors=serializer.errors,
+                    serializer_errors=e.detail,
                 ),
             )
 
             # Handling if resource is an attempt of a duplicate engagement
             if (
-                "non_field_errors" in serializer.errors
-                and serializer.errors["non_field_errors"][0].code == "unique"
+                "non_field_errors" in e.detail
+                and e.detail["non_field_errors"][0].code == "unique"
             ) or (
-                "non_field_errors" in serializer.errors
-                and serializer.errors["non_field_errors"][0]
+                "non_field_errors" in e.detail
+                and e.detail["non_field_errors"][0]
                 == (
                     "The user has an existing incomplete engagement for this workflow collection."
                 )
             ):
 
                 return Response(
-                    data={"detail": serializer.errors["non_field_errors"][0]},
+                    data={"detail": e.detail["non_field_errors"][0]},
                     status=status.HTTP_409_CONFLICT,
                 )
             raise e
         else:
-            instance: WorkflowCollectionEngagement = serializer.save()
-
             if instance.finished:
                 logger.info(
                     "User '%s' completed workflow collection '%s' version '%d'",
@@ -296,7 +306,9 @@ class WorkflowCollectionEngagementView(APIView):
         )
 
         serializer = WorkflowCollectionEngagementDetailedSerializer(
-            user_engagement, context={"request": request}
+            user_engagement,
+            context={"request": request},
+            **get_sparse_fields(request),
         )
 
         # TODO: This is a bit of a mess. Need to ensure that workflow engagement details
@@ -304,20 +316,27 @@ class WorkflowCollectionEngagementView(APIView):
         # to be consistently accurate.
 
         data = serializer.data
+        if "state" not in data:
+            return Response(data=data)
         data["state"] = serializer.data["state"]
 
+        details = data.get("workflowcollectionengagementdetail_set")
+        if details is None:
+            # The details were left out of the response, but `proceed` is
+            # worked out from the latest one.
+            details = WorkflowCollectionEngagementDetailSerializer(
+                user_engagement.workflowcollectionengagementdetail_set.all(),
+                many=True,
+                context={"request": request},
+            ).data
+
         if (
-            data["workflowcollectionengagementdetail_set"]
-            and data["workflowcollectionengagementdetail_set"][-1]["user_responses"]
-            and "inputs"
-            in data["workflowcollectionengagementdetail_set"][-1]["user_responses"][
-                -1
-            ].keys()
+            details
+            and details[-1]["user_responses"]
+            and "inputs" in details[-1]["user_responses"][-1].keys()
         ):
 
-            user_inputs = data["workflowcollectionengagementdetail_set"][-1][
-                "user_responses"
-            ][-1]["inputs"]
+            user_inputs = details[-1]["user_responses"][-1]["inputs"]
 
             print("Something to evaluate")
 
@@ -405,6 +424,7 @@ class WorkflowCollectionEngagementView(APIView):
 
         try:
             serializer.is_valid(raise_exception=True)
+            instance: WorkflowCollectionEngagement = serializer.save()
         except ValidationError as e:
             logger.error(
                 "Error validating Workflow Collection Engagement",
@@ -412,12 +432,11 @@ class WorkflowCollectionEngagementView(APIView):
                 extra=generate_extra(
                     request=request,
                     workflow_collection_engagement=user_engagement,
-                    serializer_errors=serializer.errors,
+                    serializer_errors=e.detail,
                 ),
             )
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
         else:
-            instance: WorkflowCollectionEngagement = serializer.save()
             if instance.finished and originally_unfinished:
                 logger.info(
                     "User '%s' completed workflow collection '%s' version '%d'",
@@ -16,6 +16,7 @@ from ....serializers.user.workflows.engagement import (
 from ....serializers.user.workflows.engagement_detail import (
     WorkflowCollectionEngagementDetailSerializer,
 )
+from ....serializers.utils import get_sparse_fields
 from .....utils.logging_utils import generate_extra
 
 
@@ -64,7 +65,10 @@ class WorkflowCollectionEngagementDetailsView(APIView):
         )
 
         serializer = WorkflowCollectionEngagementDetailSerializer(
-            engagement_details, context={"request": request}, many=True
+            engagement_details,
+            context={"request": request},
+            many=True,
+            **get_sparse_fields(request),
         )
 
         return Response(data=serializer.data)
@@ -256,7 +260,9 @@ class WorkflowCollectionEngagementDetailView(APIView):
         )
 
         serializer = WorkflowCollectionEngagementDetailSerializer(
-            engagement_detail, context={"request": request}
+            engagement_detail,
+            context={"request": request},
+            **get_sparse_fields(request),
         )
 
         return Response(data=serializer.data)
@@ -0,0 +1,202 @@
+"""DRF View Definition."""
+from functools import cached_property
+
+from django.db.models import Q
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .....models import (
+    WorkflowCollectionAssignment,
+    WorkflowCollectionEngagement,
+    WorkflowCollectionSubscription,
+)
+from .....utils.collection_dependencies import (
+    dependencies_completed,
+    get_completed_collection_ids,
+    get_dependency_graph,
+)
+from .....utils.recommendations import get_active_recommendations
+from ....serializers.user.workflows.assignment import (
+    WorkflowCollectionAssignmentSummarySerializer,
+)
+from ....serializers.user.workflows.engagement import (
+    WorkflowCollectionEngagementSerializer,
+)
+from ....serializers.user.workflows.recommendation import (
+    WorkflowCollectionRecommendationSerializer,
+)
+from ....serializers.user.workflows.subscription import (
+    WorkflowCollectionSubscriptionSummarySerializer,
+)
+from ....serializers.workflows.collection import WorkflowCollectionSummarySerializer
+from ...workflows.collection import get_user_collections
+
+
+class HomeContext:
+    """
+    The user data shared by the sections of the home feed.
+
+    Each value is loaded the first time a section needs it, and only once
+    per request however many sections use it.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.user = request.user
+
+    @cached_property
+    def completed_collection_ids(self) -> set:
+        return get_completed_collection_ids(self.user)
+
+    @cached_property
+    def open_assignments(self) -> list:
+        return list(
+            WorkflowCollectionAssignment.objects.filter(
+                user=self.user,
+                status__in=(
+                    WorkflowCollectionAssignment.ASSIGNED,
+                    WorkflowCollectionAssignment.IN_PROGRESS,
+                ),
+            )
+        )
+
+    @cached_property
+    def subscriptions(self) -> list:
+        return list(WorkflowCollectionSubscription.objects.filter(user=self.user))
+
+    @property
+    def active_subscriptions(self) -> list:
+        return [
+            subscription for subscription in self.subscriptions if subscription.active
+        ]
+
+    def serializer_context(self) -> dict:
+        return {"request": self.request}
+
+
+class WorkflowHomeView(APIView):
+    """
+    **Supported HTTP Methods**
+
+    * Get: Retrieve the user's assignments, open engagements, subscriptions,
+    recommendations and the workflow collection catalog in one request.
+    """
+
+    required_scopes = ["read"]
+
+    SECTIONS = (
+        "assignments",
+        "engagements",
+        "subscriptions",
+        "recommendations",
+        "collections",
+    )
+
+    def get(self, request):
+        """
+        Retrieve the data an app's home screen needs for the current user.
+
+        Each section holds the same representation as its own endpoint:
+        `assignments`, `engagements` (open engagements only), `subscriptions`,
+        `recommendations` (active recommendations only) and `collections`.
+
+        Query Parameters:
+            sections (str): Comma separated names of the sections to include.
+                            Defaults to every section.
+            eligible_only (str): "True", "true", "False", or "false", indicating whether
+                                 or not to leave out collections whose dependencies the
+                                 user has not completed yet. Defaults to false.
+
+        Returns:
+            A JSON object with one list per requested section.
+            {
+                "assignments": [...],
+                "engagements": [...],
+                "subscriptions": [...],
+                "recommendations": [...],
+                "collections": [...]
+            }
+        """
+        sections = request.query_params.get("sections")
+        if sections:
+            sections = [section.strip() for section in sections.split(",")]
+            unknown = [section for section in sections if section not in self.SECTIONS]
+            if unknown:
+                raise ValidationError(
+                    {"sections": [f"Unknown sections: {', '.join(unknown)}"]},
+                    "invalid",
+                )
+        else:
+            sections = self.SECTIONS
+
+        eligible_only = request.query_params.get("eligible_only", "False")
+        if eligible_only not in ("True", "true", "False", "false"):
+            raise ValidationError(
+                f"Invalid value for eligible_only: {eligible_only}", "invalid"
+            )
+        self.eligible_only = eligible_only in ("True", "true")
+
+        home = HomeContext(request)
+        return Response(
+            {
+                section: getattr(self, f"get_{section}")(home)
+                for section in self.SECTIONS
+                if section in sections
+            }
+        )
+
+    def get_assignments(self, home):
+        return WorkflowCollectionAssignmentSummarySerializer(
+            home.open_assignments, many=True, context=home.serializer_context()
+        ).data
+
+    def get_engagements(self, home):
+        return WorkflowCollectionEngagementSerializer(
+            WorkflowCollectionEngagement.objects.filter(user=home.user, finished=None),
+            many=True,
+            context=home.serializer_context(),
+        ).data
+
+    def get_subscriptions(self, home):
+        return WorkflowCollectionSubscriptionSummarySerializer(
+            home.subscriptions, many=True, context=home.serializer_context()
+        ).data
+
+    def get_recommendations(self, home):
+        return WorkflowCollectionRecommendationSerializer(
+            get_active_recommendations(home.user),
+            many=True,
+            context=home.serializer_context(),
+        ).data
+
+    def get_collections(self, home):
+        # The open assignments and active subscriptions are already loaded, so
+        # the collections they connect the user to are selected by id.
+        connected_ids = {
+            connection.workflow_collection_id
+            for connection in home.open_assignments + home.active_subscriptions
+        }
+        collections = get_user_collections(home.user, Q(id__in=connected_ids))
+
+        # Eligibility and each collection's `dependencies_completed` are both
+        # worked out from the user's completed collections, loaded once.
+        dependency_map = get_dependency_graph().dependencies
+        if self.eligible_only:
+            collections = [
+                collection
+                for collection in collections
+                if dependencies_completed(
+                    collection.id, dependency_map, home.completed_collection_ids
+                )
+            ]
+
+        context = home.serializer_context()
+        context["collection_dependencies"] = (
+            dependency_map,
+            home.completed_collection_ids,
+        )
+        return WorkflowCollectionSummarySerializer(
+            collections, many=True, context=context
+        ).data
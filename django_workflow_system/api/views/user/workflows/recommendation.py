@@ -1,9 +1,7 @@
 """DRF View Definition."""
 import logging
 
-from django.db.models import Q
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
@@ -13,7 +11,9 @@ from .....models import WorkflowCollectionRecommendation
 from ....serializers.user.workflows.recommendation import (
     WorkflowCollectionRecommendationSerializer,
 )
+from ....serializers.utils import get_sparse_fields
 from .....utils.logging_utils import generate_extra
+from .....utils.recommendations import get_active_recommendations
 
 logger = logging.getLogger(__name__)
 
@@ -47,14 +47,10 @@ class WorkflowCollectionRecommendationsView(APIView):
         ]
         """
         serializer = WorkflowCollectionRecommendationSerializer(
-            WorkflowCollectionRecommendation.objects.filter(
-                start__lte=timezone.now()
-            ).filter(
-                Q(end__isnull=True) or Q(end__gt=timezone.now()),
-                user=request.user,
-            ),
+            get_active_recommendations(request.user),
             many=True,
             context={"request": request},
+            **get_sparse_fields(request),
         )
         return Response(serializer.data)
 
@@ -143,6 +139,7 @@ class WorkflowCollectionRecommendationView(APIView):
         serializer = WorkflowCollectionRecommendationSerializer(
             workflow_collection_recommendation,
             context={"request": request},
+            **get_sparse_fields(request),
         )
 
         return Response(data=serializer.data)
@@ -13,6 +13,7 @@ from .....utils.logging_utils import generate_extra
 from ....serializers.user.workflows.subscription import (
     WorkflowCollectionSubscriptionSummarySerializer,
 )
+from ....serializers.utils import get_sparse_fields
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,7 @@ class WorkflowCollectionSubscriptionsView(APIView):
             WorkflowCollectionSubscription.objects.filter(user=request.user),
             many=True,
             context={"request": request},
+            **get_sparse_fields(request),
         )
 
         return Response(data=serializer.data)
@@ -211,7 +213,9 @@ class WorkflowCollectionSubscriptionView(APIView):
         )
 
         serializer = WorkflowCollectionSubscriptionSummarySerializer(
-            workflow_collection_subscription, context={"request": request}
+            workflow_collection_subscription,
+            context={"request": request},
+            **get_sparse_fields(request),
         )
 
         return Response(data=serializer.data)
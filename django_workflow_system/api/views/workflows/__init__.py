@@ -1,4 +1,5 @@
 from ..workflows.author import WorkflowAuthorsView, WorkflowAuthorView
+from ..workflows.bundle import WorkflowCollectionBundleView
 from ..workflows.collection import WorkflowCollectionsView, WorkflowCollectionView
 from ..workflows.workflow import WorkflowsView, WorkflowView
 
@@ -9,4 +10,5 @@ __all__ = [
     "WorkflowView",
     "WorkflowCollectionsView",
     "WorkflowCollectionView",
+    "WorkflowCollectionBundleView",
 ]
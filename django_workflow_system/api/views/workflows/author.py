@@ -7,6 +7,7 @@ from ...serializers.workflows.author import (
     WorkflowAuthorSummarySerializer,
     WorkflowAuthorDetailedSerializer,
 )
+from ...serializers.utils import get_sparse_fields
 from ....models import WorkflowAuthor
 
 
@@ -39,7 +40,10 @@ class WorkflowAuthorsView(APIView):
             ]
         """
         serializer = WorkflowAuthorSummarySerializer(
-            WorkflowAuthor.objects.all(), many=True, context={"request": request}
+            WorkflowAuthor.objects.all(),
+            many=True,
+            context={"request": request},
+            **get_sparse_fields(request),
         )
         return Response(serializer.data)
 
@@ -91,6 +95,6 @@ class WorkflowAuthorView(APIView):
         """
         author = get_object_or_404(WorkflowAuthor, id=id)
         serializer = WorkflowAuthorDetailedSerializer(
-            author, context={"request": request}
+            author, context={"request": request}, **get_sparse_fields(request)
         )
         return Response(serializer.data)
@@ -0,0 +1,99 @@
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+
+from rest_framework.views import APIView
+
+from ....models import WorkflowCollection
+from ....utils.bundles import (
+    CollectionBundle,
+    get_content_version,
+    load_bundle_archive,
+    load_bundle_media,
+    set_content_version,
+)
+
+
+class WorkflowCollectionBundleView(APIView):
+    """
+    **Supported HTTP Methods**
+
+    * Get: Download a Workflow Collection's content for offline use.
+    """
+
+    required_scopes = ["read"]
+
+    def get(self, request, id):
+        """
+        Retrieves a zip archive of a Workflow Collection and everything in it.
+
+        The archive holds:
+            bundle.json: The collection's id, code and version, and the
+                         `content_version` of the bundle, which changes whenever
+                         any of the collection's content does.
+            collection.json: The collection, as returned by the collection
+                             endpoint with `include_steps`.
+            response_schemas.json: Step input ids mapped to the JSON schema
+                                   responses to them are validated against.
+            media.json: The media `files` the collection uses, each with its
+                        `url` and `sha256`, and the URLs of `removed` files.
+
+        The `content_version` is also returned as the response's ETag. It is
+        remembered between requests, so the collection is only gathered again
+        once its content changed, or to build a delta.
+
+        Path Parameters:
+            id (str): id of Workflow Collection
+
+        Query Parameters:
+            since (str): The `content_version` of a bundle the client already
+                         has. If it is still current, a 304 response is
+                         returned. Otherwise, if it is known, media.json only
+                         lists the files which were added or changed since,
+                         along with those removed. Can also be sent as an
+                         If-None-Match header.
+
+        Raises
+            drf_exceptions.NotFound
+                When no Workflow Collection resources exists for the given 'id'.
+
+                404: Not Found
+                {
+                    "detail": "No Workflow Collection with id: 19ce5c1b-0f4e-430a-b3e8-b2a5dbb2a462."
+                }
+        """
+        since = request.query_params.get("since") or request.headers.get(
+            "If-None-Match", ""
+        ).strip('"')
+
+        workflow_collection = get_object_or_404(WorkflowCollection, id=id)
+        content_version = get_content_version(workflow_collection, request)
+        content = None
+
+        if since != content_version:
+            previous_media = (
+                load_bundle_media(workflow_collection.id, since) if since else None
+            )
+            if previous_media is None and content_version is not None:
+                content = load_bundle_archive(workflow_collection.id, content_version)
+            if content is None:
+                bundle = CollectionBundle.build(workflow_collection, request)
+                set_content_version(bundle, request)
+                content_version = bundle.content_version
+                if since != content_version:
+                    content = (
+                        bundle.save()
+                        if previous_media is None
+                        else bundle.archive(previous_media=previous_media)
+                    )
+
+        if content is None:
+            response = HttpResponse(status=304)
+        else:
+            response = HttpResponse(content, content_type="application/zip")
+            response["Content-Disposition"] = (
+                f'attachment; filename="{workflow_collection.code}'
+                f'-v{workflow_collection.version}.zip"'
+            )
+
+        response["ETag"] = f'"{content_version}"'
+        return response
@@ -1,6 +1,5 @@
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
 
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
@@ -13,11 +12,45 @@ from ...serializers.workflows.collection import (
     WorkflowCollectionDetailedSerializer,
     WorkflowCollectionWithStepsSerializer,
 )
+from ...serializers.utils import get_sparse_fields
 from ....models import (
     WorkflowCollection,
     WorkflowCollectionAssignment,
     WorkflowCollectionSubscription,
 )
+from ....utils.collection_dependencies import filter_eligible_collections
+
+
+def get_user_collections(user, connected, eligible_only=False):
+    """
+    Select the collections a user should see in the catalog.
+
+    That is every collection the user is still connected to, whatever its
+    version, plus the newest version of every other collection.
+
+    Parameters:
+        user (User): The requesting user.
+        connected (Q): Selects the collections the user is connected to, e.g.
+                       through an open assignment or an active subscription.
+        eligible_only (bool): Whether to leave out collections whose
+                              dependencies the user has not completed yet.
+
+    Returns:
+        QuerySet
+    """
+    old_bois = WorkflowCollection.objects.filter(connected)
+
+    # add to old_bois all the newer workflow collections which are not newer
+    # versions of any of the old bois
+    old_names = {boi.code for boi in old_bois}
+    new_bois = WorkflowCollection.objects.filter(active=True).exclude(
+        code__in=old_names
+    )
+
+    all_bois = (old_bois | new_bois).distinct()
+    if eligible_only:
+        all_bois = filter_eligible_collections(all_bois, user)
+    return all_bois
 
 
 class WorkflowCollectionsView(APIView):
@@ -40,6 +73,11 @@ class WorkflowCollectionsView(APIView):
         of that workflow. It also returns deactivated versions for which the user is
         still "connected".
 
+        Query Parameters:
+            eligible_only (str): "True", "true", "False", or "false", indicating whether or not
+                                 to leave out collections whose dependencies the user has not
+                                 completed yet. Defaults to false.
+
         Returns:
             A JSON object representation of all Active Workflow Collections.
             [
@@ -92,9 +130,18 @@ class WorkflowCollectionsView(APIView):
             return Response(
                 data={"error": "Must be logged in."}, status=status.HTTP_400_BAD_REQUEST
             )
-        now = timezone.now()
 
-        # these three queries are used to determine which OLD versions the user should see.
+        eligible_only = request.query_params.get("eligible_only", "False")
+        if eligible_only in ("True", "true"):
+            eligible_only = True
+        elif eligible_only in ("False", "false"):
+            eligible_only = False
+        else:
+            raise ValidationError(
+                f"Invalid value for eligible_only: {eligible_only}", "invalid"
+            )
+
+        # these two queries are used to determine which OLD versions the user should see.
 
         open_assignments = WorkflowCollectionAssignment.objects.filter(
             user=user,
@@ -108,22 +155,18 @@ class WorkflowCollectionsView(APIView):
             active=True,
         )
 
-        old_bois = WorkflowCollection.objects.filter(
+        all_bois = get_user_collections(
+            user,
             Q(workflowcollectionassignment__in=open_assignments)
-            | Q(workflowcollectionsubscription__in=open_subscriptions)
+            | Q(workflowcollectionsubscription__in=open_subscriptions),
+            eligible_only,
         )
 
-        # add to old_bois all the newer workflow collections which are not newer
-        # versions of any of the old bois
-        old_names = {boi.code for boi in old_bois}
-        new_bois = WorkflowCollection.objects.filter(active=True).exclude(
-            code__in=old_names
-        )
-
-        all_bois = (old_bois | new_bois).distinct()
-
         serializer = WorkflowCollectionSummarySerializer(
-            all_bois, many=True, context={"request": request}
+            all_bois,
+            many=True,
+            context={"request": request},
+            **get_sparse_fields(request),
         )
         return Response(serializer.data)
 
@@ -148,6 +191,10 @@ class WorkflowCollectionView(APIView):
         Query Parameters:
             include_steps (str): "True", "true", "False", or "false", indicating whether or not to
                                  include workflow steps. Defaults to false.
+            include_response_schemas (str): "True", "true", "False", or "false",
+                                            indicating whether or not to include the
+                                            response schema of each step input, when
+                                            steps are included. Defaults to false.
 
         Returns:
             A JSON object representation of a Active Workflow Collection resources.
@@ -223,13 +270,34 @@ class WorkflowCollectionView(APIView):
                 f"Invalid value for include_steps: {include_steps}", "invalid"
             )
 
+        include_response_schemas = request.query_params.get(
+            "include_response_schemas", "False"
+        )
+        if include_response_schemas in ("True", "true"):
+            include_response_schemas = True
+        elif include_response_schemas in ("False", "false"):
+            include_response_schemas = False
+        else:
+            raise ValidationError(
+                "Invalid value for include_response_schemas: "
+                f"{include_response_schemas}",
+                "invalid",
+            )
+
         workflow_collection = get_object_or_404(WorkflowCollection, id=id)
         if include_steps:
             serializer = WorkflowCollectionWithStepsSerializer(
-                workflow_collection, context={"request": request}
+                workflow_collection,
+                context={
+                    "request": request,
+                    "include_response_schema": include_response_schemas,
+                },
+                **get_sparse_fields(request),
             )
         else:
             serializer = WorkflowCollectionDetailedSerializer(
-                workflow_collection, context={"request": request}
+                workflow_collection,
+                context={"request": request},
+                **get_sparse_fields(request),
             )
         return Response(serializer.data)
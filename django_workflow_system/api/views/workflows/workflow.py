@@ -1,5 +1,6 @@
 from django.shortcuts import get_object_or_404
 
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -7,6 +8,7 @@ from ...serializers.workflows.workflow import (
     WorkflowSummarySerializer,
     WorkflowDetailedSerializer,
 )
+from ...serializers.utils import get_sparse_fields
 from ....models import Workflow
 
 
@@ -58,7 +60,10 @@ class WorkflowsView(APIView):
         workflows = Workflow.objects.all()
 
         serializer = WorkflowSummarySerializer(
-            workflows, many=True, context={"request": request}
+            workflows,
+            many=True,
+            context={"request": request},
+            **get_sparse_fields(request),
         )
         return Response(serializer.data)
 
@@ -85,6 +90,12 @@ class WorkflowView(APIView):
         Parameters:
             id (str): id of Workflow
 
+        Query Parameters:
+            include_response_schemas (str): "True", "true", "False", or "false",
+                                            indicating whether or not to include the
+                                            response schema of each step input.
+                                            Defaults to false.
+
         Returns:
             A JSON object representation of the Workflow resource.
             {
@@ -140,6 +151,27 @@ class WorkflowView(APIView):
                     "detail": "No Workflow with id: f06d37eb-da06-4b74-b7e5-3058e6c6e3ce."
                 }
         """
+        include_response_schemas = request.query_params.get(
+            "include_response_schemas", "False"
+        )
+        if include_response_schemas in ("True", "true"):
+            include_response_schemas = True
+        elif include_response_schemas in ("False", "false"):
+            include_response_schemas = False
+        else:
+            raise ValidationError(
+                "Invalid value for include_response_schemas: "
+                f"{include_response_schemas}",
+                "invalid",
+            )
+
         workflow = get_object_or_404(Workflow, id=id)
-        serializer = WorkflowDetailedSerializer(workflow, context={"request": request})
+        serializer = WorkflowDetailedSerializer(
+            workflow,
+            context={
+                "request": request,
+                "include_response_schema": include_response_schemas,
+            },
+            **get_sparse_fields(request),
+        )
         return Response(serializer.data)
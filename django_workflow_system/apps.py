@@ -6,6 +6,15 @@ class DjangoWorkflowSystemConfig(AppConfig):
     name = "django_workflow_system"
 
     def ready(self):
+        # Connects the signal handlers that keep the dependency graph, metadata
+        # tree, bundle content version and active recommendation caches current.
+        from .utils import (  # noqa: F401
+            bundles,
+            collection_dependencies,
+            metadata_hierarchies,
+            recommendations,
+        )
+
         warning = (
             "Warning: Some Django Rest Framework settings have not been set. We recommend "
             "setting them to avoid any unwanted security gaps. For more information see "
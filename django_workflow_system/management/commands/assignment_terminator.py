@@ -1,12 +1,65 @@
+import logging
+import time
 from datetime import timedelta
 
 from django.core.management import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 
 from ...models import (
     WorkflowCollectionAssignment,
     WorkflowCollectionEngagement,
 )
+from ...utils.logging_utils import generate_extra
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def update_in_batches(queryset, batch_size, **updates):
+    """
+    Apply `updates` to every row of `queryset` in primary key ordered batches.
+
+    Each batch is claimed with SELECT ... FOR UPDATE SKIP LOCKED inside its own
+    transaction, so several copies of the command running at the same time
+    divide the rows between them instead of blocking on (or re-updating) the
+    same ones. On backends without row locking (e.g. SQLite) the lock is a no-op.
+
+    The updates must move a row out of `queryset`, otherwise the loop would keep
+    claiming the same batch.
+
+    Parameters:
+        queryset (QuerySet): The rows to update.
+        batch_size (int): How many rows to claim per transaction.
+        updates: Field values passed to `QuerySet.update()`.
+
+    Returns:
+        dict: The number of rows updated, the number of batches, and the
+              elapsed time in seconds.
+    """
+    model = queryset.model
+    updated = 0
+    batches = 0
+    started = time.monotonic()
+
+    while True:
+        with transaction.atomic():
+            batch = list(
+                queryset.select_for_update(skip_locked=True, of=("self",))
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+            updated += model.objects.filter(pk__in=batch).update(**updates)
+            batches += 1
+
+    return {
+        "count": updated,
+        "batches": batches,
+        "seconds": round(time.monotonic() - started, 3),
+    }
 
 
 class Command(BaseCommand):
@@ -29,6 +82,13 @@ class Command(BaseCommand):
             required=True,
             help='Which type of Assignments to terminate. Options are ["SURVEY", "ACTIVITY"]. For both types, input "survey,activity"',
         )
+        parser.add_argument(
+            "-b",
+            "--batch_size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"How many rows to update per transaction. Defaults to {DEFAULT_BATCH_SIZE}.",
+        )
 
     def handle(self, *args, **options):
         """
@@ -42,6 +102,10 @@ class Command(BaseCommand):
 
         Finally, this adds an end date for workflow collection engagements which are from
         assignments which have been closed incomplete
+
+        Every job is run as a series of set-based batch updates (see
+        `update_in_batches`), so it is safe to run the command from several
+        nodes at once.
         """
         if options["type"]:
             list_of_types = ["SURVEY", "ACTIVITY"]
@@ -62,65 +126,80 @@ class Command(BaseCommand):
                 print(f"{options['days_old']} is not an integer.")
                 return
 
-        print("Starting Assignment Terminator. Hasta la vista, Baby!", file=self.stdout)
-        # Mark any in progress assignments with finished engagements as complete
-        assignments_marked_complete = WorkflowCollectionAssignment.objects.filter(
-            workflow_collection__category__in=assignment_types,
-            status=WorkflowCollectionAssignment.IN_PROGRESS,
-            engagement__finished__isnull=False,
-        )
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            print(f"{batch_size} is not a valid batch size.")
+            return
 
-        for assignment in assignments_marked_complete:
-            print(
-                f"Assignment Terminator marked assignment of collection {assignment.workflow_collection.code} to user {assignment.user} as CLOSED_COMPLETE"
-            )
+        print("Starting Assignment Terminator. Hasta la vista, Baby!", file=self.stdout)
+        now = timezone.now()
 
-        assignments_marked_complete_count = assignments_marked_complete.update(
-            status=WorkflowCollectionAssignment.CLOSED_COMPLETE
+        # Mark any in progress assignments with finished engagements as complete
+        assignments_marked_complete = update_in_batches(
+            WorkflowCollectionAssignment.objects.filter(
+                workflow_collection__category__in=assignment_types,
+                status=WorkflowCollectionAssignment.IN_PROGRESS,
+                engagement__finished__isnull=False,
+            ),
+            batch_size,
+            status=WorkflowCollectionAssignment.CLOSED_COMPLETE,
         )
 
         # Mark any in progress assignments with unfinished engagements as incomplete
-        assignments_marked_incomplete = WorkflowCollectionAssignment.objects.filter(
-            workflow_collection__category__in=assignment_types,
-            start__lte=timezone.now() - timedelta(days=days_old),
-        ).exclude(
-            status__in=(
-                WorkflowCollectionAssignment.CLOSED_COMPLETE,
-                WorkflowCollectionAssignment.CLOSED_INCOMPLETE,
-            )
-        )
-        for assignment in assignments_marked_incomplete:
-            print(
-                f"Assignment Terminator marked assignment of collection {assignment.workflow_collection.code} to user{assignment.user} as CLOSED_INCOMPLETE "
-            )
-        assignments_marked_incomplete_count = assignments_marked_incomplete.update(
-            status=WorkflowCollectionAssignment.CLOSED_INCOMPLETE
+        assignments_marked_incomplete = update_in_batches(
+            WorkflowCollectionAssignment.objects.filter(
+                workflow_collection__category__in=assignment_types,
+                start__lte=now - timedelta(days=days_old),
+                status__in=(
+                    WorkflowCollectionAssignment.ASSIGNED,
+                    WorkflowCollectionAssignment.IN_PROGRESS,
+                ),
+            ),
+            batch_size,
+            status=WorkflowCollectionAssignment.CLOSED_INCOMPLETE,
         )
 
         # Marks any lingering engagements as finished
-        engagements_marked_finished = WorkflowCollectionEngagement.objects.filter(
-            finished__isnull=True,
-            workflowcollectionassignment__status=WorkflowCollectionAssignment.CLOSED_INCOMPLETE,
+        engagements_marked_finished = update_in_batches(
+            WorkflowCollectionEngagement.objects.filter(
+                finished__isnull=True,
+                workflowcollectionassignment__status=WorkflowCollectionAssignment.CLOSED_INCOMPLETE,
+            ),
+            batch_size,
+            finished=now,
         )
-        for engagement in engagements_marked_finished:
+
+        print("Finished Assignment Terminator.", file=self.stdout)
+        for label, result in (
+            (
+                "WorkflowCollectionAssignments changed to CLOSED_INCOMPLETE",
+                assignments_marked_incomplete,
+            ),
+            (
+                "WorkflowCollectionAssignments changed to CLOSED_COMPLETE",
+                assignments_marked_complete,
+            ),
+            (
+                "WorkflowCollectionEngagements changed to finished",
+                engagements_marked_finished,
+            ),
+        ):
             print(
-                f"Assignment Terminator marked engagement of collection {engagement.workflow_collection.code} to user{engagement.user} as finished. "
+                f"{result['count']} {label} "
+                f"({result['batches']} batches, {result['seconds']}s).",
+                file=self.stdout,
             )
-        engagements_marked_finished_count = engagements_marked_finished.update(
-            finished=timezone.now()
-        )
 
-        print("Finished Assignment Terminator.", file=self.stdout)
-        print(
-            f"{assignments_marked_incomplete_count} WorkflowCollectionAssignments changed to CLOSED_INCOMPLETE.",
-            file=self.stdout,
-        )
-        print(
-            f"{assignments_marked_complete_count} WorkflowCollectionAssignments changed to CLOSED_COMPLETE.",
-            file=self.stdout,
-        )
-        print(
-            f"{engagements_marked_finished_count} WorkflowCollectionEngagements changed to finished.",
-            file=self.stdout,
+        logger.info(
+            "Assignment Terminator finished",
+            extra=generate_extra(
+                event_code="ASSIGNMENT_TERMINATOR_FINISHED",
+                assignment_types=assignment_types,
+                days_old=days_old,
+                batch_size=batch_size,
+                assignments_closed_complete=assignments_marked_complete,
+                assignments_closed_incomplete=assignments_marked_incomplete,
+                engagements_finished=engagements_marked_finished,
+            ),
         )
         print("I'll be back...", file=self.stdout)
@@ -0,0 +1,168 @@
+import json
+import logging
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from ...utils.benchmarks import (
+    compare_results,
+    run_benchmarks,
+    run_renderer_benchmarks,
+)
+from ...utils.logging_utils import generate_extra
+from ...utils.synthetic_data import SyntheticDataset
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    This command measures the latency and query count of every API endpoint
+    against a large, synthetic dataset.
+    """
+
+    def add_arguments(self, parser):
+        for short, name, default, help_text in (
+            ("-c", "--collections", 10, "How many collections to create."),
+            ("-w", "--workflows", 3, "How many workflows each collection has."),
+            ("-s", "--steps", 5, "How many steps each workflow has."),
+            ("-i", "--inputs", 2, "How many user inputs each step has."),
+            ("-u", "--users", 50, "How many users to create."),
+            ("-e", "--engagements", 20, "How many engagements each user has."),
+            ("-r", "--runs", 20, "How many timed requests to make per endpoint."),
+        ):
+            parser.add_argument(
+                short,
+                name,
+                type=int,
+                default=default,
+                help=f"{help_text} Defaults to {default}.",
+            )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed for the synthetic dataset. Defaults to 0.",
+        )
+        parser.add_argument(
+            "--renderers",
+            action="store_true",
+            help="Also compare DRF's JSON renderer and parser with the package's "
+            "on the largest responses.",
+        )
+        parser.add_argument(
+            "-o",
+            "--output",
+            type=str,
+            help="Write the results to this JSON file instead of stdout.",
+        )
+        parser.add_argument(
+            "--compare",
+            type=str,
+            help="A JSON file from an earlier run to check these results against.",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=20,
+            help="How many percent an endpoint's p90 latency may grow by before it "
+            "counts as a regression. Defaults to 20.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Build the dataset, request every endpoint as the first synthetic user
+        (who has the full engagement history), and report the results.
+
+        The dataset is created inside a transaction which is rolled back once
+        the endpoints have been measured, so nothing is left in the database.
+
+        If `--compare` is given, the command fails when any endpoint runs more
+        queries, responds with a different status, or is more than
+        `--threshold` percent slower at the 90th percentile.
+        """
+        parameters = {
+            name: options[name]
+            for name in (
+                "collections",
+                "workflows",
+                "steps",
+                "inputs",
+                "users",
+                "engagements",
+                "runs",
+                "seed",
+            )
+        }
+        if min(parameters.values()) < 0 or not (
+            parameters["collections"]
+            and parameters["users"]
+            and parameters["engagements"]
+            and parameters["runs"]
+        ):
+            print("Collections, users, engagements and runs must be at least 1.")
+            return
+
+        baseline = None
+        if options["compare"]:
+            with open(options["compare"]) as baseline_file:
+                baseline = json.load(baseline_file)
+
+        with transaction.atomic():
+            dataset = SyntheticDataset(seed=options["seed"])
+            collections = dataset.build_collections(
+                options["collections"],
+                options["workflows"],
+                options["steps"],
+                options["inputs"],
+            )
+            users = dataset.build_users(options["users"])
+            dataset.build_history(users, collections, options["engagements"])
+
+            with override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]
+            ):
+                results = run_benchmarks(users[0], runs=options["runs"])
+                if options["renderers"]:
+                    renderer_results = run_renderer_benchmarks(
+                        users[0], runs=options["runs"]
+                    )
+            transaction.set_rollback(True)
+
+        report = {
+            "created": timezone.now().isoformat(),
+            "database": settings.DATABASES["default"]["ENGINE"],
+            "parameters": parameters,
+            "results": results,
+        }
+        if options["renderers"]:
+            report["renderers"] = renderer_results
+        if options["output"]:
+            with open(options["output"], "w") as output_file:
+                json.dump(report, output_file, indent=2)
+            print(f"Wrote results to {options['output']}.", file=self.stdout)
+        else:
+            self.stdout.write(json.dumps(report, indent=2))
+
+        logger.info(
+            "Endpoint benchmarks finished",
+            extra=generate_extra(
+                event_code="BENCHMARK_ENDPOINTS_FINISHED", parameters=parameters
+            ),
+        )
+
+        if baseline is not None:
+            regressions = compare_results(
+                baseline["results"], results, threshold=options["threshold"]
+            )
+            for regression in regressions:
+                print(regression, file=self.stdout)
+            if regressions:
+                raise CommandError(
+                    f"{len(regressions)} regressions found compared to "
+                    f"{options['compare']}."
+                )
+            print(f"No regressions compared to {options['compare']}.", file=self.stdout)
@@ -0,0 +1,90 @@
+import logging
+import uuid
+from urllib.parse import urlsplit
+
+from django.core.exceptions import DisallowedHost
+from django.core.management import BaseCommand
+from django.test import RequestFactory
+
+from ...models import WorkflowCollection
+from ...utils.bundles import CollectionBundle, set_content_version
+from ...utils.logging_utils import generate_extra
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    This command stores the offline bundle of WorkflowCollections. Until their content
+    changes, the bundle endpoint serves the stored archives to clients reaching it at
+    `--base_url` without building them, as long as Django's cache is shared with it.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-c",
+            "--collection",
+            type=str,
+            action="append",
+            help="The id of a WorkflowCollection to bundle. Can be given more than "
+            "once. Defaults to every active collection.",
+        )
+        parser.add_argument(
+            "-u",
+            "--base_url",
+            type=str,
+            required=True,
+            help="The URL clients reach the API at, e.g. https://example.com. "
+            "Media URLs in the bundles are built from it.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        This is what is being run by manage.py
+        """
+        base_url = urlsplit(options["base_url"])
+        if base_url.scheme not in ("http", "https") or not base_url.netloc:
+            print(f"{options['base_url']} is not a valid base URL.")
+            return
+        request = RequestFactory().get(
+            "/", secure=base_url.scheme == "https", HTTP_HOST=base_url.netloc
+        )
+        try:
+            request.get_host()
+        except DisallowedHost:
+            print(f"{base_url.netloc} is not in ALLOWED_HOSTS.")
+            return
+
+        if options["collection"]:
+            try:
+                ids = {str(uuid.UUID(id)) for id in options["collection"]}
+            except ValueError:
+                print(f"Invalid WorkflowCollection ids: {options['collection']}.")
+                return
+            collections = list(WorkflowCollection.objects.filter(id__in=ids))
+            missing = ids - {str(collection.id) for collection in collections}
+            if missing:
+                print(f"No WorkflowCollection found with ids {sorted(missing)}.")
+                return
+        else:
+            collections = WorkflowCollection.objects.filter(active=True)
+
+        count = 0
+        for workflow_collection in collections:
+            bundle = CollectionBundle.build(workflow_collection, request)
+            bundle.save()
+            set_content_version(bundle, request)
+            count += 1
+            print(
+                f"Bundled {workflow_collection.code} version "
+                f"{workflow_collection.version}: {bundle.storage_name}",
+                file=self.stdout,
+            )
+
+        logger.info(
+            "Collection bundles built",
+            extra=generate_extra(
+                event_code="COLLECTION_BUNDLES_BUILT",
+                collection_bundle_count=count,
+            ),
+        )
@@ -0,0 +1,44 @@
+from django.core.exceptions import ValidationError
+from django.core.management import BaseCommand
+
+from ...models import WorkflowCollection
+from ...utils.cloning import clone_collection
+
+
+class Command(BaseCommand):
+    """
+    This command copies a WorkflowCollection, the same way the admin copy actions do.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-c",
+            "--collection",
+            type=str,
+            required=True,
+            help="The id of the WorkflowCollection to copy.",
+        )
+        parser.add_argument(
+            "--deep",
+            action="store_true",
+            help="Also copy every workflow in the collection, instead of linking to them.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        This is what is being run by manage.py
+        """
+        try:
+            workflow_collection = WorkflowCollection.objects.get(
+                id=options["collection"]
+            )
+        except (WorkflowCollection.DoesNotExist, ValidationError):
+            print(f"No WorkflowCollection found with id {options['collection']}.")
+            return
+
+        new_collection = clone_collection(workflow_collection, deep=options["deep"])
+        print(
+            f"Copied {workflow_collection.code} to {new_collection.code} "
+            f"({new_collection.id}).",
+            file=self.stdout,
+        )
@@ -0,0 +1,74 @@
+import json
+import logging
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from ...utils.logging_utils import generate_extra
+from ...utils.subscription_schedules import (
+    DEFAULT_BATCH_SIZE,
+    due_subscription_schedules,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    This command hands out the subscription notifications that are currently due.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-b",
+            "--batch_size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"How many schedules to claim per transaction. Defaults to {DEFAULT_BATCH_SIZE}.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Print one JSON line for every subscription schedule whose notification
+        is due, advancing each schedule to its next notification time.
+
+        Whatever sends the notifications can consume the output. Several copies
+        of the command may run at once; each due notification is only printed
+        by one of them.
+        """
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            print(f"{batch_size} is not a valid batch size.")
+            return
+
+        now = timezone.now()
+        count = 0
+        batches = 0
+        for batch in due_subscription_schedules(now=now, batch_size=batch_size):
+            batches += 1
+            for schedule in batch:
+                count += 1
+                subscription = schedule.workflow_collection_subscription
+                self.stdout.write(
+                    json.dumps(
+                        {
+                            "schedule": str(schedule.id),
+                            "subscription": str(subscription.id),
+                            "user": str(subscription.user_id),
+                            "workflow_collection": str(
+                                subscription.workflow_collection_id
+                            ),
+                            "fire_at": schedule.fire_at.isoformat(),
+                        }
+                    )
+                )
+
+        logger.info(
+            "Due subscriptions handed out",
+            extra=generate_extra(
+                event_code="DUE_SUBSCRIPTIONS_FINISHED",
+                due_subscription_count=count,
+                batches=batches,
+                batch_size=batch_size,
+            ),
+        )
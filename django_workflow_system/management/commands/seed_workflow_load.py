@@ -0,0 +1,156 @@
+import logging
+import time
+from datetime import datetime
+
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from ...utils.logging_utils import generate_extra
+from ...utils.synthetic_data import DEFAULT_BATCH_SIZE, SyntheticDataset
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    This command fills the database with a large, production like, synthetic dataset.
+    """
+
+    def add_arguments(self, parser):
+        for short, name, default, help_text in (
+            ("-u", "--users", 1000, "How many users to create."),
+            ("-c", "--collections", 20, "How many collections to create."),
+            ("-w", "--workflows", 3, "How many workflows each collection has."),
+            ("-s", "--steps", 5, "How many steps each workflow has."),
+            ("-i", "--inputs", 2, "How many user inputs each step has."),
+            ("-e", "--engagements", 10, "How many engagements each user has."),
+            (None, "--submissions", 2, "How many response sets each step has."),
+            (None, "--metadata", 50, "How many metadata groups to create."),
+            (None, "--dependencies", 5, "How many collection dependencies to create."),
+            (None, "--seed", 0, "Seed for every random choice."),
+            (
+                "-b",
+                "--batch_size",
+                DEFAULT_BATCH_SIZE,
+                "How many rows to insert per query, and users to create per "
+                "transaction.",
+            ),
+        ):
+            parser.add_argument(
+                *filter(None, (short, name)),
+                type=int,
+                default=default,
+                help=f"{help_text} Defaults to {default}.",
+            )
+        parser.add_argument(
+            "--date",
+            type=str,
+            help="The day (YYYY-MM-DD) the generated history leads up to. Defaults to "
+            "today. Use the same seed and date to generate the same dataset.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Create metadata, collections (with workflows, steps, user inputs and
+        dependencies between them) and then users with engagement histories.
+
+        Users and their history are created `batch_size` users at a time, each
+        batch in its own transaction, so memory use stays flat however many
+        users are requested.
+        """
+        counts = [
+            "users",
+            "collections",
+            "workflows",
+            "steps",
+            "inputs",
+            "engagements",
+            "submissions",
+            "metadata",
+            "dependencies",
+        ]
+        if any(options[name] < 0 for name in counts) or options["batch_size"] < 1:
+            print("Counts can't be negative and the batch size must be at least 1.")
+            return
+        if options["users"] and options["engagements"] and not options["collections"]:
+            print("At least one collection is needed to create engagements.")
+            return
+
+        if options["date"]:
+            try:
+                day = datetime.strptime(options["date"], "%Y-%m-%d")
+            except ValueError:
+                print(f"{options['date']} is not a valid date.")
+                return
+        else:
+            day = timezone.now().replace(tzinfo=None)
+        now = timezone.make_aware(
+            day.replace(hour=0, minute=0, second=0, microsecond=0), timezone.utc
+        )
+
+        started = time.monotonic()
+        dataset = SyntheticDataset(
+            seed=options["seed"], batch_size=options["batch_size"], now=now
+        )
+        if dataset.already_seeded():
+            print(
+                f"The database already holds data seeded with --seed "
+                f"{options['seed']}. Use a different seed to add more."
+            )
+            return
+
+        with transaction.atomic():
+            metadata = dataset.build_metadata(options["metadata"])
+            collections = dataset.build_collections(
+                options["collections"],
+                options["workflows"],
+                options["steps"],
+                options["inputs"],
+                metadata=metadata,
+            )
+            dataset.build_collection_dependencies(collections, options["dependencies"])
+        print(
+            f"Created {len(collections)} collections "
+            f"({round(time.monotonic() - started, 1)}s).",
+            file=self.stdout,
+        )
+
+        for start in range(0, options["users"], options["batch_size"]):
+            with transaction.atomic():
+                users = dataset.build_users(
+                    min(options["batch_size"], options["users"] - start), start=start
+                )
+                if collections:
+                    dataset.build_history(
+                        users,
+                        collections,
+                        options["engagements"],
+                        submissions=options["submissions"],
+                        offset=start,
+                    )
+            print(
+                f"Created {start + len(users)} of {options['users']} users "
+                f"({round(time.monotonic() - started, 1)}s).",
+                file=self.stdout,
+            )
+
+        dataset.invalidate_caches()
+
+        for model_name, count in sorted(dataset.counts.items()):
+            print(f"{count} {model_name} rows.", file=self.stdout)
+        print(
+            f"Seeded {sum(dataset.counts.values())} rows in "
+            f"{round(time.monotonic() - started, 1)}s.",
+            file=self.stdout,
+        )
+
+        logger.info(
+            "Seed workflow load finished",
+            extra=generate_extra(
+                event_code="SEED_WORKFLOW_LOAD_FINISHED",
+                seed=options["seed"],
+                rows=dataset.counts,
+                seconds=round(time.monotonic() - started, 3),
+            ),
+        )
@@ -0,0 +1,117 @@
+"""Optional middleware shipped with django_workflow_system."""
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from .utils.logging_utils import generate_extra
+from .utils.profiling import (
+    CACHE_HITS,
+    CACHE_MISSES,
+    JSONSCHEMA_VALIDATIONS,
+    STATE_COMPUTATIONS,
+    start_profile,
+    stop_profile,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """
+    Records how much work each request to a django_workflow_system view does.
+
+    For every sampled request this records the wall time, the number of
+    database queries and the time spent in them, how many times an
+    engagement's `state` was computed, how many JSON schema validations were
+    run, and the hits and misses of the package's caches. The numbers are
+    logged with the REQUEST_PROFILE event code, and added to the response's
+    `Server-Timing` header.
+
+    Usage:
+        MIDDLEWARE = [
+            ...
+            "django_workflow_system.middleware.ProfilingMiddleware",
+        ]
+
+        # Optional, these are the defaults.
+        DJANGO_WORKFLOW_SYSTEM = {
+            "PROFILING": {
+                # Fraction of requests to profile, 0 to 1.
+                "SAMPLE_RATE": 1.0,
+                # Whether to add the Server-Timing header.
+                "SERVER_TIMING": True,
+            },
+        }
+
+    Requests to views outside of this package are never logged.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        options = getattr(settings, "DJANGO_WORKFLOW_SYSTEM", {}).get("PROFILING", {})
+        self.sample_rate = options.get("SAMPLE_RATE", 1.0)
+        self.server_timing = options.get("SERVER_TIMING", True)
+
+    def __call__(self, request):
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        profile, token = start_profile()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(profile.record_query)
+                    )
+                started = time.perf_counter()
+                response = self.get_response(request)
+                wall_seconds = time.perf_counter() - started
+        finally:
+            stop_profile(token)
+
+        resolver_match = getattr(request, "resolver_match", None)
+        if resolver_match is None or not resolver_match.func.__module__.startswith(
+            "django_workflow_system."
+        ):
+            return response
+
+        metrics = {
+            "view": resolver_match.view_name,
+            "status_code": response.status_code,
+            "wall_ms": round(wall_seconds * 1000, 3),
+            "db_queries": profile.db_queries,
+            "db_ms": round(profile.db_seconds * 1000, 3),
+            STATE_COMPUTATIONS: profile.counters[STATE_COMPUTATIONS],
+            JSONSCHEMA_VALIDATIONS: profile.counters[JSONSCHEMA_VALIDATIONS],
+            CACHE_HITS: profile.counters[CACHE_HITS],
+            CACHE_MISSES: profile.counters[CACHE_MISSES],
+        }
+        logger.info(
+            "Request profile",
+            extra=generate_extra(
+                event_code="REQUEST_PROFILE",
+                user=getattr(request, "user", None),
+                request__path=request.path,
+                request__method=request.method,
+                **metrics,
+            ),
+        )
+
+        if self.server_timing:
+            timings = [
+                f'total;dur={metrics["wall_ms"]}',
+                f'db;dur={metrics["db_ms"]};desc="{metrics["db_queries"]} queries"',
+                f'state;desc="{metrics[STATE_COMPUTATIONS]}"',
+                f'jsonschema;desc="{metrics[JSONSCHEMA_VALIDATIONS]}"',
+                f'cache;desc="hits={metrics[CACHE_HITS]} '
+                f'misses={metrics[CACHE_MISSES]}"',
+            ]
+            existing = response.get("Server-Timing")
+            response["Server-Timing"] = ", ".join(
+                ([existing] if existing else []) + timings
+            )
+        return response
@@ -0,0 +1,69 @@
+# Generated by Django 3.2.25 on 2026-10-18 22:23
+
+import datetime
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def next_fire_at(day_of_week, time_of_day, weekly_interval, anchor, after):
+    """
+    A frozen copy of `utils.subscription_schedules.next_fire_at`, so later
+    changes to it can't change what this migration does.
+    """
+    interval = max(weekly_interval, 1)
+    after = after.astimezone(datetime.timezone.utc)
+    anchor = anchor.astimezone(datetime.timezone.utc).date()
+    anchor_week = anchor - datetime.timedelta(days=anchor.weekday())
+    after_week = after.date() - datetime.timedelta(days=after.weekday())
+
+    weeks_since_anchor = max((after_week - anchor_week).days // 7, 0)
+    weeks_since_anchor += -weeks_since_anchor % interval
+    week = anchor_week + datetime.timedelta(weeks=weeks_since_anchor)
+
+    fire_at = datetime.datetime.combine(
+        week + datetime.timedelta(days=day_of_week),
+        time_of_day,
+        tzinfo=datetime.timezone.utc,
+    )
+    if fire_at <= after:
+        fire_at += datetime.timedelta(weeks=interval)
+    return fire_at
+
+
+def populate_next_fire_at(apps, schema_editor):
+    """
+    Compute `next_fire_at` for schedules that existed before the field did.
+    """
+    WorkflowCollectionSubscriptionSchedule = apps.get_model(
+        'django_workflow_system', 'WorkflowCollectionSubscriptionSchedule'
+    )
+    now = timezone.now()
+    schedules = list(WorkflowCollectionSubscriptionSchedule.objects.all())
+    for schedule in schedules:
+        schedule.next_fire_at = next_fire_at(
+            day_of_week=schedule.day_of_week,
+            time_of_day=schedule.time_of_day,
+            weekly_interval=schedule.weekly_interval,
+            anchor=schedule.created_date,
+            after=now,
+        )
+    WorkflowCollectionSubscriptionSchedule.objects.bulk_update(
+        schedules, ['next_fire_at'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_workflow_system', '0010_auto_20211105_0940'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflowcollectionsubscriptionschedule',
+            name='next_fire_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='When the next notification for this schedule is due.', null=True),
+        ),
+        migrations.RunPython(populate_next_fire_at, migrations.RunPython.noop),
+    ]
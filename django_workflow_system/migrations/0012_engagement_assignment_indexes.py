@@ -0,0 +1,37 @@
+# Generated by Django 3.2.25 on 2026-10-18 23:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_workflow_system', '0011_subscription_schedule_next_fire_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workflowcollectionassignment',
+            index=models.Index(fields=['status', 'workflow_collection', 'start'], name='assignment_status_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workflowcollectionengagement',
+            index=models.Index(condition=models.Q(('finished__isnull', True)), fields=['user', 'started'], name='engagement_open_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workflowcollectionengagement',
+            index=models.Index(fields=['user', 'workflow_collection', 'finished'], name='engagement_user_coll_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workflowcollectionengagementdetail',
+            index=models.Index(fields=['workflow_collection_engagement', 'finished'], name='engagement_detail_done_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workflowcollectionengagementdetail',
+            index=models.Index(fields=['step', 'finished'], name='engagement_detail_step_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workflowcollectionrecommendation',
+            index=models.Index(fields=['user', 'start', 'end'], name='recommendation_window_idx'),
+        ),
+    ]
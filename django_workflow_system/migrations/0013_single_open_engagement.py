@@ -0,0 +1,46 @@
+# Generated by Django 3.2.25 on 2026-10-18 23:08
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+def finish_duplicate_engagements(apps, schema_editor):
+    """
+    Finish all but the latest open engagement of each user and collection,
+    so that the constraint can be added.
+    """
+    WorkflowCollectionEngagement = apps.get_model(
+        'django_workflow_system', 'WorkflowCollectionEngagement'
+    )
+    open_engagements = WorkflowCollectionEngagement.objects.filter(finished=None)
+    duplicates = (
+        open_engagements.order_by()
+        .values('user_id', 'workflow_collection_id')
+        .annotate(open_count=Count('id'))
+        .filter(open_count__gt=1)
+    )
+    now = timezone.now()
+    for duplicate in duplicates:
+        engagements = open_engagements.filter(
+            user_id=duplicate['user_id'],
+            workflow_collection_id=duplicate['workflow_collection_id'],
+        ).order_by('-started')
+        open_engagements.filter(
+            id__in=list(engagements.values_list('id', flat=True)[1:])
+        ).update(finished=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_workflow_system', '0012_engagement_assignment_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(finish_duplicate_engagements, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='workflowcollectionengagement',
+            constraint=models.UniqueConstraint(condition=models.Q(('finished__isnull', True)), fields=('user', 'workflow_collection'), name='Only one open engagement per workflow collection per user'),
+        ),
+    ]
@@ -64,6 +64,14 @@ class WorkflowCollectionAssignment(CreatedModifiedAbstractModel):
                 name="Only one open assignment per workflow collection per user",
             )
         ]
+        indexes = [
+            # Open assignments of a type of collection, by age. Used by the
+            # assignment_terminator command.
+            models.Index(
+                fields=["status", "workflow_collection", "start"],
+                name="assignment_status_start_idx",
+            ),
+        ]
 
     def __str__(self):
         return "{} - {}".format(self.workflow_collection.name, self.status)
@@ -7,7 +7,10 @@ from django.db import models
 from django_workflow_system.models.abstract_models import CreatedModifiedAbstractModel
 from django_workflow_system.models.metadata import WorkflowMetadata
 from django_workflow_system.utils.validators import validate_code
-from django_workflow_system.utils.version_validator import version_validator
+from django_workflow_system.utils.version_validator import (
+    save_version,
+    version_validator,
+)
 from .collection_dependency import WorkflowCollectionDependency
 
 from django.core.exceptions import ValidationError
@@ -113,8 +116,11 @@ class WorkflowCollection(CreatedModifiedAbstractModel):
         return self.name
 
     def save(self, *args, **kwargs):
-        self.full_clean()
-        super(WorkflowCollection, self).save(*args, **kwargs)
+        save_version(
+            self,
+            WorkflowCollection,
+            lambda: super(WorkflowCollection, self).save(*args, **kwargs),
+        )
 
     def source_identifier(self):
         return f"{self.code}_v{self.version}"
@@ -50,5 +50,22 @@ class WorkflowCollectionDependency(CreatedModifiedAbstractModel):
                 "You can't create a dependency to the same collection."
             )
 
+        # Imported here to get around a circular dependency with the models package.
+        from ...utils.collection_dependencies import CollectionDependencyGraph
+
+        # Check the whole graph, as it currently stands in the database,
+        # for longer cycles (A -> B -> C -> A) that this would complete.
+        cycle = CollectionDependencyGraph.load(exclude=self.pk).find_cycle(
+            self.source_id, self.target_id
+        )
+        if cycle:
+            collections = self._meta.get_field("source").related_model.objects
+            names = dict(collections.filter(id__in=cycle).values_list("id", "name"))
+            raise ValidationError(
+                "You are attempting to create a circular dependency: "
+                + " requires ".join(names[collection_id] for collection_id in cycle)
+                + "."
+            )
+
     def __str__(self):
         return f"{self.source} requires that all workflows in {self.target} have been completed."
@@ -4,9 +4,7 @@ import uuid
 from django.db.models.expressions import F, Window
 from django.db.models.functions import RowNumber
 from django.db.models.query import QuerySet
-from pprint import pprint
 
-import jsonschema
 from django.conf import settings
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
 from django.db import models
@@ -18,15 +16,16 @@ from django_workflow_system.models.collections.collection_member import (
     WorkflowCollectionMember,
 )
 from django_workflow_system.models.step import WorkflowStep
-from django_workflow_system.models.step_dependency_group import (
-    WorkflowStepDependencyGroup,
-)
 
 from django_workflow_system.models.collections.collection import WorkflowCollection
 from django_workflow_system.models.collections.engagement_detail import (
     WorkflowCollectionEngagementDetail,
 )
 from django_workflow_system.models.workflow import Workflow
+from django_workflow_system.utils.profiling import STATE_COMPUTATIONS, count
+from django_workflow_system.utils.step_dependencies import (
+    get_step_dependency_evaluator,
+)
 
 
 class PreviousNextStepDescriptor(TypedDict):
@@ -91,6 +90,27 @@ class WorkflowCollectionEngagement(CreatedModifiedAbstractModel):
         unique_together = ["workflow_collection", "user", "started"]
         verbose_name_plural = "Workflow Collection Engagements"
         ordering = ["workflow_collection", "started"]
+        constraints = [
+            models.UniqueConstraint(
+                condition=Q(finished__isnull=True),
+                fields=["user", "workflow_collection"],
+                name="Only one open engagement per workflow collection per user",
+            )
+        ]
+        indexes = [
+            # A user's open engagements, e.g. the engagement list's
+            # `include_finished=false` filter.
+            models.Index(
+                fields=["user", "started"],
+                condition=Q(finished__isnull=True),
+                name="engagement_open_user_idx",
+            ),
+            # Whether a user has an open or finished engagement of a collection.
+            models.Index(
+                fields=["user", "workflow_collection", "finished"],
+                name="engagement_user_coll_idx",
+            ),
+        ]
 
     @property
     def state(self) -> EngagementStateType:
@@ -100,6 +120,7 @@ class WorkflowCollectionEngagement(CreatedModifiedAbstractModel):
         Practically speaking, what workflows and steps have been completed thus far,
         and which ones still need to be completed.
         """
+        count(STATE_COMPUTATIONS)
 
         """
         STEP 1
@@ -118,9 +139,6 @@ class WorkflowCollectionEngagement(CreatedModifiedAbstractModel):
             .order_by("workflow_order", "order")
         )
 
-        for step in all_collection_steps:
-            print(vars(step), "\n")
-
         # Special case to prevent crash when collection has no steps.
         if not all_collection_steps:
             return {
@@ -150,9 +168,6 @@ class WorkflowCollectionEngagement(CreatedModifiedAbstractModel):
             .order_by("workflowcollectionmember__order")
         )
 
-        for collection in all_collection_workflows:
-            print("Collection Member", vars(collection), "\n")
-
         all_engagement_details: QuerySet[
             WorkflowCollectionEngagementDetail
         ] = self.workflowcollectionengagementdetail_set.all()
@@ -160,6 +175,27 @@ class WorkflowCollectionEngagement(CreatedModifiedAbstractModel):
             finished__isnull=False
         )
 
+        # Steps whose dependencies aren't met are skipped when looking for the
+        # next step. The evaluator is cached per collection and works off the
+        # responses already loaded for this engagement.
+        dependency_evaluator = get_step_dependency_evaluator(
+            self.workflow_collection_id
+        )
+        completed_responses = {
+            detail.step_id: detail.user_responses
+            for detail in all_completed_engagement_details
+        }
+
+        def first_available_step(steps):
+            return next(
+                (
+                    step
+                    for step in steps
+                    if dependency_evaluator.is_satisfied(step.id, completed_responses)
+                ),
+                None,
+            )
+
         """
         STEP 3: Determine if there is a previous step.
         """
@@ -253,58 +289,42 @@ class WorkflowCollectionEngagement(CreatedModifiedAbstractModel):
         # If there are no completed steps/engagement details, the
         # first step of the collection should be used.
         if not all_completed_engagement_details:
-            next_step = all_collection_steps[0]
-            next_workflow = next_step.workflow
+            next_step = first_available_step(all_collection_steps)
+            next_workflow = next_step.workflow if next_step else None
 
         if previous_step:
 
-            # See if there are any steps remaining in the workflow.
-            next_step_in_workflow = (
-                all_collection_steps.filter(
-                    workflow=previous_step.workflow, order__gt=previous_step.order
-                )
-                .order_by("order")
-                .first()
+            # See if there are any available steps remaining in the workflow.
+            next_step_in_workflow = first_available_step(
+                step
+                for step in all_collection_steps
+                if step.workflow_id == previous_step.workflow_id
+                and step.order > previous_step.order
             )
 
             if next_step_in_workflow:
                 next_step = next_step_in_workflow
                 next_workflow = next_step_in_workflow.workflow
 
-                print("Using the next step in the same workflow.")
-
             elif (
                 self.workflow_collection.category == "SURVEY"
                 or self.workflow_collection.ordered
             ):
-                print(
-                    "There is no next step in the current workflow. Need to see if there is a next step in the next workflow."
-                )
                 """
                 If there isn't another step in the workflow AND the collection is a survey
                 or an ordered activity, we can use the first step of the next workflow in the
                 collection (if there is one) as the next step.
 
-                TODO: Need to re-introduce dependency checking here.
-                In light of that... need to account for the possibility
-                that you may need to skip over multiple workflows before you
-                find a step for which all dependencies are meet.
-
-                Go through steps in index order sort of like Rocky had previously.
+                Steps with unmet dependencies are skipped, which may mean skipping
+                over multiple workflows before a step for which all dependencies
+                are met is found.
                 """
-
-                print("Last Step", vars(previous_step))
-
-                first_step_of_next_workflow = (
-                    all_collection_steps.filter(
-                        workflow_order__gt=previous_step.workflow_order
-                    )
-                    .order_by("workflow_order", "order")
-                    .first()
+                first_step_of_next_workflow = first_available_step(
+                    step
+                    for step in all_collection_steps
+                    if step.workflow_order > previous_step.workflow_order
                 )
 
-                print("First Step of Next Workflow", first_step_of_next_workflow)
-
                 if first_step_of_next_workflow:
                     next_step = first_step_of_next_workflow
                     next_workflow = first_step_of_next_workflow.workflow
@@ -330,8 +350,6 @@ class WorkflowCollectionEngagement(CreatedModifiedAbstractModel):
             a single unfinished engagement detail) that is not the first
             workflow of the collection.
             """
-            print("UNORDERED ACTIVITY")
-
             next_step = None
             next_workflow = None
 
@@ -453,43 +471,19 @@ class WorkflowCollectionEngagement(CreatedModifiedAbstractModel):
             },
         }
 
-    # TODO: Put this back in place.
     def all_dependencies_satisfied(self, step):
-        step_dependency_group_list = WorkflowStepDependencyGroup.objects.filter(
-            workflow_collection=self.workflow_collection,
-            workflow_step=step,
+        """
+        Determine if the dependencies of `step` are satisfied by the steps
+        completed in this engagement.
+        """
+        completed_details = self.workflowcollectionengagementdetail_set.filter(
+            finished__isnull=False
         )
-        if len(step_dependency_group_list) == 0:
-            return True
-        for step_dependency_group in step_dependency_group_list:
-            dependency_group_satisfied = True
-            for (
-                dependency_detail
-            ) in step_dependency_group.workflowstepdependencydetail_set.all():
-                required_step = dependency_detail.dependency_step
-                required_response_schema = dependency_detail.required_response
-                try:
-                    required_step_response = (
-                        self.workflowcollectionengagementdetail_set.get(
-                            step=required_step,
-                            finished__isnull=False,
-                        ).user_responses
-                    )
-                except WorkflowCollectionEngagementDetail.DoesNotExist as e:
-                    dependency_group_satisfied = False
-                    break
-                questions_list = required_step_response[-1]["inputs"]
-                try:
-                    jsonschema.validate(
-                        instance=questions_list, schema=required_response_schema
-                    )
-                except jsonschema.ValidationError as e:
-                    dependency_group_satisfied = False
-                    break
-            if dependency_group_satisfied:
-                return True
-        # no dependency_group was completely satisfied
-        return False
+        completed_responses = dict(
+            completed_details.values_list("step_id", "user_responses")
+        )
+        evaluator = get_step_dependency_evaluator(self.workflow_collection_id)
+        return evaluator.is_satisfied(step.id, completed_responses)
 
     def __str__(self):
         return "Engagement: {} - {}".format(
@@ -541,13 +535,15 @@ class WorkflowCollectionEngagement(CreatedModifiedAbstractModel):
                     "The Engagement and Assignment Users are not the same"
                 )
 
-        # Check if the user has an existing incomplete engagement to the same workflow collection
+        # Check if the user has an existing incomplete engagement to the same workflow collection.
+        # The database enforces this too, but model forms (e.g. the admin) don't check
+        # conditional unique constraints, so check here to show a form error instead.
         existing_engagement = WorkflowCollectionEngagement.objects.filter(
             user=self.user,
             workflow_collection=self.workflow_collection,
             finished__isnull=True,
         ).exclude(pk=self.pk)
-        if existing_engagement:
+        if existing_engagement.exists():
             raise ValidationError(
                 "The user has an existing incomplete engagement for this workflow collection."
             )
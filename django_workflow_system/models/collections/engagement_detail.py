@@ -53,6 +53,16 @@ class WorkflowCollectionEngagementDetail(CreatedModifiedAbstractModel):
         verbose_name_plural = "Workflow Collection Engagement Details"
         unique_together = ["workflow_collection_engagement", "step"]
         ordering = ["workflow_collection_engagement", "started"]
+        indexes = [
+            # An engagement's finished steps, used by the `state` property.
+            models.Index(
+                fields=["workflow_collection_engagement", "finished"],
+                name="engagement_detail_done_idx",
+            ),
+            models.Index(
+                fields=["step", "finished"], name="engagement_detail_step_idx"
+            ),
+        ]
 
     def __str__(self):
         return "{} response to {}".format(
@@ -2,6 +2,7 @@
 import uuid
 
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
 from django.utils import timezone
 
@@ -9,6 +10,18 @@ from ..abstract_models import CreatedModifiedAbstractModel
 from .collection import WorkflowCollection
 
 
+class WorkflowCollectionRecommendationQuerySet(models.QuerySet):
+    def active(self, at=None):
+        """
+        Recommendations which are valid at a point in time.
+
+        at : datetime
+            Defaults to now.
+        """
+        at = at or timezone.now()
+        return self.filter(Q(end__isnull=True) | Q(end__gt=at), start__lte=at)
+
+
 class WorkflowCollectionRecommendation(CreatedModifiedAbstractModel):
     """
     Definition of a Workflow Recommendation.
@@ -37,9 +50,17 @@ class WorkflowCollectionRecommendation(CreatedModifiedAbstractModel):
     start = models.DateTimeField(default=timezone.now)
     end = models.DateTimeField(null=True, blank=True, default=None)
 
+    objects = WorkflowCollectionRecommendationQuerySet.as_manager()
+
     class Meta:
         db_table = "workflow_system_collection_recommendation"
         verbose_name_plural = "Workflow Collection Recommendations"
+        indexes = [
+            # A user's currently active recommendations.
+            models.Index(
+                fields=["user", "start", "end"], name="recommendation_window_idx"
+            ),
+        ]
 
     def __str__(self):
         return " - ".join([str(self.workflow_collection), str(self.user)])
@@ -4,6 +4,7 @@ import uuid
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 
 from django_workflow_system.models.abstract_models import CreatedModifiedAbstractModel
 from django_workflow_system.models import WorkflowCollection
@@ -40,9 +41,41 @@ class WorkflowCollectionSubscription(CreatedModifiedAbstractModel):
         unique_together = ["workflow_collection", "user"]
         verbose_name_plural = "Workflow Collection Subscriptions"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_active = instance.active
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._loaded_active = self.active
+
     def save(self, *args, **kwargs):
         self.full_clean()
+        reactivated = self.active and getattr(self, "_loaded_active", True) is False
         super(WorkflowCollectionSubscription, self).save(*args, **kwargs)
+        self._loaded_active = self.active
+        if reactivated:
+            self._reschedule_missed_notifications()
+
+    def _reschedule_missed_notifications(self):
+        """
+        Move the notifications that came due while the subscription was
+        inactive to their next occurrence, so they don't all fire as soon
+        as it is reactivated.
+        """
+        now = timezone.now()
+        schedules = list(
+            self.workflowcollectionsubscriptionschedule_set.filter(
+                next_fire_at__lte=now
+            )
+        )
+        for schedule in schedules:
+            schedule.next_fire_at = schedule.get_next_fire_at(now)
+        self.workflowcollectionsubscriptionschedule_set.model.objects.bulk_update(
+            schedules, ["next_fire_at"]
+        )
 
     def __str__(self):
         return "{} - {}".format(self.user.username, self.workflow_collection.name)
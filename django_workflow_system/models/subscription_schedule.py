@@ -1,9 +1,13 @@
 """Django model definition."""
+import datetime
 import uuid
+
 from django.db import models
+from django.utils import timezone
 
 from django_workflow_system.models.abstract_models import CreatedModifiedAbstractModel
 from django_workflow_system.models.subscription import WorkflowCollectionSubscription
+from django_workflow_system.utils.subscription_schedules import next_fire_at
 
 
 class WorkflowCollectionSubscriptionSchedule(CreatedModifiedAbstractModel):
@@ -20,6 +24,12 @@ class WorkflowCollectionSubscriptionSchedule(CreatedModifiedAbstractModel):
         Monday, Wednesday, and Friday they would need to
         have 3 corresponding WorkflowCollectionSubscriptionSchedule
         objects.
+
+        `time_of_day` is stored in UTC. `next_fire_at` is recomputed
+        when the schedule is saved with a new day, time or interval, or
+        its subscription is reactivated, and is advanced by
+        `utils.subscription_schedules.due_subscription_schedules`
+        once a notification has been handed out for it.
     """
 
     MONDAY = 0
@@ -46,6 +56,13 @@ class WorkflowCollectionSubscriptionSchedule(CreatedModifiedAbstractModel):
     time_of_day = models.TimeField()
     day_of_week = models.IntegerField(choices=DAY_OF_WEEK)
     weekly_interval = models.IntegerField(default=1)
+    next_fire_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="When the next notification for this schedule is due.",
+    )
 
     class Meta:
         db_table = "workflow_system_collection_subscription_schedule"
@@ -57,3 +74,58 @@ class WorkflowCollectionSubscriptionSchedule(CreatedModifiedAbstractModel):
             self.workflow_collection_subscription.workflow_collection.name,
             self.workflow_collection_subscription.user.username,
         )
+
+    # The fields `next_fire_at` is computed from.
+    SCHEDULE_FIELDS = ("day_of_week", "time_of_day", "weekly_interval")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_schedule = instance._get_schedule()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._loaded_schedule = self._get_schedule()
+
+    def _get_schedule(self) -> tuple:
+        return tuple(
+            self._meta.get_field(name).to_python(getattr(self, name))
+            for name in self.SCHEDULE_FIELDS
+        )
+
+    def save(self, *args, **kwargs):
+        # Other edits leave `next_fire_at` alone, so a notification which is
+        # already due isn't skipped.
+        schedule = self._get_schedule()
+        if self.next_fire_at is None or schedule != getattr(
+            self, "_loaded_schedule", None
+        ):
+            self.next_fire_at = self.get_next_fire_at(timezone.now())
+        super(WorkflowCollectionSubscriptionSchedule, self).save(*args, **kwargs)
+        self._loaded_schedule = schedule
+
+    def get_next_fire_at(self, after: datetime.datetime) -> datetime.datetime:
+        """
+        Return the first notification time strictly later than `after`.
+
+        Notifications happen on `day_of_week` at `time_of_day` (UTC) every
+        `weekly_interval` weeks. Weeks are counted from the week the schedule
+        was created in (its anchor), so an every-other-week schedule keeps
+        firing on the same weeks no matter when this is evaluated.
+
+        Parameters:
+            after (datetime): An aware datetime.
+
+        Returns:
+            datetime: An aware UTC datetime.
+        """
+        # Unsaved instances may still hold the raw value they were created with.
+        time_of_day = self._meta.get_field("time_of_day").to_python(self.time_of_day)
+        return next_fire_at(
+            day_of_week=self.day_of_week,
+            time_of_day=time_of_day,
+            weekly_interval=self.weekly_interval,
+            anchor=self.created_date or after,
+            after=after,
+        )
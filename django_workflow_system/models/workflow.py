@@ -8,7 +8,10 @@ from django_workflow_system.models.abstract_models import CreatedModifiedAbstrac
 from django_workflow_system.models.author import WorkflowAuthor
 from django_workflow_system.models.metadata import WorkflowMetadata
 from django_workflow_system.utils.validators import validate_code
-from django_workflow_system.utils.version_validator import version_validator
+from django_workflow_system.utils.version_validator import (
+    save_version,
+    version_validator,
+)
 
 
 class Workflow(CreatedModifiedAbstractModel):
@@ -58,7 +61,9 @@ class Workflow(CreatedModifiedAbstractModel):
         return self.name
 
     def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
+        save_version(
+            self, Workflow, lambda: super(Workflow, self).save(*args, **kwargs)
+        )
 
     def clean(self):
         version_validator(self, Workflow)
@@ -0,0 +1,136 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from django_workflow_system.api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionAssignmentFactory,
+    WorkflowCollectionEngagementDetailFactory,
+    WorkflowCollectionEngagementFactory,
+    WorkflowCollectionFactory,
+    WorkflowCollectionRecommendationFactory,
+    WorkflowCollectionSubscriptionFactory,
+    WorkflowFactory,
+    WorkflowStepFactory,
+)
+from django_workflow_system.models import (
+    WorkflowCollectionAssignment,
+    WorkflowCollectionDependency,
+    WorkflowStepDependencyDetail,
+    WorkflowStepDependencyGroup,
+)
+
+CHANGELISTS = [
+    "workflowcollection",
+    "workflowcollectionassignment",
+    "workflowcollectiondependency",
+    "workflowcollectionengagement",
+    "workflowcollectionengagementdetail",
+    "workflowcollectionrecommendation",
+    "workflowcollectionsubscription",
+    "workflowauthor",
+    "workflow",
+    "workflowstep",
+    "workflowstepdependencygroup",
+    "workflowstepdependencydetail",
+]
+
+
+class TestChangelistQueries(TestCase):
+    """Every changelist runs the same number of queries however many rows it shows."""
+
+    def setUp(self):
+        self.admin_user = UserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(self.admin_user)
+        self.previous_collection = None
+
+    def add_rows(self):
+        """Create one row, with all of its relations, for every changelist."""
+        user = UserFactory()
+        workflow = WorkflowFactory()
+        first_step = WorkflowStepFactory(workflow=workflow, order=1)
+        second_step = WorkflowStepFactory(workflow=workflow, order=2)
+        workflow_collection = WorkflowCollectionFactory(workflow_set=[workflow])
+
+        engagement = WorkflowCollectionEngagementFactory(
+            workflow_collection=workflow_collection, user=user
+        )
+        WorkflowCollectionEngagementDetailFactory(
+            workflow_collection_engagement=engagement, step=first_step
+        )
+        WorkflowCollectionAssignmentFactory(
+            workflow_collection=workflow_collection,
+            user=user,
+            engagement=engagement,
+            status=WorkflowCollectionAssignment.IN_PROGRESS,
+        )
+        WorkflowCollectionSubscriptionFactory(
+            workflow_collection=workflow_collection, user=user
+        )
+        WorkflowCollectionRecommendationFactory(
+            workflow_collection=workflow_collection, user=user
+        )
+
+        dependency_group = WorkflowStepDependencyGroup.objects.create(
+            workflow_collection=workflow_collection, workflow_step=second_step
+        )
+        WorkflowStepDependencyDetail.objects.create(
+            dependency_group=dependency_group,
+            dependency_step=first_step,
+            required_response={},
+        )
+        if self.previous_collection:
+            WorkflowCollectionDependency.objects.create(
+                source=workflow_collection, target=self.previous_collection
+            )
+        self.previous_collection = workflow_collection
+
+    def count_queries(self, model_name):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                reverse(f"admin:django_workflow_system_{model_name}_changelist")
+            )
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_query_count_is_constant(self):
+        for _ in range(2):
+            self.add_rows()
+        few = {model_name: self.count_queries(model_name) for model_name in CHANGELISTS}
+
+        for _ in range(4):
+            self.add_rows()
+        for model_name in CHANGELISTS:
+            with self.subTest(model_name=model_name):
+                self.assertEqual(self.count_queries(model_name), few[model_name])
+
+    def test_open_counts(self):
+        self.add_rows()
+        workflow_collection = self.previous_collection
+        WorkflowCollectionAssignmentFactory(
+            workflow_collection=workflow_collection,
+            user=UserFactory(),
+            status=WorkflowCollectionAssignment.CLOSED_COMPLETE,
+        )
+        WorkflowCollectionSubscriptionFactory(
+            workflow_collection=workflow_collection, user=UserFactory(), active=False
+        )
+        WorkflowCollectionAssignmentFactory(
+            workflow_collection=workflow_collection,
+            user=UserFactory(),
+            status=WorkflowCollectionAssignment.ASSIGNED,
+        )
+        WorkflowCollectionSubscriptionFactory(
+            workflow_collection=workflow_collection, user=UserFactory()
+        )
+        empty_collection = WorkflowCollectionFactory()
+
+        response = self.client.get(
+            reverse("admin:django_workflow_system_workflowcollection_changelist")
+        )
+        rows = {row.id: row for row in response.context["cl"].result_list}
+        self.assertEqual(rows[workflow_collection.id].open_assignment_count, 2)
+        self.assertEqual(rows[workflow_collection.id].open_subscription_count, 2)
+        self.assertEqual(rows[empty_collection.id].open_assignment_count, 0)
+        self.assertEqual(rows[empty_collection.id].open_subscription_count, 0)
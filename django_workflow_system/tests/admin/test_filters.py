@@ -0,0 +1,88 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from django_workflow_system.api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionEngagementDetailFactory,
+    WorkflowCollectionEngagementFactory,
+    WorkflowCollectionFactory,
+    WorkflowFactory,
+    WorkflowStepFactory,
+)
+from django_workflow_system.tests.utils import commit_immediately
+from django_workflow_system.utils.admin_utils import COLLECTION_CHOICES_CACHE_KEY
+
+
+class TestStepInCollectionFilter(TestCase):
+    def setUp(self):
+        commit_immediately(self)
+        cache.delete(COLLECTION_CHOICES_CACHE_KEY)
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+        self.workflow = WorkflowFactory()
+        self.other_workflow = WorkflowFactory()
+        self.step = WorkflowStepFactory(workflow=self.workflow, order=1)
+        self.other_step = WorkflowStepFactory(workflow=self.other_workflow, order=1)
+        self.workflow_collection = WorkflowCollectionFactory(
+            workflow_set=[self.workflow]
+        )
+        self.empty_collection = WorkflowCollectionFactory()
+        self.url = reverse("admin:django_workflow_system_workflowstep_changelist")
+
+    def get_steps(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return set(response.context["cl"].result_list)
+
+    def test_filters_by_collection(self):
+        self.assertEqual(
+            self.get_steps(collection=self.workflow_collection.id), {self.step}
+        )
+
+    def test_collection_without_workflows(self):
+        self.assertEqual(self.get_steps(collection=self.empty_collection.id), set())
+
+    def test_no_collection(self):
+        self.assertEqual(self.get_steps(), {self.step, self.other_step})
+
+    def test_choices_are_cached_until_a_collection_changes(self):
+        self.get_steps()
+        self.assertEqual(len(cache.get(COLLECTION_CHOICES_CACHE_KEY)), 2)
+
+        self.empty_collection.name = "Renamed"
+        self.empty_collection.save()
+        self.assertIsNone(cache.get(COLLECTION_CHOICES_CACHE_KEY))
+        self.get_steps()
+        self.assertIn(
+            (self.empty_collection.id, "Renamed"),
+            cache.get(COLLECTION_CHOICES_CACHE_KEY),
+        )
+
+
+class TestHasDetailsFilter(TestCase):
+    def setUp(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+        workflow = WorkflowFactory()
+        step = WorkflowStepFactory(workflow=workflow, order=1)
+        workflow_collection = WorkflowCollectionFactory(workflow_set=[workflow])
+        self.with_details = WorkflowCollectionEngagementFactory(
+            workflow_collection=workflow_collection, user=UserFactory()
+        )
+        WorkflowCollectionEngagementDetailFactory(
+            workflow_collection_engagement=self.with_details, step=step
+        )
+        self.without_details = WorkflowCollectionEngagementFactory(
+            workflow_collection=workflow_collection, user=UserFactory()
+        )
+        self.url = reverse(
+            "admin:django_workflow_system_workflowcollectionengagement_changelist"
+        )
+
+    def get_engagements(self, has_details):
+        response = self.client.get(self.url, {"has_details": has_details})
+        self.assertEqual(response.status_code, 200)
+        return list(response.context["cl"].result_list)
+
+    def test_has_details(self):
+        self.assertEqual(self.get_engagements("true"), [self.with_details])
+        self.assertEqual(self.get_engagements("false"), [self.without_details])
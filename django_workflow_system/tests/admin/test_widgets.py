@@ -0,0 +1,84 @@
+import django
+from django.apps import apps
+from django.test import TestCase
+from django.urls import reverse
+
+from django_workflow_system.api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionEngagementFactory,
+    WorkflowCollectionFactory,
+)
+
+
+class TestRelatedFieldWidgets(TestCase):
+    def setUp(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+        self.user = UserFactory(username="needle")
+        self.other_user = UserFactory(username="haystack")
+        self.workflow_collection = WorkflowCollectionFactory(code="needle_collection")
+        self.engagement = WorkflowCollectionEngagementFactory(
+            workflow_collection=self.workflow_collection, user=self.user
+        )
+        self.other_engagement = WorkflowCollectionEngagementFactory(
+            workflow_collection=WorkflowCollectionFactory(), user=self.other_user
+        )
+
+    def test_forms_do_not_list_every_row(self):
+        for model_name in (
+            "workflowcollectionassignment",
+            "workflowcollectionengagement",
+            "workflowcollectionengagementdetail",
+            "workflowcollectionrecommendation",
+            "workflowcollectionsubscription",
+        ):
+            with self.subTest(model_name=model_name):
+                response = self.client.get(
+                    reverse(f"admin:django_workflow_system_{model_name}_add")
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertNotContains(response, "haystack")
+                self.assertNotContains(response, self.workflow_collection.name)
+
+    def autocomplete(self, model_name, field_name, term):
+        if django.VERSION < (3, 2):
+            # Django 3.1 serves autocomplete results from the related model's
+            # admin.
+            related_model = (
+                apps.get_model("django_workflow_system", model_name)
+                ._meta.get_field(field_name)
+                .related_model
+            )
+            url = reverse(
+                f"admin:django_workflow_system_"
+                f"{related_model._meta.model_name}_autocomplete"
+            )
+            params = {"term": term}
+        else:
+            url = reverse("admin:autocomplete")
+            params = {
+                "app_label": "django_workflow_system",
+                "model_name": model_name,
+                "field_name": field_name,
+                "term": term,
+            }
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return [result["id"] for result in response.json()["results"]]
+
+    def test_engagement_search_uses_user_fields(self):
+        self.assertEqual(
+            self.autocomplete(
+                "workflowcollectionengagementdetail",
+                "workflow_collection_engagement",
+                "needle",
+            ),
+            [str(self.engagement.id)],
+        )
+
+    def test_collection_search_uses_code(self):
+        self.assertEqual(
+            self.autocomplete(
+                "workflowcollectionassignment", "workflow_collection", "needle_coll"
+            ),
+            [str(self.workflow_collection.id)],
+        )
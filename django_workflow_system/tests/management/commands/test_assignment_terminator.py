@@ -21,7 +21,9 @@ from io import StringIO
 from datetime import timedelta
 
 from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from django_workflow_system.api.tests.factories import (
@@ -237,3 +239,80 @@ class TestCommand(TestCase):
             assignment.status, WorkflowCollectionAssignment.CLOSED_INCOMPLETE
         )
         self.assertIsNotNone(wce.finished)
+
+    def test_command__batched_updates(self):
+        """
+        Demonstrate that a batch size smaller than the number of matching
+        rows still updates every row, and that the summary reports the
+        counts and number of batches.
+        """
+        out = StringIO()
+        call_command(
+            "assignment_terminator",
+            days_old="30",
+            type="SURVEY",
+            batch_size=1,
+            stdout=out,
+        )
+
+        self.assertEqual(
+            WorkflowCollectionAssignment.objects.filter(
+                status=WorkflowCollectionAssignment.CLOSED_INCOMPLETE
+            ).count(),
+            1,
+        )
+        self.assertEqual(
+            WorkflowCollectionAssignment.objects.filter(
+                status=WorkflowCollectionAssignment.CLOSED_COMPLETE
+            ).count(),
+            3,
+        )
+        self.assertIn(
+            "1 WorkflowCollectionAssignments changed to CLOSED_COMPLETE (1 batches",
+            out.getvalue(),
+        )
+        self.assertIn(
+            "1 WorkflowCollectionAssignments changed to CLOSED_INCOMPLETE (1 batches",
+            out.getvalue(),
+        )
+        self.assertIn(
+            "1 WorkflowCollectionEngagements changed to finished (1 batches",
+            out.getvalue(),
+        )
+
+    def test_command__constant_queries_per_batch(self):
+        """
+        Demonstrate that the number of queries does not grow with the
+        number of rows being updated when they fit in a single batch.
+        """
+        for _ in range(5):
+            user = UserFactory()
+            WorkflowCollectionAssignmentFactory(
+                workflow_collection=self.workflow_collection,
+                user=user,
+                engagement=WorkflowCollectionEngagementFactory(
+                    workflow_collection=self.workflow_collection,
+                    user=user,
+                    started=timezone.now() - timedelta(days=300),
+                    finished=None,
+                ),
+                start=timezone.now() - timedelta(days=300),
+                status=WorkflowCollectionAssignment.IN_PROGRESS,
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            call_command(
+                "assignment_terminator",
+                days_old="30",
+                type="SURVEY",
+                stdout=StringIO(),
+            )
+
+        # Each of the three jobs runs one SELECT and one UPDATE for its only
+        # batch, then one SELECT which finds nothing left to claim.
+        statements = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith(("SELECT", "UPDATE"))
+        ]
+        self.assertEqual(len(statements), 9)
@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from django_workflow_system.api.urls.users import user_endpoints
+from django_workflow_system.api.urls.workflows import workflow_endpoints
+from django_workflow_system.models import (
+    WorkflowCollection,
+    WorkflowCollectionEngagement,
+)
+from django_workflow_system.utils.benchmarks import (
+    RENDERER_ENDPOINTS,
+    compare_results,
+    percentile,
+)
+
+SMALL_DATASET = [
+    "--collections=2",
+    "--workflows=2",
+    "--steps=2",
+    "--inputs=2",
+    "--users=2",
+    "--engagements=3",
+    "--runs=2",
+]
+
+
+class TestCommand(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, "results.json")
+        # The bundle endpoint stores archives in the default storage.
+        settings_override = override_settings(MEDIA_ROOT=self.directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_command(self, *args):
+        call_command("benchmark_endpoints", *SMALL_DATASET, *args, stdout=StringIO())
+
+    def test_measures_every_endpoint(self):
+        self.run_command(f"--output={self.output}")
+        with open(self.output) as output_file:
+            report = json.load(output_file)
+
+        self.assertEqual(report["parameters"]["collections"], 2)
+        self.assertEqual(
+            set(report["results"]),
+            {pattern.name for pattern in user_endpoints + workflow_endpoints},
+        )
+        for url_name, result in report["results"].items():
+            with self.subTest(url_name=url_name):
+                self.assertEqual(result["status"], 200)
+                self.assertEqual(result["runs"], 2)
+                self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+
+        # The dataset is rolled back once it has been measured.
+        self.assertFalse(WorkflowCollection.objects.exists())
+        self.assertFalse(WorkflowCollectionEngagement.objects.exists())
+
+    def test_renderers(self):
+        self.run_command(f"--output={self.output}", "--renderers")
+        with open(self.output) as output_file:
+            report = json.load(output_file)
+
+        self.assertEqual(
+            set(report["renderers"]),
+            {url_name for url_name, params in RENDERER_ENDPOINTS},
+        )
+        for url_name, result in report["renderers"].items():
+            with self.subTest(url_name=url_name):
+                self.assertGreater(result["bytes"], 0)
+                for name in ("drf", "workflow"):
+                    self.assertEqual(result[name]["render"]["runs"], 2)
+                    self.assertEqual(result[name]["parse"]["runs"], 2)
+
+    def test_compare_fails_on_regression(self):
+        self.run_command(f"--output={self.output}")
+        with open(self.output) as output_file:
+            report = json.load(output_file)
+        for result in report["results"].values():
+            result["queries"] = 0
+        with open(self.output, "w") as output_file:
+            json.dump(report, output_file)
+
+        with self.assertRaises(CommandError):
+            self.run_command(f"--compare={self.output}", "--threshold=100000")
+
+
+class TestCompareResults(TestCase):
+    def result(self, queries=3, p90_ms=10.0, status=200):
+        return {"queries": queries, "p90_ms": p90_ms, "status": status}
+
+    def test_within_threshold(self):
+        self.assertEqual(
+            compare_results(
+                {"workflows": self.result()},
+                {"workflows": self.result(p90_ms=11.9)},
+                threshold=20,
+            ),
+            [],
+        )
+
+    def test_regressions(self):
+        self.assertEqual(
+            len(
+                compare_results(
+                    {"workflows": self.result(), "workflow": self.result()},
+                    {
+                        "workflows": self.result(queries=4, p90_ms=12.1),
+                        "workflow": self.result(status=500),
+                    },
+                    threshold=20,
+                )
+            ),
+            3,
+        )
+
+    def test_skipped_and_new_endpoints(self):
+        self.assertEqual(
+            compare_results(
+                {"workflow": {"skipped": True}},
+                {"workflow": self.result(), "workflows": self.result()},
+            ),
+            [],
+        )
+
+    def test_percentile(self):
+        timings = list(range(1, 101))
+        self.assertEqual(percentile(timings, 50), 50)
+        self.assertEqual(percentile(timings, 99), 99)
+        self.assertEqual(percentile([7], 90), 7)
@@ -0,0 +1,90 @@
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIRequestFactory
+
+from django_workflow_system.api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionFactory,
+    WorkflowFactory,
+    WorkflowStepFactory,
+)
+from django_workflow_system.api.views.workflows import WorkflowCollectionBundleView
+from django_workflow_system.tests.utils import commit_immediately
+from django_workflow_system.utils.bundles import CollectionBundle
+
+
+class TestCommand(TestCase):
+    def setUp(self):
+        commit_immediately(self)
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+
+        workflow = WorkflowFactory()
+        WorkflowStepFactory(workflow=workflow, workflowsteptext_set=[{}])
+        self.workflow_collection = WorkflowCollectionFactory(workflow_set=[workflow])
+        self.inactive_collection = WorkflowCollectionFactory(active=False)
+
+    def _call(self, *args):
+        out = StringIO()
+        call_command(
+            "build_collection_bundles",
+            "--base_url",
+            "http://testserver",
+            *args,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def _stored(self, workflow_collection):
+        directory = f"workflow_system/bundles/{workflow_collection.id}"
+        if not default_storage.exists(directory):
+            return []
+        return default_storage.listdir(directory)[1]
+
+    def test_command__bundles_active_collections(self):
+        user = UserFactory()
+        output = self._call()
+        self.assertIn(self.workflow_collection.code, output)
+        self.assertEqual(len(self._stored(self.workflow_collection)), 1)
+        self.assertEqual(self._stored(self.inactive_collection), [])
+
+        # The endpoint serves the stored bundle to clients on the same host,
+        # without building it.
+        request = APIRequestFactory().get("/")
+        request.user = user
+        with mock.patch.object(
+            CollectionBundle, "build", side_effect=AssertionError
+        ) as build:
+            response = WorkflowCollectionBundleView.as_view()(
+                request, self.workflow_collection.id
+            )
+        build.assert_not_called()
+        content_version = response["ETag"].strip('"')
+        self.assertEqual(
+            self._stored(self.workflow_collection), [f"{content_version}.zip"]
+        )
+
+    def test_command__bundles_given_collections(self):
+        self._call("--collection", str(self.inactive_collection.id))
+        self.assertEqual(len(self._stored(self.inactive_collection)), 1)
+        self.assertEqual(self._stored(self.workflow_collection), [])
+
+    def test_command__unknown_collection(self):
+        self._call(
+            "--collection",
+            str(self.inactive_collection.id),
+            "--collection",
+            "4f84f799-9cc5-43d3-0000-24840b7eb8ce",
+        )
+        self.assertEqual(self._stored(self.inactive_collection), [])
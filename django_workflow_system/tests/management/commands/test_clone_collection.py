@@ -0,0 +1,150 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_workflow_system.api.tests.factories import (
+    WorkflowCollectionFactory,
+    WorkflowFactory,
+    WorkflowMetadataFactory,
+    WorkflowStepFactory,
+)
+from django_workflow_system.models import (
+    Workflow,
+    WorkflowCollection,
+    WorkflowStepDependencyDetail,
+    WorkflowStepDependencyGroup,
+    WorkflowStepText,
+)
+from django_workflow_system.utils.cloning import clone_collection
+
+
+class TestCommand(TestCase):
+    def setUp(self):
+        self.metadata = WorkflowMetadataFactory()
+        self.workflows = [WorkflowFactory() for _ in range(2)]
+        self.steps = {}
+        for workflow in self.workflows:
+            workflow.metadata.add(self.metadata)
+            for order in (1, 2):
+                step = WorkflowStepFactory(workflow=workflow, order=order)
+                step.metadata.add(self.metadata)
+                WorkflowStepText.objects.create(
+                    workflow_step=step, ui_identifier="body", text=f"{step.code} text"
+                )
+                self.steps[workflow.id, order] = step
+
+        self.workflow_collection = WorkflowCollectionFactory(
+            workflow_set=self.workflows, metadata=[self.metadata]
+        )
+        group = WorkflowStepDependencyGroup.objects.create(
+            workflow_collection=self.workflow_collection,
+            workflow_step=self.steps[self.workflows[1].id, 1],
+        )
+        WorkflowStepDependencyDetail.objects.create(
+            dependency_group=group,
+            dependency_step=self.steps[self.workflows[0].id, 2],
+            required_response={"type": "array"},
+        )
+
+    def test_command(self):
+        out = StringIO()
+        call_command(
+            "clone_collection",
+            "--collection",
+            str(self.workflow_collection.id),
+            stdout=out,
+        )
+
+        new_collection = WorkflowCollection.objects.get(
+            code=f"{self.workflow_collection.code}_copy"
+        )
+        self.assertIn(str(new_collection.id), out.getvalue())
+        self.assertEqual(new_collection.version, 1)
+        self.assertEqual(new_collection.name, f"{self.workflow_collection.name} (copy)")
+        # A shallow copy links to the same workflows and steps.
+        self.assertEqual(
+            list(
+                new_collection.workflowcollectionmember_set.order_by(
+                    "order"
+                ).values_list("workflow", flat=True)
+            ),
+            [workflow.id for workflow in self.workflows],
+        )
+        group = new_collection.workflowstepdependencygroup_set.get()
+        self.assertEqual(group.workflow_step, self.steps[self.workflows[1].id, 1])
+        self.assertEqual(
+            group.workflowstepdependencydetail_set.get().dependency_step,
+            self.steps[self.workflows[0].id, 2],
+        )
+        self.assertEqual(list(new_collection.metadata.all()), [self.metadata])
+        self.assertEqual(Workflow.objects.count(), 2)
+
+    def test_command__deep(self):
+        call_command(
+            "clone_collection",
+            "--collection",
+            str(self.workflow_collection.id),
+            "--deep",
+            stdout=StringIO(),
+        )
+        # Copying again picks the next free code.
+        call_command(
+            "clone_collection",
+            "--collection",
+            str(self.workflow_collection.id),
+            "--deep",
+            stdout=StringIO(),
+        )
+
+        new_collection = WorkflowCollection.objects.get(
+            code=f"{self.workflow_collection.code}_copy_1"
+        )
+        new_workflows = [
+            member.workflow
+            for member in new_collection.workflowcollectionmember_set.order_by("order")
+        ]
+        self.assertEqual(
+            [workflow.code for workflow in new_workflows],
+            [f"{workflow.code}_copy_1" for workflow in self.workflows],
+        )
+        for old_workflow, new_workflow in zip(self.workflows, new_workflows):
+            self.assertEqual(list(new_workflow.metadata.all()), [self.metadata])
+            for old_step in old_workflow.workflowstep_set.all():
+                new_step = new_workflow.workflowstep_set.get(code=old_step.code)
+                self.assertEqual(new_step.order, old_step.order)
+                self.assertEqual(list(new_step.metadata.all()), [self.metadata])
+                self.assertEqual(
+                    new_step.workflowsteptext_set.get().text, f"{old_step.code} text"
+                )
+
+        group = new_collection.workflowstepdependencygroup_set.get()
+        self.assertEqual(group.workflow_step.workflow, new_workflows[1])
+        self.assertEqual(group.workflow_step.order, 1)
+        dependency_step = group.workflowstepdependencydetail_set.get().dependency_step
+        self.assertEqual(dependency_step.workflow, new_workflows[0])
+        self.assertEqual(dependency_step.order, 2)
+
+    def test_clone_collection__constant_queries(self):
+        with CaptureQueriesContext(connection) as small:
+            clone_collection(self.workflow_collection, deep=True)
+
+        for _ in range(3):
+            workflow = WorkflowFactory()
+            for order in (1, 2, 3):
+                WorkflowStepFactory(workflow=workflow, order=order)
+            self.workflow_collection.workflowcollectionmember_set.create(
+                workflow=workflow,
+                order=self.workflow_collection.workflowcollectionmember_set.count() + 1,
+            )
+        with CaptureQueriesContext(connection) as large:
+            clone_collection(self.workflow_collection, deep=True)
+
+        self.assertEqual(len(large), len(small))
+
+    def test_command__unknown_collection(self):
+        call_command("clone_collection", "--collection", "nope", stdout=StringIO())
+
+        self.assertEqual(WorkflowCollection.objects.count(), 1)
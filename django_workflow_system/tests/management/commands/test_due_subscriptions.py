@@ -0,0 +1,67 @@
+import json
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from django_workflow_system.api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionFactory,
+    WorkflowCollectionSubscriptionFactory,
+    WorkflowCollectionSubscriptionScheduleFactory,
+)
+from django_workflow_system.models import WorkflowCollectionSubscriptionSchedule
+
+
+class TestCommand(TestCase):
+    def setUp(self):
+        self.workflow_collection = WorkflowCollectionFactory()
+        self.subscriptions = [
+            WorkflowCollectionSubscriptionFactory(
+                workflow_collection=self.workflow_collection, user=UserFactory()
+            )
+            for _ in range(3)
+        ]
+        self.schedules = [
+            WorkflowCollectionSubscriptionScheduleFactory(
+                workflow_collection_subscription=subscription
+            )
+            for subscription in self.subscriptions
+        ]
+        # Make every schedule due.
+        WorkflowCollectionSubscriptionSchedule.objects.update(
+            next_fire_at=timezone.now() - timedelta(minutes=5)
+        )
+
+    def _call(self, *args):
+        out = StringIO()
+        call_command("due_subscriptions", *args, stdout=out)
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_command__hands_out_due_schedules_once(self):
+        due = self._call("--batch_size", "2")
+        self.assertEqual(
+            {entry["schedule"] for entry in due},
+            {str(schedule.id) for schedule in self.schedules},
+        )
+
+        # Every schedule was advanced past now, so nothing is due anymore.
+        now = timezone.now()
+        for schedule in WorkflowCollectionSubscriptionSchedule.objects.all():
+            self.assertGreater(schedule.next_fire_at, now)
+        self.assertEqual(self._call(), [])
+
+    def test_command__skips_inactive_and_future_schedules(self):
+        self.subscriptions[0].active = False
+        self.subscriptions[0].save()
+        WorkflowCollectionSubscriptionSchedule.objects.filter(
+            pk=self.schedules[1].pk
+        ).update(next_fire_at=timezone.now() + timedelta(days=1))
+
+        due = self._call()
+        self.assertEqual(len(due), 1)
+        self.assertEqual(due[0]["schedule"], str(self.schedules[2].id))
+        self.assertEqual(due[0]["subscription"], str(self.subscriptions[2].id))
+        self.assertEqual(due[0]["user"], str(self.subscriptions[2].user.id))
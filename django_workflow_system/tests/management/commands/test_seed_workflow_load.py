@@ -0,0 +1,139 @@
+from contextlib import redirect_stdout
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+
+from django_workflow_system.models import (
+    WorkflowCollection,
+    WorkflowCollectionDependency,
+    WorkflowCollectionEngagement,
+    WorkflowCollectionEngagementDetail,
+    WorkflowMetadata,
+    WorkflowStepUserInput,
+    WorkflowStepUserInputType,
+)
+from django_workflow_system.utils.collection_dependencies import get_dependency_graph
+
+SMALL_LOAD = {
+    "users": 5,
+    "collections": 4,
+    "workflows": 2,
+    "steps": 3,
+    "inputs": 2,
+    "engagements": 3,
+    "submissions": 2,
+    "metadata": 20,
+    "dependencies": 3,
+    "batch_size": 2,
+    "date": "2021-06-01",
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+class TestCommand(TestCase):
+    def seed(self, **options):
+        call_command(
+            "seed_workflow_load", stdout=StringIO(), **{**SMALL_LOAD, **options}
+        )
+
+    def snapshot(self, **options):
+        """Seed the database, and return what was created without keeping it."""
+        try:
+            with transaction.atomic():
+                self.seed(**options)
+                snapshot = (
+                    sorted(WorkflowCollection.objects.values_list("id", "ordered")),
+                    sorted(
+                        WorkflowCollectionEngagementDetail.objects.values_list(
+                            "id", "started", "user_responses"
+                        ),
+                        key=lambda detail: detail[0],
+                    ),
+                )
+                raise Rollback
+        except Rollback:
+            return snapshot
+
+    def test_volumes(self):
+        self.seed()
+
+        users = get_user_model().objects.filter(
+            username__startswith="synthetic_0_user_"
+        )
+        self.assertEqual(users.count(), 5)
+        self.assertEqual(WorkflowCollection.objects.count(), 4)
+        self.assertEqual(WorkflowCollectionEngagement.objects.count(), 15)
+        self.assertEqual(WorkflowCollectionDependency.objects.count(), 3)
+        self.assertEqual(WorkflowMetadata.objects.count(), 20)
+        self.assertTrue(WorkflowMetadata.objects.filter(parent_group=None).exists())
+        self.assertTrue(WorkflowMetadata.objects.exclude(parent_group=None).exists())
+
+        # Only the latest engagement of each user is left open.
+        self.assertEqual(
+            WorkflowCollectionEngagement.objects.filter(finished=None).count(), 5
+        )
+
+    def test_responses(self):
+        self.seed()
+
+        self.assertEqual(
+            set(WorkflowStepUserInput.objects.values_list("type", flat=True)),
+            set(WorkflowStepUserInputType.objects.values_list("id", flat=True)),
+        )
+        inputs = {
+            str(user_input.id): user_input
+            for user_input in WorkflowStepUserInput.objects.all()
+        }
+        for detail in WorkflowCollectionEngagementDetail.objects.all():
+            self.assertEqual(len(detail.user_responses), 2)
+            for response in detail.user_responses:
+                for answer in response["inputs"]:
+                    self.assertEqual(
+                        answer["stepInputUIIdentifier"],
+                        inputs[answer["stepInputID"]].ui_identifier,
+                    )
+                    self.assertTrue(answer["is_valid"])
+
+    def test_dependencies_are_acyclic(self):
+        self.seed()
+
+        graph = get_dependency_graph()
+        self.assertEqual(graph.cyclic, set())
+        self.assertEqual(
+            sum(len(targets) for targets in graph.dependencies.values()), 3
+        )
+
+    def test_deterministic(self):
+        self.assertEqual(self.snapshot(), self.snapshot())
+        self.assertNotEqual(self.snapshot(), self.snapshot(seed=1))
+
+    def test_rerun(self):
+        self.seed()
+        counts = (
+            get_user_model().objects.count(),
+            WorkflowCollection.objects.count(),
+            WorkflowMetadata.objects.count(),
+        )
+
+        output = StringIO()
+        with redirect_stdout(output):
+            self.seed()
+        self.assertIn("already holds data seeded with --seed 0", output.getvalue())
+        self.assertEqual(
+            counts,
+            (
+                get_user_model().objects.count(),
+                WorkflowCollection.objects.count(),
+                WorkflowMetadata.objects.count(),
+            ),
+        )
+
+        # Another seed adds a second dataset alongside the first.
+        self.seed(seed=1)
+        self.assertEqual(WorkflowCollection.objects.count(), 8)
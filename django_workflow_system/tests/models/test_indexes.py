@@ -0,0 +1,107 @@
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from ...api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionEngagementFactory,
+    WorkflowCollectionFactory,
+    WorkflowFactory,
+    WorkflowStepFactory,
+)
+from ...models import (
+    WorkflowCollectionAssignment,
+    WorkflowCollectionEngagement,
+    WorkflowCollectionEngagementDetail,
+    WorkflowCollectionRecommendation,
+)
+
+
+@skipUnless(connection.vendor == "sqlite", "Query plans are checked on SQLite.")
+class TestIndexes(TestCase):
+    """Check the hot queries are planned with the indexes made for them."""
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.step = WorkflowStepFactory(workflow=WorkflowFactory(), order=1)
+        self.workflow_collection = WorkflowCollectionFactory()
+        self.engagement = WorkflowCollectionEngagementFactory(
+            workflow_collection=self.workflow_collection, user=self.user
+        )
+        self.now = timezone.now()
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(f"INDEX {index_name}", plan)
+
+    def test_open_engagements(self):
+        self.assertUsesIndex(
+            WorkflowCollectionEngagement.objects.filter(
+                user=self.user, finished=None, started__gte=self.now - timedelta(7)
+            ),
+            "engagement_open_user_idx",
+        )
+
+    def test_engagements_of_collection(self):
+        # Engagement validation and the engagement serializer look for an
+        # open engagement of the same collection.
+        self.assertUsesIndex(
+            WorkflowCollectionEngagement.objects.filter(
+                user=self.user,
+                workflow_collection=self.workflow_collection,
+                finished__isnull=True,
+            )
+            .exclude(pk=self.engagement.pk)
+            .order_by(),
+            "engagement_user_coll_idx",
+        )
+
+    def test_completed_collections(self):
+        # get_completed_collection_ids
+        self.assertUsesIndex(
+            WorkflowCollectionEngagement.objects.filter(
+                user=self.user, finished__isnull=False
+            )
+            .order_by()
+            .values_list("workflow_collection_id", flat=True),
+            "engagement_user_coll_idx",
+        )
+
+    def test_finished_details(self):
+        self.assertUsesIndex(
+            WorkflowCollectionEngagementDetail.objects.filter(
+                workflow_collection_engagement=self.engagement, finished__isnull=False
+            ),
+            "engagement_detail_done_idx",
+        )
+        self.assertUsesIndex(
+            WorkflowCollectionEngagementDetail.objects.filter(
+                step=self.step, finished__isnull=True
+            ),
+            "engagement_detail_step_idx",
+        )
+
+    def test_stale_assignments(self):
+        # The assignment_terminator command's filter.
+        self.assertUsesIndex(
+            WorkflowCollectionAssignment.objects.filter(
+                workflow_collection__category__in=["SURVEY"],
+                start__lte=self.now - timedelta(days=7),
+                status__in=(
+                    WorkflowCollectionAssignment.ASSIGNED,
+                    WorkflowCollectionAssignment.IN_PROGRESS,
+                ),
+            ),
+            "assignment_status_start_idx",
+        )
+
+    def test_active_recommendations(self):
+        self.assertUsesIndex(
+            WorkflowCollectionRecommendation.objects.filter(
+                user=self.user, start__lte=self.now
+            ),
+            "recommendation_window_idx",
+        )
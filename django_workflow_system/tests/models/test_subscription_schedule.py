@@ -0,0 +1,149 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ...api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionFactory,
+    WorkflowCollectionSubscriptionFactory,
+)
+from ...models import WorkflowCollectionSubscriptionSchedule
+from ...utils.subscription_schedules import due_subscription_schedules
+
+UTC = datetime.timezone.utc
+
+
+class TestWorkflowCollectionSubscriptionSchedule(TestCase):
+    def setUp(self):
+        self.subscription = WorkflowCollectionSubscriptionFactory(
+            workflow_collection=WorkflowCollectionFactory(),
+            user=UserFactory(),
+        )
+        # Wednesday, 2021-11-03
+        self.anchor = datetime.datetime(2021, 11, 3, 9, 0, tzinfo=UTC)
+
+    def _schedule(self, **kwargs):
+        schedule = WorkflowCollectionSubscriptionSchedule(
+            workflow_collection_subscription=self.subscription,
+            time_of_day=datetime.time(12, 0),
+            **kwargs,
+        )
+        schedule.created_date = self.anchor
+        return schedule
+
+    def test_next_fire_at__later_the_same_day(self):
+        schedule = self._schedule(
+            day_of_week=WorkflowCollectionSubscriptionSchedule.WEDNESDAY
+        )
+        self.assertEqual(
+            schedule.get_next_fire_at(self.anchor),
+            datetime.datetime(2021, 11, 3, 12, 0, tzinfo=UTC),
+        )
+
+    def test_next_fire_at__already_passed_this_week(self):
+        schedule = self._schedule(
+            day_of_week=WorkflowCollectionSubscriptionSchedule.MONDAY
+        )
+        self.assertEqual(
+            schedule.get_next_fire_at(self.anchor),
+            datetime.datetime(2021, 11, 8, 12, 0, tzinfo=UTC),
+        )
+
+    def test_next_fire_at__is_strictly_after(self):
+        schedule = self._schedule(
+            day_of_week=WorkflowCollectionSubscriptionSchedule.WEDNESDAY
+        )
+        self.assertEqual(
+            schedule.get_next_fire_at(
+                datetime.datetime(2021, 11, 3, 12, 0, tzinfo=UTC)
+            ),
+            datetime.datetime(2021, 11, 10, 12, 0, tzinfo=UTC),
+        )
+
+    def test_next_fire_at__weekly_interval(self):
+        schedule = self._schedule(
+            day_of_week=WorkflowCollectionSubscriptionSchedule.FRIDAY,
+            weekly_interval=2,
+        )
+        # Off-interval weeks are skipped relative to the week the schedule was created.
+        self.assertEqual(
+            schedule.get_next_fire_at(datetime.datetime(2021, 11, 6, tzinfo=UTC)),
+            datetime.datetime(2021, 11, 19, 12, 0, tzinfo=UTC),
+        )
+        self.assertEqual(
+            schedule.get_next_fire_at(datetime.datetime(2021, 11, 10, tzinfo=UTC)),
+            datetime.datetime(2021, 11, 19, 12, 0, tzinfo=UTC),
+        )
+        self.assertEqual(
+            schedule.get_next_fire_at(datetime.datetime(2021, 11, 16, tzinfo=UTC)),
+            datetime.datetime(2021, 11, 19, 12, 0, tzinfo=UTC),
+        )
+
+    def test_next_fire_at__converts_to_utc(self):
+        schedule = self._schedule(
+            day_of_week=WorkflowCollectionSubscriptionSchedule.WEDNESDAY
+        )
+        eastern = datetime.timezone(datetime.timedelta(hours=-5))
+        self.assertEqual(
+            schedule.get_next_fire_at(
+                datetime.datetime(2021, 11, 3, 6, 0, tzinfo=eastern)
+            ),
+            datetime.datetime(2021, 11, 3, 12, 0, tzinfo=UTC),
+        )
+
+    def test_save__sets_next_fire_at(self):
+        schedule = WorkflowCollectionSubscriptionSchedule.objects.create(
+            workflow_collection_subscription=self.subscription,
+            time_of_day="12:00:00",
+            day_of_week=WorkflowCollectionSubscriptionSchedule.MONDAY,
+        )
+        self.assertIsNotNone(schedule.next_fire_at)
+        self.assertEqual(schedule.next_fire_at.weekday(), 0)
+        self.assertEqual(schedule.next_fire_at.time(), datetime.time(12, 0))
+
+    def test_save__keeps_next_fire_at_unless_schedule_changes(self):
+        schedule = WorkflowCollectionSubscriptionSchedule.objects.create(
+            workflow_collection_subscription=self.subscription,
+            time_of_day="12:00:00",
+            day_of_week=WorkflowCollectionSubscriptionSchedule.MONDAY,
+        )
+        due = datetime.datetime(2021, 11, 1, 12, 0, tzinfo=UTC)
+        WorkflowCollectionSubscriptionSchedule.objects.filter(pk=schedule.pk).update(
+            next_fire_at=due
+        )
+
+        # An unrelated save leaves a due notification due.
+        schedule = WorkflowCollectionSubscriptionSchedule.objects.get(pk=schedule.pk)
+        schedule.save()
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.next_fire_at, due)
+
+        # Changing when it fires recomputes it.
+        schedule.day_of_week = WorkflowCollectionSubscriptionSchedule.FRIDAY
+        schedule.save()
+        schedule.refresh_from_db()
+        self.assertGreater(schedule.next_fire_at, due)
+        self.assertEqual(schedule.next_fire_at.weekday(), 4)
+
+    def test_reactivating_subscription_skips_missed_notifications(self):
+        schedule = WorkflowCollectionSubscriptionSchedule.objects.create(
+            workflow_collection_subscription=self.subscription,
+            time_of_day="12:00:00",
+            day_of_week=WorkflowCollectionSubscriptionSchedule.MONDAY,
+        )
+        self.subscription.active = False
+        self.subscription.save()
+        missed = datetime.datetime(2021, 11, 1, 12, 0, tzinfo=UTC)
+        WorkflowCollectionSubscriptionSchedule.objects.filter(pk=schedule.pk).update(
+            next_fire_at=missed
+        )
+
+        self.subscription.active = True
+        self.subscription.save()
+
+        schedule.refresh_from_db()
+        self.assertGreater(schedule.next_fire_at, timezone.now())
+        self.assertEqual(schedule.next_fire_at.weekday(), 0)
+        self.assertEqual(schedule.next_fire_at.time(), datetime.time(12, 0))
+        self.assertFalse(list(due_subscription_schedules()))
@@ -0,0 +1,90 @@
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from django_workflow_system.api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionEngagementFactory,
+    WorkflowCollectionFactory,
+    WorkflowFactory,
+    WorkflowStepFactory,
+)
+
+PROFILING_MIDDLEWARE = [
+    *settings.MIDDLEWARE,
+    "django_workflow_system.middleware.ProfilingMiddleware",
+]
+
+
+def profiling(**options):
+    return override_settings(
+        MIDDLEWARE=PROFILING_MIDDLEWARE,
+        DJANGO_WORKFLOW_SYSTEM={
+            **settings.DJANGO_WORKFLOW_SYSTEM,
+            "PROFILING": options,
+        },
+    )
+
+
+@profiling()
+class TestProfilingMiddleware(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_login(self.user)
+        workflow = WorkflowFactory()
+        WorkflowStepFactory(workflow=workflow, order=1)
+        self.engagement = WorkflowCollectionEngagementFactory(
+            workflow_collection=WorkflowCollectionFactory(workflow_set=[workflow]),
+            user=self.user,
+        )
+        self.url = reverse(
+            "user-workflow-collection-engagement", kwargs={"id": self.engagement.id}
+        )
+
+    def test_profile_is_logged(self):
+        with self.assertLogs("django_workflow_system.middleware", "INFO") as logs:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        (record,) = logs.records
+        self.assertEqual(record.event_code, "REQUEST_PROFILE")
+        self.assertEqual(record.user__id, self.user.id)
+        self.assertEqual(record.request__path, self.url)
+        self.assertEqual(record.request__method, "GET")
+        self.assertEqual(record.status_code, 200)
+        self.assertGreater(record.db_queries, 0)
+        self.assertGreaterEqual(record.wall_ms, record.db_ms)
+        self.assertGreater(record.state_computations, 0)
+        self.assertGreater(record.cache_hits + record.cache_misses, 0)
+
+    def test_server_timing_header(self):
+        response = self.client.get(self.url)
+
+        timings = dict(
+            timing.strip().split(";", 1)
+            for timing in response["Server-Timing"].split(",")
+        )
+        self.assertEqual(set(timings), {"total", "db", "state", "jsonschema", "cache"})
+        self.assertTrue(timings["total"].startswith("dur="))
+
+    @profiling(SERVER_TIMING=False)
+    def test_server_timing_can_be_disabled(self):
+        with self.assertLogs("django_workflow_system.middleware", "INFO"):
+            response = self.client.get(self.url)
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    @profiling(SAMPLE_RATE=0)
+    def test_unsampled_requests_are_not_profiled(self):
+        with self.assertRaises(AssertionError):
+            with self.assertLogs("django_workflow_system.middleware", "INFO"):
+                response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    def test_other_views_are_not_profiled(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+        with self.assertRaises(AssertionError):
+            with self.assertLogs("django_workflow_system.middleware", "INFO"):
+                response = self.client.get(reverse("admin:index"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("Server-Timing"))
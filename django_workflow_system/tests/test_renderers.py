@@ -0,0 +1,133 @@
+import datetime
+import decimal
+import io
+import math
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from ..api import parsers, renderers
+from ..api.parsers import WorkflowJSONParser
+from ..api.renderers import WorkflowJSONRenderer
+
+
+class TestWorkflowJSONRenderer(SimpleTestCase):
+    def setUp(self):
+        self.data = ReturnDict(
+            {
+                "id": uuid.uuid4(),
+                "started": timezone.now(),
+                "naive": datetime.datetime(2021, 3, 9, 19, 34, 51, 517701),
+                "date": datetime.date(2021, 3, 9),
+                "time": datetime.time(9, 30),
+                "duration": datetime.timedelta(minutes=5),
+                "error": ErrorDetail("Invalid value", "invalid"),
+                "lazy": gettext_lazy("Not found."),
+                "text": "Line\u2028separator é",
+                "user_responses": [{"inputs": [{"value": 1.5, "is_valid": True}]}],
+                "finished": None,
+            },
+            serializer=None,
+        )
+
+    def test_matches_drf(self):
+        for backend in (renderers.orjson, None):
+            with self.subTest(orjson=backend is not None):
+                with mock.patch.object(renderers, "orjson", backend):
+                    self.assertEqual(
+                        WorkflowJSONRenderer().render(self.data),
+                        JSONRenderer().render(self.data),
+                    )
+
+    def test_indent(self):
+        self.assertEqual(
+            WorkflowJSONRenderer().render(self.data, "application/json; indent=4", {}),
+            JSONRenderer().render(self.data, "application/json; indent=4", {}),
+        )
+
+    def test_fallback(self):
+        """Data orjson can't render is rendered by the standard library."""
+        data = {1: "one", "two": 2}
+        self.assertEqual(
+            WorkflowJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+
+        with self.assertRaises(ValueError):
+            WorkflowJSONRenderer().render(
+                {"time": datetime.time(9, 30, tzinfo=datetime.timezone.utc)}
+            )
+
+    def test_non_finite_floats(self):
+        for backend in (renderers.orjson, None):
+            for value in (math.nan, -math.inf, decimal.Decimal("NaN"), [math.inf]):
+                with self.subTest(orjson=backend is not None, value=value):
+                    with mock.patch.object(renderers, "orjson", backend):
+                        with self.assertRaises(ValueError):
+                            WorkflowJSONRenderer().render({"value": value})
+
+                        renderer, drf_renderer = WorkflowJSONRenderer(), JSONRenderer()
+                        renderer.strict = drf_renderer.strict = False
+                        self.assertEqual(
+                            renderer.render({"value": value}),
+                            drf_renderer.render({"value": value}),
+                        )
+
+    def test_none(self):
+        self.assertEqual(WorkflowJSONRenderer().render(None), b"")
+
+
+class TestWorkflowJSONParser(SimpleTestCase):
+    def parse(self, content, **parser_context):
+        return WorkflowJSONParser().parse(
+            io.BytesIO(content), parser_context=parser_context
+        )
+
+    def test_matches_drf(self):
+        content = '{"user_responses": [{"answer": "café", "value": 1.5}]}'.encode()
+        for backend in (parsers.orjson, None):
+            with self.subTest(orjson=backend is not None):
+                with mock.patch.object(parsers, "orjson", backend):
+                    self.assertEqual(
+                        self.parse(content),
+                        JSONParser().parse(io.BytesIO(content)),
+                    )
+
+    def test_encoding(self):
+        content = '{"answer": "café"}'.encode("latin-1")
+        self.assertEqual(self.parse(content, encoding="latin-1"), {"answer": "café"})
+
+    def test_invalid(self):
+        for backend in (parsers.orjson, None):
+            for content in (b'{"answer": ', b'{"value": NaN}'):
+                with self.subTest(orjson=backend is not None, content=content):
+                    with mock.patch.object(parsers, "orjson", backend):
+                        with self.assertRaises(ParseError):
+                            self.parse(content)
+
+    def test_standard_library_fallback(self):
+        """Content orjson parses differently or rejects is parsed as by DRF."""
+        for content in (
+            b'{"id": 123456789012345678901234567890}',
+            b'{"id": -9223372036854775809}',
+            b'{"value": 1e400}',
+            b'{"answer": "\\ud800"}',
+        ):
+            with self.subTest(content=content):
+                self.assertEqual(
+                    self.parse(content), JSONParser().parse(io.BytesIO(content))
+                )
+        self.assertIsInstance(
+            self.parse(b'{"id": 123456789012345678901234567890}')["id"], int
+        )
+
+    def test_not_strict(self):
+        parser = WorkflowJSONParser()
+        parser.strict = False
+        self.assertTrue(math.isnan(parser.parse(io.BytesIO(b"NaN"))))
@@ -0,0 +1,13 @@
+from unittest import mock
+
+
+def commit_immediately(test_case):
+    """
+    Run on_commit callbacks as soon as they are registered, for the rest of
+    a test, as if every change were committed straight away.
+    """
+    patcher = mock.patch(
+        "django.db.transaction.on_commit", side_effect=lambda function: function()
+    )
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
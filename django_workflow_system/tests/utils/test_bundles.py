@@ -0,0 +1,46 @@
+import hashlib
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, override_settings
+
+from ...models import WorkflowStepImage
+from ...utils.bundles import get_media_hash
+
+
+class TestMediaHash(SimpleTestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+
+        self.field_file = WorkflowStepImage().url
+        self.field_file.name = default_storage.save("photo.png", ContentFile(b"first"))
+
+    def overwrite(self, content):
+        with open(default_storage.path(self.field_file.name), "wb") as file:
+            file.write(content)
+
+    def test_cached_until_overwritten(self):
+        self.assertEqual(
+            get_media_hash(self.field_file), hashlib.sha256(b"first").hexdigest()
+        )
+        with mock.patch.object(default_storage, "open") as storage_open:
+            get_media_hash(self.field_file)
+        storage_open.assert_not_called()
+
+        self.overwrite(b"second photo")
+        self.assertEqual(
+            get_media_hash(self.field_file),
+            hashlib.sha256(b"second photo").hexdigest(),
+        )
+
+    def test_missing_file(self):
+        default_storage.delete(self.field_file.name)
+        self.assertIsNone(get_media_hash(self.field_file))
@@ -0,0 +1,67 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+
+from ...utils.caching import (
+    bump_cache_version,
+    get_cache_version,
+    get_local_cache_version,
+    invalidate_on_commit,
+    is_invalidation_pending,
+)
+
+
+class TestCaching(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_cache_version(self):
+        version = get_cache_version("test_version")
+        self.assertEqual(get_cache_version("test_version"), version)
+
+        bump_cache_version("test_version")
+        self.assertNotEqual(get_cache_version("test_version"), version)
+
+    def test_local_cache_version(self):
+        version = get_local_cache_version("test_version")
+        self.assertEqual(get_local_cache_version("test_version"), version)
+
+        # Per-process copies are dropped after LOCAL_CACHE_TIMEOUT even when
+        # the token never changes, as with caches which aren't shared.
+        with mock.patch(
+            "django_workflow_system.utils.caching.time.time", return_value=0
+        ):
+            self.assertNotEqual(get_local_cache_version("test_version"), version)
+
+    def test_invalidate_on_commit(self):
+        """Nothing is invalidated, or cached, until the transaction commits."""
+        function = mock.Mock()
+        invalidate_on_commit(function, "test_version")
+
+        function.assert_not_called()
+        self.assertTrue(is_invalidation_pending("test_version"))
+        self.assertFalse(is_invalidation_pending("other_version"))
+        self.assertIsNone(get_local_cache_version("test_version"))
+
+        # The test's transaction is never committed, so the callback is run
+        # the way Django runs it on commit.
+        callbacks = transaction.get_connection().run_on_commit
+        callbacks.pop()[1]()
+        function.assert_called_once_with("test_version")
+        self.assertFalse(is_invalidation_pending("test_version"))
+
+    def test_invalidate_on_commit__rolled_back(self):
+        function = mock.Mock()
+        try:
+            with transaction.atomic():
+                invalidate_on_commit(function, "test_version")
+                self.assertTrue(is_invalidation_pending("test_version"))
+                raise ValueError
+        except ValueError:
+            pass
+
+        self.assertFalse(is_invalidation_pending("test_version"))
+        self.assertIsNotNone(get_local_cache_version("test_version"))
+        function.assert_not_called()
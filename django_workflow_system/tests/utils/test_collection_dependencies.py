@@ -0,0 +1,87 @@
+import time
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from ...api.tests.factories import WorkflowCollectionFactory
+from ...models import WorkflowCollectionDependency
+from ...utils.collection_dependencies import (
+    CollectionDependencyGraph,
+    get_dependency_graph,
+)
+from ...utils.caching import LOCAL_CACHE_TIMEOUT
+from . import commit_immediately
+
+
+class TestCollectionDependencyGraph(TestCase):
+    def setUp(self):
+        commit_immediately(self)
+        self.a, self.b, self.c, self.d = [WorkflowCollectionFactory() for _ in range(4)]
+        # a requires b, b requires c, a requires d
+        for source, target in ((self.a, self.b), (self.b, self.c), (self.a, self.d)):
+            WorkflowCollectionDependency.objects.create(source=source, target=target)
+
+    def test_order_and_closure(self):
+        graph = get_dependency_graph()
+
+        self.assertEqual(set(graph.order), {self.a.id, self.b.id, self.c.id, self.d.id})
+        self.assertLess(graph.order.index(self.c.id), graph.order.index(self.b.id))
+        self.assertLess(graph.order.index(self.b.id), graph.order.index(self.a.id))
+        self.assertLess(graph.order.index(self.d.id), graph.order.index(self.a.id))
+        self.assertEqual(
+            graph.requirements(self.a.id), {self.b.id, self.c.id, self.d.id}
+        )
+        self.assertEqual(graph.requirements(self.c.id), set())
+        self.assertEqual(
+            graph.missing_requirements(self.a.id, {self.c.id}), {self.b.id, self.d.id}
+        )
+
+    def test_graph_is_cached_until_dependencies_change(self):
+        graph = get_dependency_graph()
+        with self.assertNumQueries(0):
+            self.assertIs(get_dependency_graph(), graph)
+
+        dependency = WorkflowCollectionDependency.objects.create(
+            source=self.d, target=self.c
+        )
+        self.assertEqual(get_dependency_graph().requirements(self.d.id), {self.c.id})
+
+        dependency.delete()
+        self.assertEqual(get_dependency_graph().requirements(self.d.id), set())
+
+    def test_graph_expires(self):
+        """Processes which don't share the cache still reload the graph."""
+        graph = get_dependency_graph()
+        later = time.time() + LOCAL_CACHE_TIMEOUT
+        with mock.patch(
+            "django_workflow_system.utils.caching.time.time", return_value=later
+        ):
+            self.assertIsNot(get_dependency_graph(), graph)
+
+    def test_find_cycle(self):
+        graph = get_dependency_graph()
+
+        self.assertEqual(
+            graph.find_cycle(self.c.id, self.a.id),
+            [self.c.id, self.a.id, self.b.id, self.c.id],
+        )
+        self.assertIsNone(graph.find_cycle(self.d.id, self.c.id))
+
+    def test_existing_cycles_are_tolerated(self):
+        graph = CollectionDependencyGraph(
+            [(self.a.id, self.b.id), (self.b.id, self.c.id), (self.c.id, self.a.id)]
+        )
+
+        self.assertEqual(graph.order, [])
+        self.assertEqual(graph.cyclic, {self.a.id, self.b.id, self.c.id})
+        self.assertEqual(
+            graph.requirements(self.a.id), {self.a.id, self.b.id, self.c.id}
+        )
+
+    def test_long_cycles_are_rejected_on_save(self):
+        with self.assertRaisesMessage(ValidationError, "circular dependency"):
+            WorkflowCollectionDependency.objects.create(source=self.c, target=self.a)
+        self.assertFalse(
+            WorkflowCollectionDependency.objects.filter(source=self.c).exists()
+        )
@@ -0,0 +1,200 @@
+import json
+import logging
+import logging.handlers
+import os
+import pickle
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from django.test import SimpleTestCase
+
+from ...utils.log_handlers import QueueLogHandler, StructuredFormatter
+
+
+class BlockingHandler(logging.Handler):
+    """Keeps what it is given, but only once it is released."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.released = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.entered.set()
+        self.released.wait(5)
+        self.messages.append(record.getMessage())
+
+
+class BatchHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def emit_batch(self, records):
+        self.batches.append([record.getMessage() for record in records])
+
+
+class TestQueueLogHandler(SimpleTestCase):
+    def get_logger(self, handler, name=""):
+        logger = logging.getLogger(f"django_workflow_system.tests.{self.id()}{name}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        self.addCleanup(handler.close)
+        return logger
+
+    def test_file_target(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.log")
+            handler = QueueLogHandler(
+                target={"class": "logging.FileHandler", "filename": path}
+            )
+            handler.setFormatter(StructuredFormatter())
+            logger = self.get_logger(handler)
+
+            logger.info("Engagement %s", "completed", extra={"event_code": "DONE"})
+            try:
+                raise ValueError("broken")
+            except ValueError:
+                logger.exception("Failed", extra={"event_code": "FAILED"})
+            self.assertTrue(handler.flush(timeout=5))
+            handler.close()
+
+            with open(path) as log_file:
+                lines = [json.loads(line) for line in log_file]
+
+        self.assertEqual(
+            [(line["short_message"], line["event_code"]) for line in lines],
+            [("Engagement completed", "DONE"), ("Failed", "FAILED")],
+        )
+        self.assertIn("ValueError: broken", lines[1]["full_message"])
+
+    def test_socket_target(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(server.close)
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(5)
+        handler = QueueLogHandler(
+            target=logging.handlers.DatagramHandler(*server.getsockname())
+        )
+        logger = self.get_logger(handler)
+
+        logger.info("Sent", extra={"event_code": "SENT"})
+        handler.flush(timeout=5)
+
+        # DatagramHandler sends each record pickled, after a 4 byte length.
+        record = pickle.loads(server.recv(65536)[4:])
+        self.assertEqual((record["msg"], record["event_code"]), ("Sent", "SENT"))
+
+    def test_slow_target_does_not_block(self):
+        for drop, expected in (
+            ("newest", ["0", "1", "2"]),
+            ("oldest", ["0", "3", "4"]),
+        ):
+            with self.subTest(drop=drop):
+                target = BlockingHandler()
+                handler = QueueLogHandler(
+                    target=target, capacity=2, batch_size=1, drop=drop
+                )
+                logger = self.get_logger(handler, name=drop)
+
+                logger.info("0")
+                self.assertTrue(target.entered.wait(5))
+                started = time.monotonic()
+                for message in "1234":
+                    logger.info(message)
+                self.assertLess(time.monotonic() - started, 1)
+                self.assertEqual(handler.dropped, 2)
+
+                target.released.set()
+                self.assertTrue(handler.flush(timeout=5))
+                self.assertEqual(target.messages, expected)
+
+    def test_batches(self):
+        target = BatchHandler()
+        handler = QueueLogHandler(target=target, batch_size=3, flush_interval=60)
+        logger = self.get_logger(handler)
+
+        for message in "0123456":
+            logger.info(message)
+        self.assertTrue(handler.flush(timeout=5))
+
+        self.assertEqual(target.batches, [["0", "1", "2"], ["3", "4", "5"], ["6"]])
+
+    def test_sampling(self):
+        target = BatchHandler()
+        handler = QueueLogHandler(target=target, sample_rates={"NOISY": 0})
+        logger = self.get_logger(handler)
+
+        logger.info("Skipped", extra={"event_code": "NOISY"})
+        logger.warning("Kept warning", extra={"event_code": "NOISY"})
+        logger.info("Kept", extra={"event_code": "OTHER"})
+        logger.info("Kept without code")
+        handler.flush(timeout=5)
+
+        self.assertEqual(
+            sum(target.batches, []), ["Kept warning", "Kept", "Kept without code"]
+        )
+
+    def test_record_left_to_other_handlers(self):
+        """Records are prepared for the queue without changing them."""
+        target = BatchHandler()
+        handler = QueueLogHandler(target=target)
+        logger = self.get_logger(handler)
+        other = logging.handlers.BufferingHandler(capacity=10)
+        logger.addHandler(other)
+        self.addCleanup(logger.removeHandler, other)
+
+        try:
+            raise ValueError("Failed")
+        except ValueError:
+            logger.exception("Engagement %s", "failed")
+        self.assertTrue(handler.flush(timeout=5))
+
+        [record] = other.buffer
+        self.assertEqual(record.msg, "Engagement %s")
+        self.assertEqual(record.args, ("failed",))
+        self.assertIsNotNone(record.exc_info)
+        self.assertEqual(target.batches, [["Engagement failed"]])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Needs os.fork.")
+    def test_fork(self):
+        """A forked child writes its records from its own thread."""
+        target = BatchHandler()
+        handler = QueueLogHandler(target=target)
+        logger = self.get_logger(handler)
+        logger.info("Parent")
+        self.assertTrue(handler.flush(timeout=5))
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(read_fd)
+                target.batches = []
+                logger.info("Child")
+                flushed = handler.flush(timeout=5)
+                os.write(write_fd, json.dumps([flushed, target.batches]).encode())
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            result = json.loads(pipe.read())
+        os.waitpid(pid, 0)
+        self.assertEqual(result, [True, [["Child"]]])
+
+        logger.info("Parent again")
+        self.assertTrue(handler.flush(timeout=5))
+        self.assertEqual(sum(target.batches, []), ["Parent", "Parent again"])
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            QueueLogHandler(target=BatchHandler(), drop="random")
+        with self.assertRaises(ValueError):
+            QueueLogHandler(target=BatchHandler(), capacity=0)
@@ -0,0 +1,114 @@
+import logging
+
+from django.test import TestCase
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Empty, Request
+from rest_framework.test import APIRequestFactory
+
+from ...api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionEngagementDetailFactory,
+    WorkflowCollectionEngagementFactory,
+    WorkflowCollectionFactory,
+    WorkflowFactory,
+    WorkflowStepFactory,
+)
+from ...models import WorkflowCollectionEngagementDetail
+from ...utils.logging_utils import generate_extra, strip_sensitive_data
+
+
+class TestGenerateExtra(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        workflow = WorkflowFactory()
+        self.step = WorkflowStepFactory(workflow=workflow, order=1)
+        self.workflow_collection = WorkflowCollectionFactory(workflow_set=[workflow])
+        self.engagement = WorkflowCollectionEngagementFactory(
+            workflow_collection=self.workflow_collection, user=self.user
+        )
+        self.detail = WorkflowCollectionEngagementDetailFactory(
+            workflow_collection_engagement=self.engagement, step=self.step
+        )
+
+    def test_unloaded_relations_are_not_fetched(self):
+        detail = WorkflowCollectionEngagementDetail.objects.get(id=self.detail.id)
+
+        with self.assertNumQueries(0):
+            extra = dict(
+                generate_extra(
+                    event_code="TEST", workflow_collection_engagement_detail=detail
+                )
+            )
+
+        self.assertEqual(extra["event_code"], "TEST")
+        self.assertEqual(
+            extra["workflow_collection_engagement__id"], self.engagement.id
+        )
+        self.assertEqual(extra["workflow_collection_engagement_detail__id"], detail.id)
+        self.assertNotIn("workflow_collection_engagement_detail__step__code", extra)
+        self.assertNotIn("workflow_collection__id", extra)
+        self.assertNotIn("user__id", extra)
+
+    def test_loaded_relations_are_used(self):
+        detail = WorkflowCollectionEngagementDetail.objects.select_related(
+            "step",
+            "workflow_collection_engagement__user",
+            "workflow_collection_engagement__workflow_collection",
+        ).get(id=self.detail.id)
+
+        with self.assertNumQueries(0):
+            extra = dict(generate_extra(workflow_collection_engagement_detail=detail))
+
+        self.assertEqual(extra["user__id"], self.user.id)
+        self.assertEqual(extra["user__username"], self.user.username)
+        self.assertEqual(extra["workflow_collection__id"], self.workflow_collection.id)
+        self.assertEqual(
+            extra["workflow_collection__code"], self.workflow_collection.code
+        )
+        self.assertEqual(
+            extra["workflow_collection_engagement_detail__step__code"], self.step.code
+        )
+
+    def test_foreign_key_ids_are_used(self):
+        extra = dict(generate_extra(workflow_collection_engagement=self.engagement))
+
+        self.assertEqual(extra["user__id"], self.user.id)
+        self.assertEqual(extra["workflow_collection__id"], self.workflow_collection.id)
+
+    def test_built_only_when_logged(self):
+        logger = logging.getLogger("django_workflow_system.tests.logging_utils")
+        logger.setLevel(logging.WARNING)
+        extra = generate_extra(workflow_collection_engagement=self.engagement)
+
+        logger.info("Not emitted", extra=extra)
+        self.assertIsNone(extra._extra)
+
+        with self.assertLogs(logger, "WARNING") as logs:
+            logger.warning("Emitted", extra=extra)
+        self.assertEqual(
+            logs.records[0].workflow_collection_engagement__id, self.engagement.id
+        )
+
+    def test_request_body(self):
+        body = {"name": "Test", "password": "hunter2", "user_responses": [1]}
+        request = Request(
+            APIRequestFactory().post("/", body, format="json"),
+            parsers=[JSONParser()],
+        )
+
+        self.assertNotIn("request__data", generate_extra(request=request))
+        self.assertIs(request._full_data, Empty)
+
+        self.assertEqual(request.data, body)
+        self.assertEqual(
+            generate_extra(request=request)["request__data"],
+            "{'name': 'Test', 'password': '[CENSORED]', "
+            "'user_responses': '[CENSORED]'}",
+        )
+        self.assertEqual(request.data["password"], "hunter2")
+
+    def test_strip_sensitive_data(self):
+        data = {"response": {"answer": 1}, "other": [1, 2]}
+        self.assertEqual(
+            strip_sensitive_data(data), str({**data, "response": "[CENSORED]"})
+        )
@@ -0,0 +1,62 @@
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+
+from ...api.tests.factories.workflows.metadata import WorkflowMetadataFactory
+from ...utils.metadata_hierarchies import get_metadata_hierarchies, get_metadata_tree
+from . import commit_immediately
+
+
+class TestMetadataHierarchies(TestCase):
+    def setUp(self):
+        commit_immediately(self)
+        self.groups = [WorkflowMetadataFactory()]
+        for _ in range(5):
+            self.groups.append(WorkflowMetadataFactory(parent_group=self.groups[-1]))
+
+    def test_hierarchies(self):
+        """Hierarchies of any depth are resolved without walking the parents."""
+        get_metadata_tree()
+        with self.assertNumQueries(0):
+            hierarchies = get_metadata_hierarchies(self.groups[::-1])
+
+        self.assertEqual(
+            hierarchies,
+            [group.group_hierarchy for group in self.groups[::-1]],
+        )
+        self.assertEqual(len(hierarchies[0]), 6)
+
+    def test_tree_is_cached_until_metadata_changes(self):
+        tree = get_metadata_tree()
+        with self.assertNumQueries(0):
+            self.assertIs(get_metadata_tree(), tree)
+
+        group = self.groups[2]
+        group.name = "renamed"
+        group.save()
+        self.assertIsNot(get_metadata_tree(), tree)
+        self.assertEqual(get_metadata_hierarchies([self.groups[-1]])[0][2], "renamed")
+
+        group.delete()
+        self.assertIsNone(get_metadata_tree().hierarchy(self.groups[-1].id))
+
+
+class TestMetadataTreeTransactions(TestCase):
+    def test_rolled_back_change_is_not_cached(self):
+        with mock.patch(
+            "django.db.transaction.on_commit", side_effect=lambda function: function()
+        ):
+            group = WorkflowMetadataFactory(name="Original")
+        self.assertEqual(get_metadata_hierarchies([group]), [("Original",)])
+
+        try:
+            with transaction.atomic():
+                group.name = "RolledBack"
+                group.save()
+                self.assertEqual(get_metadata_hierarchies([group]), [("RolledBack",)])
+                raise ValueError
+        except ValueError:
+            pass
+
+        self.assertEqual(get_metadata_hierarchies([group]), [("Original",)])
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from ...api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionRecommendationFactory,
+)
+from ...models import WorkflowCollectionRecommendation
+from ...utils.recommendations import get_active_recommendations
+from . import commit_immediately
+
+
+class TestActiveRecommendations(TestCase):
+    def setUp(self):
+        commit_immediately(self)
+        cache.clear()
+        self.now = timezone.now()
+        self.user = UserFactory()
+        self.open_ended = WorkflowCollectionRecommendationFactory(
+            user=self.user, start=self.now - timedelta(days=3)
+        )
+        self.ending = WorkflowCollectionRecommendationFactory(
+            user=self.user,
+            start=self.now - timedelta(days=3),
+            end=self.now + timedelta(days=1),
+        )
+        self.expired = WorkflowCollectionRecommendationFactory(
+            user=self.user,
+            start=self.now - timedelta(days=3),
+            end=self.now - timedelta(days=1),
+        )
+        self.upcoming = WorkflowCollectionRecommendationFactory(
+            user=self.user, start=self.now + timedelta(days=2)
+        )
+        WorkflowCollectionRecommendationFactory(user=UserFactory())
+
+    def test_active_queryset(self):
+        self.assertEqual(
+            set(
+                WorkflowCollectionRecommendation.objects.active(self.now).filter(
+                    user=self.user
+                )
+            ),
+            {self.open_ended, self.ending},
+        )
+
+    def test_cached_until_next_boundary(self):
+        self.assertEqual(
+            set(get_active_recommendations(self.user, self.now)),
+            {self.open_ended, self.ending},
+        )
+        with self.assertNumQueries(0):
+            get_active_recommendations(self.user, self.now + timedelta(hours=23))
+
+        # `ending` has ended.
+        self.assertEqual(
+            get_active_recommendations(self.user, self.now + timedelta(days=1)),
+            [self.open_ended],
+        )
+        # `upcoming` has started.
+        self.assertEqual(
+            set(get_active_recommendations(self.user, self.now + timedelta(days=2))),
+            {self.open_ended, self.upcoming},
+        )
+
+    def test_invalidated_on_change(self):
+        get_active_recommendations(self.user, self.now)
+
+        self.ending.end = self.now - timedelta(hours=1)
+        self.ending.save()
+        self.assertEqual(
+            get_active_recommendations(self.user, self.now), [self.open_ended]
+        )
+
+        self.open_ended.delete()
+        self.assertEqual(get_active_recommendations(self.user, self.now), [])
@@ -0,0 +1,79 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from ...api.tests.factories import WorkflowFactory, WorkflowStepFactory
+from ...api.tests.factories.workflows.step import (
+    _WorkflowStepUserInputFactory,
+    _WorkflowStepUserInputTypeFactory,
+)
+from ...models import WorkflowStepUserInput, WorkflowStepUserInputType
+from ...utils.response_schemas import get_response_schema
+
+
+class TestResponseSchemas(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.step_input = _WorkflowStepUserInputFactory(
+            workflow_step=WorkflowStepFactory(workflow=WorkflowFactory()),
+            type=WorkflowStepUserInputType.objects.get(name="true_false_question"),
+            specification={
+                "label": "Is the sky blue?",
+                "inputOptions": [True, False],
+                "correctInput": True,
+                "meta": {"inputRequired": True, "correctInputRequired": True},
+            },
+        )
+
+    def test_cached_per_version(self):
+        schema = get_response_schema(self.step_input)
+        self.assertEqual(schema, self.step_input.response_schema)
+        self.assertEqual(schema["properties"]["userInput"]["const"], True)
+
+        with mock.patch.object(
+            WorkflowStepUserInput, "response_schema", new_callable=mock.PropertyMock
+        ) as response_schema:
+            self.assertEqual(get_response_schema(self.step_input), schema)
+        response_schema.assert_not_called()
+
+        # Saving the input gives it a new version, with a new schema.
+        self.step_input.specification["correctInput"] = False
+        self.step_input.save()
+        self.assertEqual(
+            get_response_schema(self.step_input)["properties"]["userInput"]["const"],
+            False,
+        )
+
+    def test_cached_per_handler_version(self):
+        """A changed handler isn't served from the cache."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        handler_path = os.path.join(directory.name, "cached_handler_question.py")
+
+        def write_handler(const):
+            with open(handler_path, "w") as file:
+                file.write(
+                    "def get_response_schema(step_input):\n"
+                    f"    return {{'const': {const!r}}}\n"
+                )
+
+        self.step_input.type = _WorkflowStepUserInputTypeFactory(
+            name="cached_handler_question",
+            json_schema=self.step_input.type.json_schema,
+        )
+        self.step_input.save()
+
+        write_handler("first")
+        with override_settings(
+            DJANGO_WORKFLOW_SYSTEM={
+                "INPUT_TYPE_RESPONSE_SCHEMA_HANDLERS": [directory.name]
+            }
+        ):
+            self.assertEqual(get_response_schema(self.step_input), {"const": "first"})
+            write_handler("second handler")
+            self.assertEqual(
+                get_response_schema(self.step_input), {"const": "second handler"}
+            )
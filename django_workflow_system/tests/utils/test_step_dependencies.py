@@ -0,0 +1,120 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from ...api.tests.factories import (
+    UserFactory,
+    WorkflowCollectionEngagementDetailFactory,
+    WorkflowCollectionEngagementFactory,
+    WorkflowCollectionFactory,
+    WorkflowFactory,
+    WorkflowStepFactory,
+)
+from ...models import (
+    WorkflowStepDependencyDetail,
+    WorkflowStepDependencyGroup,
+)
+from ...utils.step_dependencies import (
+    StepDependencyEvaluator,
+    get_step_dependency_evaluator,
+)
+from . import commit_immediately
+
+REQUIRES_YES = {
+    "type": "array",
+    "contains": {
+        "type": "object",
+        "properties": {"userInput": {"const": "Yes"}},
+        "required": ["userInput"],
+    },
+}
+
+
+def responses(answer):
+    return [{"submittedTime": "2021-07-26 18:33:06", "inputs": [{"userInput": answer}]}]
+
+
+class TestStepDependencies(TestCase):
+    def setUp(self):
+        commit_immediately(self)
+        self.user = UserFactory()
+        self.workflow = WorkflowFactory()
+        self.step_1, self.step_2, self.step_3 = [
+            WorkflowStepFactory(workflow=self.workflow, order=order)
+            for order in (1, 2, 3)
+        ]
+        self.workflow_collection = WorkflowCollectionFactory(
+            workflow_set=[self.workflow], ordered=True
+        )
+        # step_2 is only available when step_1 was answered with "Yes".
+        group = WorkflowStepDependencyGroup.objects.create(
+            workflow_collection=self.workflow_collection, workflow_step=self.step_2
+        )
+        WorkflowStepDependencyDetail.objects.create(
+            dependency_group=group,
+            dependency_step=self.step_1,
+            required_response=REQUIRES_YES,
+        )
+        self.engagement = WorkflowCollectionEngagementFactory(
+            workflow_collection=self.workflow_collection, user=self.user
+        )
+
+    def _complete_step_1(self, answer):
+        WorkflowCollectionEngagementDetailFactory(
+            workflow_collection_engagement=self.engagement,
+            step=self.step_1,
+            user_responses=responses(answer),
+            finished=timezone.now(),
+        )
+
+    def test_evaluator(self):
+        evaluator = StepDependencyEvaluator.load(self.workflow_collection.id)
+
+        self.assertTrue(evaluator.is_satisfied(self.step_1.id, {}))
+        self.assertFalse(evaluator.is_satisfied(self.step_2.id, {}))
+        self.assertFalse(
+            evaluator.is_satisfied(self.step_2.id, {self.step_1.id: responses("No")})
+        )
+        self.assertTrue(
+            evaluator.is_satisfied(self.step_2.id, {self.step_1.id: responses("Yes")})
+        )
+
+    def test_evaluator__schema_draft(self):
+        """Required responses are checked against the draft they declare."""
+        # Draft 4 has no `contains`, so any answer meets this one.
+        WorkflowStepDependencyDetail.objects.update(
+            required_response={
+                "$schema": "http://json-schema.org/draft-04/schema#",
+                **REQUIRES_YES,
+            }
+        )
+        evaluator = StepDependencyEvaluator.load(self.workflow_collection.id)
+
+        self.assertTrue(
+            evaluator.is_satisfied(self.step_2.id, {self.step_1.id: responses("No")})
+        )
+
+    def test_evaluator_is_cached_until_dependencies_change(self):
+        evaluator = get_step_dependency_evaluator(self.workflow_collection.id)
+        with self.assertNumQueries(0):
+            self.assertIs(
+                get_step_dependency_evaluator(self.workflow_collection.id), evaluator
+            )
+
+        WorkflowStepDependencyGroup.objects.filter(workflow_step=self.step_2).delete()
+        self.assertTrue(
+            get_step_dependency_evaluator(self.workflow_collection.id).is_satisfied(
+                self.step_2.id, {}
+            )
+        )
+
+    def test_state__skips_steps_with_unmet_dependencies(self):
+        self._complete_step_1("No")
+
+        self.assertEqual(self.engagement.state["next"]["step_id"], self.step_3.id)
+        self.assertFalse(self.engagement.all_dependencies_satisfied(self.step_2))
+
+    def test_state__uses_steps_with_met_dependencies(self):
+        self._complete_step_1("Yes")
+
+        self.assertEqual(self.engagement.state["next"]["step_id"], self.step_2.id)
+        self.assertTrue(self.engagement.all_dependencies_satisfied(self.step_2))
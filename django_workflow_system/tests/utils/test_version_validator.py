@@ -0,0 +1,53 @@
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from ...api.tests.factories import WorkflowCollectionFactory, WorkflowFactory
+from ...models import Workflow, WorkflowCollection
+from ...utils.version_validator import version_validator
+
+
+class TestVersionValidator(TestCase):
+    def setUp(self):
+        self.workflow = WorkflowFactory(code="first", version=1)
+        WorkflowFactory(code="first", version=2)
+        WorkflowFactory(code="second", version=1)
+
+    def test_single_query(self):
+        workflow = Workflow(code="first", version=3)
+        with self.assertNumQueries(1):
+            version_validator(workflow, Workflow)
+
+    def test_invalid_versions(self):
+        for workflow, message in (
+            (Workflow(code="new", version=2), "Version must be 1 for new"),
+            (Workflow(code="first", version=4), "The current latest version"),
+        ):
+            with self.subTest(code=workflow.code, version=workflow.version):
+                with self.assertRaisesMessage(ValidationError, message):
+                    version_validator(workflow, Workflow)
+
+        only_version = WorkflowFactory(code="only", version=1)
+        only_version.version = 2
+        with self.assertRaisesMessage(ValidationError, "Version must be 1 for the"):
+            version_validator(only_version, Workflow)
+
+    def test_save__version_taken_meanwhile(self):
+        """A version created after validating is reported as a validation error."""
+        for factory, model_class, related in (
+            (WorkflowFactory, Workflow, ("author", "created_by")),
+            (WorkflowCollectionFactory, WorkflowCollection, ("created_by",)),
+        ):
+            with self.subTest(model=model_class.__name__):
+                existing = factory(code="taken", version=1)
+                duplicate = factory.build(
+                    code="taken",
+                    version=1,
+                    **{field: getattr(existing, field) for field in related},
+                )
+                # As if `existing` was saved after `duplicate` was validated.
+                with mock.patch.object(model_class, "full_clean"):
+                    with self.assertRaisesMessage(ValidationError, "just created"):
+                        duplicate.save()
+                self.assertEqual(model_class.objects.filter(code="taken").count(), 1)
@@ -1,10 +1,15 @@
 from django.contrib import admin
-from django.db.models import QuerySet
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, QuerySet
+from django.db.models.signals import post_delete, post_save
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 
 from ..models import WorkflowCollection, WorkflowCollectionMember
+from .caching import LOCAL_CACHE_TIMEOUT, invalidate_on_commit, is_invalidation_pending
+
+COLLECTION_CHOICES_CACHE_KEY = "django_workflow_system:admin_collection_choices"
 
 
 class EditLinkToInlineObject(object):
@@ -111,6 +116,10 @@ class StepInCollectionFilter(admin.SimpleListFilter):
     The models do not provide a direct link from a step to a
     collection, so something this filter is needed.
 
+    Steps are matched with an EXISTS subquery against the collection's
+    members, and the list of collections to choose from is cached until a
+    collection is saved or deleted, and for a minute at most.
+
     usage:
 
     @admin.register(WorkflowStep)
@@ -124,21 +133,45 @@ class StepInCollectionFilter(admin.SimpleListFilter):
     parameter_name = "collection"
 
     def lookups(self, request: HttpRequest, model_admin: admin.ModelAdmin):
-        qs = WorkflowCollection.objects.all()
-        return [(o.id, o.name) for o in list(qs)]
-
-    def queryset(self, request: HttpRequest, queryset: QuerySet):
-        collection_id = request.GET.get("collection")
-        members = WorkflowCollectionMember.objects.filter(
-            workflow_collection=collection_id
+        # Changes waiting to be committed aren't in the cache yet.
+        if is_invalidation_pending(COLLECTION_CHOICES_CACHE_KEY):
+            return self.load_choices()
+        choices = cache.get(COLLECTION_CHOICES_CACHE_KEY)
+        if choices is None:
+            choices = self.load_choices()
+            cache.set(
+                COLLECTION_CHOICES_CACHE_KEY, choices, timeout=LOCAL_CACHE_TIMEOUT
+            )
+        return choices
+
+    def load_choices(self) -> list:
+        return list(
+            WorkflowCollection.objects.order_by("name").values_list("id", "name")
         )
-        workflow_ids = [o.workflow for o in list(members)]
 
-        if len(workflow_ids) > 0:
-            queryset = queryset.filter(workflow__in=workflow_ids)
+    def queryset(self, request: HttpRequest, queryset: QuerySet):
+        if self.value():
+            queryset = queryset.filter(
+                Exists(
+                    WorkflowCollectionMember.objects.filter(
+                        workflow_collection=self.value(), workflow=OuterRef("workflow")
+                    )
+                )
+            )
         return queryset
 
 
+def invalidate_collection_choices(**kwargs):
+    """
+    Throw away the cached StepInCollectionFilter choices.
+    """
+    invalidate_on_commit(cache.delete, COLLECTION_CHOICES_CACHE_KEY)
+
+
+post_save.connect(invalidate_collection_choices, sender=WorkflowCollection)
+post_delete.connect(invalidate_collection_choices, sender=WorkflowCollection)
+
+
 class IsActiveCollectionFilter(admin.SimpleListFilter):
     """
     Creates a pass through filter for the sole purpose of renaming the filter names
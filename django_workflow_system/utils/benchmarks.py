@@ -0,0 +1,249 @@
+"""
+Utilities for measuring the latency and query counts of the API endpoints.
+
+Results are plain dictionaries so they can be written to JSON, and two runs
+can be compared with `compare_results`.
+"""
+import io
+import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from ..api.parsers import WorkflowJSONParser
+from ..api.renderers import WorkflowJSONRenderer
+from ..api.urls.users import user_endpoints
+from ..api.urls.workflows import workflow_endpoints
+from ..models import (
+    WorkflowCollectionAssignment,
+    WorkflowCollectionEngagement,
+    WorkflowCollectionEngagementDetail,
+    WorkflowCollectionRecommendation,
+    WorkflowCollectionSubscription,
+)
+
+PERCENTILES = (50, 90, 99)
+
+# The endpoints with the largest responses, and the query parameters which
+# make them largest.
+RENDERER_ENDPOINTS = (
+    ("workflow-collection", {"include_steps": "true"}),
+    (
+        "user-workflow-collection-engagements",
+        {"include_finished": "true", "include_details": "true"},
+    ),
+    ("user-workflow-collection-engagement-details", {}),
+)
+
+
+def percentile(timings, percent) -> float:
+    """Return the nearest-rank percentile of a non-empty list of timings."""
+    ordered = sorted(timings)
+    rank = max(1, -(-percent * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
+def get_url_kwargs(user) -> dict:
+    """
+    Find objects belonging to `user` for every parameterized endpoint.
+
+    Returns:
+        dict: URL names mapped to the kwargs needed to reverse them. URL
+              names without an object to request are left out.
+    """
+    url_kwargs = {}
+    engagement = (
+        WorkflowCollectionEngagement.objects.filter(user=user)
+        .order_by("-started")
+        .select_related("workflow_collection")
+        .first()
+    )
+    if engagement:
+        collection = engagement.workflow_collection
+        url_kwargs["user-workflow-collection-engagement"] = {"id": engagement.id}
+        url_kwargs["user-workflow-collection-engagement-details"] = {
+            "id": engagement.id
+        }
+        url_kwargs["workflow-collection"] = {"id": collection.id}
+        url_kwargs["workflow-collection-bundle"] = {"id": collection.id}
+
+        detail = WorkflowCollectionEngagementDetail.objects.filter(
+            workflow_collection_engagement=engagement
+        ).first()
+        if detail:
+            url_kwargs["user-workflow-collection-engagement-detail"] = {
+                "engagement_id": engagement.id,
+                "id": detail.id,
+            }
+        workflow = (
+            collection.workflowcollectionmember_set.select_related("workflow__author")
+            .order_by("order")
+            .first()
+        )
+        if workflow:
+            url_kwargs["workflow"] = {"id": workflow.workflow_id}
+            url_kwargs["workflow-author"] = {"id": workflow.workflow.author_id}
+
+    for url_name, model in (
+        ("user-workflow-collection-subscription", WorkflowCollectionSubscription),
+        ("user-workflow-assignment", WorkflowCollectionAssignment),
+        ("user-workflow-recommendation", WorkflowCollectionRecommendation),
+    ):
+        obj_id = model.objects.filter(user=user).values_list("id", flat=True).first()
+        if obj_id:
+            url_kwargs[url_name] = {"id": obj_id}
+    return url_kwargs
+
+
+def measure_endpoint(client, path, runs) -> dict:
+    """
+    Request `path` `runs` times (after one warm up request) and summarize.
+
+    The query count is taken from the last request, so caches filled by the
+    warm up request don't inflate it.
+    """
+    client.get(path)
+    timings = []
+    for _ in range(runs):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = client.get(path)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "path": path,
+        "status": response.status_code,
+        "queries": len(queries),
+        **summarize_timings(timings),
+    }
+
+
+def summarize_timings(timings) -> dict:
+    """Summarize a list of timings, in milliseconds."""
+    runs = len(timings)
+    result = {
+        "runs": runs,
+        "mean_ms": round(sum(timings) / runs, 3),
+        "max_ms": round(max(timings), 3),
+    }
+    for percent in PERCENTILES:
+        result[f"p{percent}_ms"] = round(percentile(timings, percent), 3)
+    return result
+
+
+def time_call(function, runs) -> dict:
+    """Call `function` `runs` times (after one warm up call) and summarize."""
+    function()
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return summarize_timings(timings)
+
+
+def run_benchmarks(user, runs=20) -> dict:
+    """
+    Measure every endpoint in the user and workflow URL configurations.
+
+    Parameters:
+        user (User): The user the requests are authenticated as.
+        runs (int): How many timed requests to make per endpoint.
+
+    Returns:
+        dict: URL names mapped to their results. Endpoints which need an
+              object `user` doesn't have are recorded as skipped.
+    """
+    client = APIClient(raise_request_exception=False)
+    client.force_authenticate(user=user)
+    url_kwargs = get_url_kwargs(user)
+
+    results = {}
+    for pattern in user_endpoints + workflow_endpoints:
+        if pattern.pattern.converters and pattern.name not in url_kwargs:
+            results[pattern.name] = {"skipped": True}
+            continue
+        path = reverse(pattern.name, kwargs=url_kwargs.get(pattern.name))
+        results[pattern.name] = measure_endpoint(client, path, runs)
+    return results
+
+
+def run_renderer_benchmarks(user, runs=20) -> dict:
+    """
+    Compare DRF's JSON renderer and parser with the package's, on the
+    largest responses `user` gets.
+
+    Parameters:
+        user (User): The user the requests are authenticated as.
+        runs (int): How many times to render and parse each response.
+
+    Returns:
+        dict: URL names mapped to the response size and the render and parse
+              timings of each renderer and parser pair.
+    """
+    client = APIClient(raise_request_exception=False)
+    client.force_authenticate(user=user)
+    url_kwargs = get_url_kwargs(user)
+    pairs = {
+        "drf": (JSONRenderer(), JSONParser()),
+        "workflow": (WorkflowJSONRenderer(), WorkflowJSONParser()),
+    }
+
+    patterns = {pattern.name: pattern for pattern in user_endpoints}
+    patterns.update({pattern.name: pattern for pattern in workflow_endpoints})
+
+    results = {}
+    for url_name, params in RENDERER_ENDPOINTS:
+        if patterns[url_name].pattern.converters and url_name not in url_kwargs:
+            results[url_name] = {"skipped": True}
+            continue
+        path = reverse(url_name, kwargs=url_kwargs.get(url_name))
+        data = client.get(path, params).data
+
+        result = {"path": path}
+        for name, (renderer, parser) in pairs.items():
+            content = renderer.render(data)
+            result["bytes"] = len(content)
+            result[name] = {
+                "render": time_call(lambda: renderer.render(data), runs),
+                "parse": time_call(lambda: parser.parse(io.BytesIO(content)), runs),
+            }
+        results[url_name] = result
+    return results
+
+
+def compare_results(baseline, current, threshold=20) -> list:
+    """
+    Find the endpoints that got slower, or started running more queries.
+
+    Parameters:
+        baseline (dict): Endpoint results from an earlier run.
+        current (dict): Endpoint results from this run.
+        threshold (float): How many percent the 90th percentile latency may
+                           grow by before it counts as a regression.
+
+    Returns:
+        list: A description of each regression.
+    """
+    regressions = []
+    for url_name, result in current.items():
+        before = baseline.get(url_name)
+        if not before or before.get("skipped") or result.get("skipped"):
+            continue
+        if result["queries"] > before["queries"]:
+            regressions.append(
+                f"{url_name}: {before['queries']} -> {result['queries']} queries"
+            )
+        if result["p90_ms"] > before["p90_ms"] * (1 + threshold / 100):
+            regressions.append(
+                f"{url_name}: p90 {before['p90_ms']}ms -> {result['p90_ms']}ms"
+            )
+        if result["status"] != before["status"]:
+            regressions.append(
+                f"{url_name}: status {before['status']} -> {result['status']}"
+            )
+    return regressions
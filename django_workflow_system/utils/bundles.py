@@ -0,0 +1,376 @@
+"""Utilities for packaging a WorkflowCollection for offline use."""
+import hashlib
+import io
+import json
+import re
+import zipfile
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from rest_framework.utils.encoders import JSONEncoder
+
+from ..api.serializers.workflows.collection import (
+    WorkflowCollectionWithStepsSerializer,
+)
+from ..models import (
+    Workflow,
+    WorkflowAuthor,
+    WorkflowCollection,
+    WorkflowCollectionImage,
+    WorkflowCollectionImageType,
+    WorkflowCollectionMember,
+    WorkflowImage,
+    WorkflowImageType,
+    WorkflowMetadata,
+    WorkflowStep,
+    WorkflowStepAudio,
+    WorkflowStepExternalLink,
+    WorkflowStepImage,
+    WorkflowStepText,
+    WorkflowStepUITemplate,
+    WorkflowStepUserInput,
+    WorkflowStepUserInputType,
+    WorkflowStepVideo,
+)
+from .caching import (
+    bump_cache_version,
+    get_cache_version,
+    invalidate_on_commit,
+    is_invalidation_pending,
+)
+from .profiling import count_cache
+from .response_schemas import get_response_schema, get_response_schema_handlers_version
+
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_LOCATION = "workflow_system/bundles/{}/{}.zip"
+MEDIA_HASH_CACHE_KEY = "django_workflow_system:media_hash:{}:{}:{}"
+CONTENT_VERSION_CACHE_KEY = "django_workflow_system:bundle_content_version:{}:{}"
+CONTENT_TOKEN_CACHE_KEY = "django_workflow_system:bundle_content"
+
+# Media files overwritten in storage don't save any content, so the cached
+# content version of a bundle is only trusted for this many seconds.
+CONTENT_VERSION_TIMEOUT = 60 * 60
+
+# Every model the content of a bundle is read from.
+CONTENT_MODELS = (
+    Workflow,
+    WorkflowAuthor,
+    WorkflowCollection,
+    WorkflowCollectionImage,
+    WorkflowCollectionImageType,
+    WorkflowCollectionMember,
+    WorkflowImage,
+    WorkflowImageType,
+    WorkflowMetadata,
+    WorkflowStep,
+    WorkflowStepAudio,
+    WorkflowStepExternalLink,
+    WorkflowStepImage,
+    WorkflowStepText,
+    WorkflowStepUITemplate,
+    WorkflowStepUserInput,
+    WorkflowStepUserInputType,
+    WorkflowStepVideo,
+)
+
+# Every archive entry gets the same timestamp, so that building a bundle twice
+# produces the same bytes.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def dump_json(data) -> bytes:
+    """Serialize `data` the same way every time, whatever order it was built in."""
+    return json.dumps(
+        data, cls=JSONEncoder, sort_keys=True, separators=(",", ":")
+    ).encode()
+
+
+def get_media_hash(field_file):
+    """
+    Return the sha256 of a stored file, or None if it can't be read.
+
+    Storages may be configured to overwrite files, so hashes are cached by
+    name, size and modification time. With storages that can't tell when a
+    file was modified, the hash is only kept for CONTENT_VERSION_TIMEOUT.
+    """
+    storage = field_file.storage
+    try:
+        size = storage.size(field_file.name)
+        try:
+            modified_time = storage.get_modified_time(field_file.name).timestamp()
+            timeout = None
+        except NotImplementedError:
+            modified_time = None
+            timeout = CONTENT_VERSION_TIMEOUT
+    except (FileNotFoundError, OSError):
+        return None
+
+    key = MEDIA_HASH_CACHE_KEY.format(field_file.name, size, modified_time)
+    sha256 = cache.get(key)
+    if sha256 is None:
+        digest = hashlib.sha256()
+        try:
+            with storage.open(field_file.name, "rb") as file:
+                for chunk in iter(lambda: file.read(64 * 1024), b""):
+                    digest.update(chunk)
+        except (FileNotFoundError, OSError):
+            return None
+        sha256 = digest.hexdigest()
+        cache.set(key, sha256, timeout=timeout)
+    return sha256
+
+
+class CollectionBundle:
+    """
+    A WorkflowCollection with all of its content, as a client needs it to
+    run the collection offline.
+
+    Attributes:
+        collection (WorkflowCollection): The collection being bundled.
+        collection_data (dict): The collection serialized with its steps.
+        response_schemas (dict): Step input ids mapped to the JSON schema
+                                 responses to them are validated against.
+        media (list): One dict per stored media file the collection uses,
+                      with its `name` in storage, `url` and `sha256`.
+        content_version (str): A hash of everything above, which changes
+                               whenever any of it does.
+    """
+
+    def __init__(self, collection, collection_data, response_schemas, media):
+        self.collection = collection
+        self.collection_data = collection_data
+        self.response_schemas = response_schemas
+        self.media = media
+        self.content_version = hashlib.sha256(
+            dump_json([collection_data, response_schemas, media])
+        ).hexdigest()
+
+    @classmethod
+    def build(cls, collection, request):
+        """
+        Gather the content of a collection.
+
+        Parameters:
+            collection (WorkflowCollection): The collection to bundle.
+            request (HttpRequest): Used to build absolute URLs.
+
+        Returns:
+            CollectionBundle
+        """
+        collection_data = WorkflowCollectionWithStepsSerializer(
+            collection, context={"request": request}
+        ).data
+
+        # The serializer has prefetched everything walked through below.
+        response_schemas = {}
+        files = [image.image for image in collection.workflowcollectionimage_set.all()]
+        for member in collection.workflowcollectionmember_set.all():
+            workflow = member.workflow
+            files.append(workflow.author.image)
+            files.extend(image.image for image in workflow.workflowimage_set.all())
+            for step in workflow.workflowstep_set.all():
+                files.extend(image.url for image in step.workflowstepimage_set.all())
+                files.extend(audio.url for audio in step.workflowstepaudio_set.all())
+                for step_input in step.workflowstepuserinput_set.all():
+                    response_schemas[str(step_input.id)] = get_response_schema(
+                        step_input
+                    )
+
+        media = {}
+        for field_file in files:
+            if field_file and field_file.name not in media:
+                media[field_file.name] = {
+                    "name": field_file.name,
+                    "url": request.build_absolute_uri(field_file.url),
+                    "sha256": get_media_hash(field_file),
+                }
+
+        return cls(
+            collection,
+            collection_data,
+            response_schemas,
+            sorted(media.values(), key=lambda entry: entry["name"]),
+        )
+
+    @property
+    def storage_name(self) -> str:
+        return BUNDLE_LOCATION.format(self.collection.id, self.content_version)
+
+    def archive(self, previous_media=None) -> bytes:
+        """
+        Return the bundle as a zip archive.
+
+        The archive holds `bundle.json`, describing the bundle,
+        `collection.json`, `response_schemas.json` and `media.json`, which
+        lists the media `files` to download and the URLs of those `removed`.
+
+        Parameters:
+            previous_media (list): The media of an earlier version of the
+                                   bundle the client already has. When given,
+                                   only the files which were added or changed
+                                   since, or couldn't be hashed, are listed.
+        """
+        files = self.media
+        removed = []
+        if previous_media is not None:
+            previous_hashes = {
+                entry["name"]: entry["sha256"] for entry in previous_media
+            }
+            current_names = {entry["name"] for entry in self.media}
+            files = [
+                entry
+                for entry in self.media
+                if entry["sha256"] is None
+                or previous_hashes.get(entry["name"]) != entry["sha256"]
+            ]
+            removed = [
+                entry["url"]
+                for entry in previous_media
+                if entry["name"] not in current_names
+            ]
+
+        entries = {
+            "bundle.json": {
+                "format": BUNDLE_FORMAT_VERSION,
+                "collection_id": str(self.collection.id),
+                "collection_code": self.collection.code,
+                "collection_version": self.collection.version,
+                "content_version": self.content_version,
+                "delta": previous_media is not None,
+            },
+            "collection.json": self.collection_data,
+            "response_schemas.json": self.response_schemas,
+            "media.json": {"files": files, "removed": removed},
+        }
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, data in entries.items():
+                info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, dump_json(data))
+        return buffer.getvalue()
+
+    def save(self) -> bytes:
+        """
+        Store the full archive of this version of the bundle, unless it
+        already is, and return it.
+        """
+        content = load_bundle_archive(self.collection.id, self.content_version)
+        if content is None:
+            content = self.archive()
+            name = default_storage.save(self.storage_name, ContentFile(content))
+            if name != self.storage_name:
+                # Another request stored the same archive first, and the
+                # storage gave this copy a new name.
+                default_storage.delete(name)
+        return content
+
+
+def _get_content_version_key(collection_id, request) -> str:
+    # Media URLs are absolute, so bundles built for different hosts differ.
+    base_url = hashlib.sha256(request.build_absolute_uri("/").encode()).hexdigest()
+    return CONTENT_VERSION_CACHE_KEY.format(collection_id, base_url[:16])
+
+
+def get_content_version(collection, request):
+    """
+    Return the content version of a collection's current bundle, as it was
+    last built for the host of `request`, or None if it has to be built to
+    find out.
+
+    The version is remembered until any content is saved or deleted, or a
+    response schema handler changes, so that requests from clients which
+    are up to date, or for a stored archive, don't build the bundle.
+    """
+    # Content changes waiting to be committed haven't outdated it yet.
+    if is_invalidation_pending(CONTENT_TOKEN_CACHE_KEY):
+        return None
+    cached = cache.get(_get_content_version_key(collection.id, request))
+    current = cached is not None and cached[:2] == (
+        get_cache_version(CONTENT_TOKEN_CACHE_KEY),
+        get_response_schema_handlers_version(),
+    )
+    count_cache(current)
+    return cached[2] if current else None
+
+
+def set_content_version(bundle, request):
+    """Remember the content version of a bundle built for `request`."""
+    if is_invalidation_pending(CONTENT_TOKEN_CACHE_KEY):
+        return
+    cache.set(
+        _get_content_version_key(bundle.collection.id, request),
+        (
+            get_cache_version(CONTENT_TOKEN_CACHE_KEY),
+            get_response_schema_handlers_version(),
+            bundle.content_version,
+        ),
+        timeout=CONTENT_VERSION_TIMEOUT,
+    )
+
+
+def invalidate_content_versions(**kwargs):
+    """
+    Forget the content version of every bundle.
+
+    A workflow can be part of any number of collections, so they are all
+    built again rather than working out which ones changed.
+    """
+    invalidate_on_commit(bump_cache_version, CONTENT_TOKEN_CACHE_KEY)
+
+
+def invalidate_author_names(sender, instance, update_fields=None, **kwargs):
+    """
+    Forget the content version of every bundle when an author's name, which
+    bundles include, is about to change.
+    """
+    if instance.pk is None or (
+        update_fields is not None
+        and not {"first_name", "last_name"}.intersection(update_fields)
+    ):
+        return
+    previous = (
+        sender.objects.filter(pk=instance.pk, workflowauthor__isnull=False)
+        .values_list("first_name", "last_name")
+        .first()
+    )
+    if previous is not None and previous != (instance.first_name, instance.last_name):
+        invalidate_content_versions()
+
+
+for model in CONTENT_MODELS:
+    post_save.connect(invalidate_content_versions, sender=model)
+    post_delete.connect(invalidate_content_versions, sender=model)
+for model in (WorkflowCollection, Workflow, WorkflowStep):
+    m2m_changed.connect(invalidate_content_versions, sender=model.metadata.through)
+pre_save.connect(invalidate_author_names, sender=get_user_model())
+
+
+def load_bundle_archive(collection_id, content_version):
+    """
+    Return the stored full archive of a version of a collection's bundle,
+    or None if that version was never stored.
+    """
+    if not re.fullmatch("[0-9a-f]{64}", content_version):
+        return None
+    name = BUNDLE_LOCATION.format(collection_id, content_version)
+    if not default_storage.exists(name):
+        return None
+    with default_storage.open(name, "rb") as file:
+        return file.read()
+
+
+def load_bundle_media(collection_id, content_version):
+    """
+    Return the media of a stored version of a collection's bundle, or None
+    if that version was never stored.
+    """
+    content = load_bundle_archive(collection_id, content_version)
+    if content is None:
+        return None
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        return json.loads(archive.read("media.json"))["files"]
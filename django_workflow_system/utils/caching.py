@@ -0,0 +1,81 @@
+"""Utilities shared by the package's caches."""
+import time
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+# How long data cached in memory per process is kept at most, in seconds.
+LOCAL_CACHE_TIMEOUT = 60
+
+
+def get_cache_version(key) -> str:
+    """
+    Return the version token stored in Django's cache under `key`, creating
+    one if there isn't one yet.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def get_local_cache_version(key):
+    """
+    Return the version to keep data loaded for `key` in memory under, or
+    None if it mustn't be kept because the current transaction changed it.
+
+    The version combines the token in Django's cache with the current
+    LOCAL_CACHE_TIMEOUT period. Processes sharing a cache backend drop their
+    copies together as soon as the token is replaced. With a cache that
+    isn't shared, such as the default LocMemCache, other processes never see
+    the new token, so copies are also dropped every LOCAL_CACHE_TIMEOUT
+    seconds.
+    """
+    if is_invalidation_pending(key):
+        return None
+    period = int(time.time() // LOCAL_CACHE_TIMEOUT)
+    return f"{get_cache_version(key)}:{period}"
+
+
+def bump_cache_version(key):
+    """Replace the version token under `key`, outdating what was loaded for it."""
+    cache.set(key, uuid.uuid4().hex, timeout=None)
+
+
+class _Invalidation:
+    """An invalidation waiting for the current transaction to commit."""
+
+    def __init__(self, function, key):
+        self.function = function
+        self.key = key
+
+    def __call__(self):
+        self.function(self.key)
+
+
+def is_invalidation_pending(key) -> bool:
+    """
+    Determine whether the current transaction changed what is cached under
+    `key`, in which case nothing loaded for it should be cached until the
+    transaction commits.
+    """
+    # Django drops the callbacks of savepoints and transactions which are
+    # rolled back, so whatever is left is still waiting to be committed.
+    return any(
+        isinstance(entry[1], _Invalidation) and entry[1].key == key
+        for entry in transaction.get_connection().run_on_commit
+    )
+
+
+def invalidate_on_commit(function, key):
+    """
+    Call `function(key)` once the current transaction commits, or straight
+    away outside of one.
+
+    Until then, `is_invalidation_pending(key)` is true, so that nothing
+    loaded from the uncommitted changes gets cached. If the transaction is
+    rolled back, `function` is never called.
+    """
+    transaction.on_commit(_Invalidation(function, key))
@@ -0,0 +1,261 @@
+"""
+Utilities for copying workflow collections and workflows.
+
+Every layer of the copied tree (workflows, steps, step media, dependency
+groups, ...) is read with a single query and written with a single
+`bulk_create`, so the number of queries doesn't grow with the size of the
+tree. New primary keys are UUIDs generated in Python, which lets the
+old -> new id maps be built before anything is inserted.
+"""
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Q
+
+from ..models import (
+    Workflow,
+    WorkflowCollection,
+    WorkflowCollectionMember,
+    WorkflowStep,
+    WorkflowStepAudio,
+    WorkflowStepDependencyDetail,
+    WorkflowStepDependencyGroup,
+    WorkflowStepExternalLink,
+    WorkflowStepImage,
+    WorkflowStepText,
+    WorkflowStepUserInput,
+    WorkflowStepVideo,
+)
+
+STEP_MEDIA_MODELS = (
+    WorkflowStepAudio,
+    WorkflowStepVideo,
+    WorkflowStepImage,
+    WorkflowStepUserInput,
+    WorkflowStepText,
+    WorkflowStepExternalLink,
+)
+
+# Set by the database when the copy is inserted.
+SKIPPED_FIELDS = ("created_date", "modified_date")
+
+
+def copy_instance(instance, **changes):
+    """
+    Return an unsaved copy of `instance` with a new primary key.
+
+    Parameters:
+        instance (Model): The object to copy.
+        changes: Field values (by attribute name, e.g. `workflow_id`) to
+                 use instead of the ones on `instance`.
+    """
+    model = type(instance)
+    values = {
+        field.attname: getattr(instance, field.attname)
+        for field in model._meta.concrete_fields
+        if not field.primary_key and field.name not in SKIPPED_FIELDS
+    }
+    values.update(changes)
+    return model(**values)
+
+
+def get_copy_names(model, objects):
+    """
+    Find an unused code and name for a copy of each object.
+
+    Copies are named like the admin always has: `code_copy` and
+    `name (copy)`, or `code_copy_1` and `name (copy 1)` if that code is
+    taken. Every code in use is looked up with a single query.
+
+    Parameters:
+        model (Model): WorkflowCollection or Workflow.
+        objects (list): The objects being copied.
+
+    Returns:
+        dict: Object ids mapped to a (code, name) tuple.
+    """
+    if not objects:
+        return {}
+    taken = set(
+        model.objects.filter(
+            reduce(or_, (Q(code__startswith=f"{obj.code}_copy") for obj in objects))
+        ).values_list("code", flat=True)
+    )
+
+    names = {}
+    for obj in objects:
+        code, name, number = f"{obj.code}_copy", f"{obj.name} (copy)", 0
+        while code in taken:
+            number += 1
+            code = f"{obj.code}_copy_{number}"
+            name = f"{obj.name} (copy {number})"
+        taken.add(code)
+        names[obj.id] = (code, name)
+    return names
+
+
+def copy_metadata(model, id_map):
+    """
+    Link every copy to the same metadata as its original.
+
+    Parameters:
+        model (Model): A model with a `metadata` many to many field.
+        id_map (dict): Original ids mapped to the ids of their copies.
+    """
+    field = model._meta.get_field("metadata")
+    through = field.remote_field.through
+    source = f"{field.m2m_field_name()}_id"
+    target = f"{field.m2m_reverse_field_name()}_id"
+    through.objects.bulk_create(
+        [
+            through(**{source: id_map[source_id], target: target_id})
+            for source_id, target_id in through.objects.filter(
+                **{f"{source}__in": id_map}
+            ).values_list(source, target)
+        ]
+    )
+
+
+def clone_steps(step_queryset, workflow_map=None, **changes):
+    """
+    Copy steps along with their metadata links and media.
+
+    Parameters:
+        step_queryset (QuerySet): The WorkflowStep objects to copy.
+        workflow_map (dict): Workflow ids mapped to the id of the workflow
+                             the copied steps should belong to. Steps keep
+                             their workflow if it isn't in the map.
+        changes: Field values to set on every copied step.
+
+    Returns:
+        dict: Original step ids mapped to their copies.
+    """
+    workflow_map = workflow_map or {}
+    step_map = {
+        step.id: copy_instance(
+            step,
+            workflow_id=workflow_map.get(step.workflow_id, step.workflow_id),
+            **changes,
+        )
+        for step in step_queryset
+    }
+    WorkflowStep.objects.bulk_create(step_map.values())
+    copy_metadata(WorkflowStep, {old: new.id for old, new in step_map.items()})
+
+    for model in STEP_MEDIA_MODELS:
+        model.objects.bulk_create(
+            [
+                copy_instance(
+                    media, workflow_step_id=step_map[media.workflow_step_id].id
+                )
+                for media in model.objects.filter(workflow_step__in=step_map)
+            ]
+        )
+    return step_map
+
+
+@transaction.atomic
+def clone_workflows(workflows):
+    """
+    Copy workflows, including their steps, under new codes.
+
+    Like collections, copied workflows start over at version 1.
+
+    Parameters:
+        workflows (iterable): The Workflow objects to copy.
+
+    Returns:
+        tuple: Two dicts mapping original workflow ids to their copies and
+               original step ids to their copies.
+    """
+    workflows = list(workflows)
+    names = get_copy_names(Workflow, workflows)
+    workflow_map = {
+        workflow.id: copy_instance(
+            workflow, code=names[workflow.id][0], name=names[workflow.id][1], version=1
+        )
+        for workflow in workflows
+    }
+    Workflow.objects.bulk_create(workflow_map.values())
+    workflow_ids = {old: new.id for old, new in workflow_map.items()}
+    copy_metadata(Workflow, workflow_ids)
+
+    step_map = clone_steps(
+        WorkflowStep.objects.filter(workflow__in=workflow_ids), workflow_ids
+    )
+    return workflow_map, step_map
+
+
+@transaction.atomic
+def clone_collection(workflow_collection, deep=False):
+    """
+    Copy a workflow collection under a new code.
+
+    The copy gets the same members, step dependency groups and details, and
+    metadata links as the original. With `deep`, every member workflow is
+    copied as well and the copy links to (and depends on steps of) those
+    new workflows instead.
+
+    Parameters:
+        workflow_collection (WorkflowCollection): The collection to copy.
+        deep (bool): Whether to copy the collection's workflows too.
+
+    Returns:
+        WorkflowCollection: The new collection.
+    """
+    code, name = get_copy_names(WorkflowCollection, [workflow_collection])[
+        workflow_collection.id
+    ]
+    # The copy has a brand new code, so it starts over at version 1.
+    new_collection = copy_instance(workflow_collection, code=code, name=name, version=1)
+    new_collection.save()
+
+    members = list(workflow_collection.workflowcollectionmember_set.all())
+    workflow_ids, step_ids = {}, {}
+    if deep:
+        workflow_map, step_map = clone_workflows(
+            Workflow.objects.filter(workflowcollectionmember__in=members).distinct()
+        )
+        workflow_ids = {old: new.id for old, new in workflow_map.items()}
+        step_ids = {old: new.id for old, new in step_map.items()}
+
+    WorkflowCollectionMember.objects.bulk_create(
+        [
+            copy_instance(
+                member,
+                workflow_collection_id=new_collection.id,
+                workflow_id=workflow_ids.get(member.workflow_id, member.workflow_id),
+            )
+            for member in members
+        ]
+    )
+
+    group_map = {
+        group.id: copy_instance(
+            group,
+            workflow_collection_id=new_collection.id,
+            workflow_step_id=step_ids.get(
+                group.workflow_step_id, group.workflow_step_id
+            ),
+        )
+        for group in workflow_collection.workflowstepdependencygroup_set.all()
+    }
+    WorkflowStepDependencyGroup.objects.bulk_create(group_map.values())
+    WorkflowStepDependencyDetail.objects.bulk_create(
+        [
+            copy_instance(
+                detail,
+                dependency_group_id=group_map[detail.dependency_group_id].id,
+                dependency_step_id=step_ids.get(
+                    detail.dependency_step_id, detail.dependency_step_id
+                ),
+            )
+            for detail in WorkflowStepDependencyDetail.objects.filter(
+                dependency_group__in=group_map
+            )
+        ]
+    )
+
+    copy_metadata(WorkflowCollection, {workflow_collection.id: new_collection.id})
+    return new_collection
@@ -0,0 +1,222 @@
+"""Utilities for evaluating WorkflowCollection dependencies for a user."""
+from collections import defaultdict, deque
+
+from django.db.models import Exists, OuterRef
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from ..models import (
+    WorkflowCollectionDependency,
+    WorkflowCollectionEngagement,
+)
+from .caching import bump_cache_version, get_local_cache_version, invalidate_on_commit
+from .profiling import count_cache
+
+GRAPH_VERSION_CACHE_KEY = "django_workflow_system:collection_dependency_graph"
+
+_cached_graph = None
+
+
+def get_completed_collection_ids(user) -> set:
+    """
+    Return the ids of every collection the user has finished an engagement for.
+
+    Parameters:
+        user (User): The user whose engagements should be checked.
+
+    Returns:
+        set: WorkflowCollection ids.
+    """
+    return set(
+        WorkflowCollectionEngagement.objects.filter(user=user, finished__isnull=False)
+        .order_by()
+        .values_list("workflow_collection_id", flat=True)
+    )
+
+
+class CollectionDependencyGraph:
+    """
+    An in-memory copy of every WorkflowCollectionDependency.
+
+    Attributes:
+        dependencies (dict): Collection ids mapped to the set of collection
+                             ids they directly depend on.
+        order (list): Every collection id that takes part in a dependency,
+                      ordered so that each collection comes after everything
+                      it depends on.
+        closure (dict): Collection ids mapped to the frozenset of every
+                        collection id they depend on, directly or not.
+        cyclic (set): Collection ids that are part of, or depend on, a cycle.
+                      These are left out of `order`.
+        version (str): The cache version the graph was loaded for.
+    """
+
+    def __init__(self, edges, version=None):
+        self.version = version
+        self.dependencies = defaultdict(set)
+        dependents = defaultdict(set)
+        nodes = set()
+        for source_id, target_id in edges:
+            self.dependencies[source_id].add(target_id)
+            dependents[target_id].add(source_id)
+            nodes.update((source_id, target_id))
+
+        # Kahn's algorithm: repeatedly take the collections that have no
+        # dependencies left to place.
+        remaining = {node: len(self.dependencies.get(node, ())) for node in nodes}
+        ready = deque(node for node, count in remaining.items() if count == 0)
+        self.order = []
+        self.closure = {}
+        while ready:
+            node = ready.popleft()
+            self.order.append(node)
+            closure = set()
+            for dependency in self.dependencies.get(node, ()):
+                closure.add(dependency)
+                closure |= self.closure[dependency]
+            self.closure[node] = frozenset(closure)
+            for dependent in dependents.get(node, ()):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        # Dependencies saved before cycles were rejected may still contain
+        # some; their closures are found with a plain traversal instead.
+        self.cyclic = nodes - set(self.order)
+        for node in self.cyclic:
+            self.closure[node] = frozenset(self._reachable(node))
+
+    def _reachable(self, start_id):
+        """Return every collection id reachable from `start_id`."""
+        seen = set()
+        pending = [start_id]
+        while pending:
+            for dependency in self.dependencies.get(pending.pop(), ()):
+                if dependency not in seen:
+                    seen.add(dependency)
+                    pending.append(dependency)
+        return seen
+
+    @classmethod
+    def load(cls, version=None, exclude=None):
+        """
+        Build the graph from the database with a single query.
+
+        Parameters:
+            version (str): The cache version being loaded.
+            exclude (uuid): The id of a WorkflowCollectionDependency to leave out.
+        """
+        dependencies = WorkflowCollectionDependency.objects.all()
+        if exclude is not None:
+            dependencies = dependencies.exclude(pk=exclude)
+        return cls(dependencies.values_list("source_id", "target_id"), version)
+
+    def requirements(self, collection_id) -> frozenset:
+        """Return every collection that must be completed before `collection_id`."""
+        return self.closure.get(collection_id, frozenset())
+
+    def missing_requirements(self, collection_id, completed_ids) -> set:
+        """
+        Return every collection that must still be completed before
+        `collection_id`, given the ids of the collections already completed.
+        """
+        return set(self.requirements(collection_id) - completed_ids)
+
+    def find_path(self, start_id, end_id):
+        """
+        Return a list of collection ids leading from `start_id` to `end_id`
+        by following dependencies, or None if there is no such path.
+        """
+        if end_id not in self.requirements(start_id):
+            return None
+        previous = {start_id: None}
+        pending = deque([start_id])
+        while end_id not in previous:
+            node = pending.popleft()
+            for dependency in self.dependencies.get(node, ()):
+                if dependency not in previous:
+                    previous[dependency] = node
+                    pending.append(dependency)
+        path = [end_id]
+        while path[-1] != start_id:
+            path.append(previous[path[-1]])
+        return path[::-1]
+
+    def find_cycle(self, source_id, target_id):
+        """
+        Return the cycle that adding a `source_id` -> `target_id` dependency
+        would create, as a list of collection ids, or None if it wouldn't.
+        """
+        if source_id == target_id:
+            return [source_id, source_id]
+        path = self.find_path(target_id, source_id)
+        if path is None:
+            return None
+        return [source_id] + path
+
+
+def get_dependency_graph() -> CollectionDependencyGraph:
+    """
+    Return the collection dependency graph, loading it only if it changed.
+
+    The graph is kept in memory per process, until its version changes
+    (see `get_local_cache_version`). The version is replaced whenever a
+    dependency is committed, and expires after a minute, so an outdated
+    graph is never enforced for long.
+    """
+    global _cached_graph
+
+    version = get_local_cache_version(GRAPH_VERSION_CACHE_KEY)
+    graph = _cached_graph
+    current = version is not None and graph is not None and graph.version == version
+    count_cache(current)
+    if not current:
+        graph = CollectionDependencyGraph.load(version=version)
+        if version is not None:
+            _cached_graph = graph
+    return graph
+
+
+def invalidate_dependency_graph(**kwargs):
+    """
+    Mark the cached dependency graph as out of date.
+    """
+    invalidate_on_commit(bump_cache_version, GRAPH_VERSION_CACHE_KEY)
+
+
+post_save.connect(invalidate_dependency_graph, sender=WorkflowCollectionDependency)
+post_delete.connect(invalidate_dependency_graph, sender=WorkflowCollectionDependency)
+m2m_changed.connect(invalidate_dependency_graph, sender=WorkflowCollectionDependency)
+
+
+def dependencies_completed(collection_id, dependency_map, completed_ids) -> bool:
+    """
+    Determine if every dependency of a collection is in `completed_ids`.
+
+    Collections without dependencies are always considered completed.
+    """
+    return dependency_map.get(collection_id, set()) <= completed_ids
+
+
+def filter_eligible_collections(queryset, user):
+    """
+    Limit a WorkflowCollection queryset to the collections whose
+    dependencies the user has completed.
+
+    This is done in SQL, so it can be combined with other filters and
+    doesn't require loading the dependency graph.
+
+    Parameters:
+        queryset (QuerySet): WorkflowCollection objects.
+        user (User): The user whose engagements should be checked.
+
+    Returns:
+        QuerySet
+    """
+    unmet_dependencies = WorkflowCollectionDependency.objects.filter(
+        source=OuterRef("pk")
+    ).exclude(
+        target__in=WorkflowCollectionEngagement.objects.filter(
+            user=user, finished__isnull=False
+        ).values("workflow_collection")
+    )
+    return queryset.filter(~Exists(unmet_dependencies))
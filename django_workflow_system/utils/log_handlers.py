@@ -0,0 +1,292 @@
+"""
+Logging handlers which keep slow log sinks out of the request path.
+
+Usage:
+    LOGGING = {
+        "version": 1,
+        "formatters": {
+            "structured": {
+                "()": "django_workflow_system.utils.log_handlers.StructuredFormatter",
+            },
+        },
+        "handlers": {
+            "workflow_system": {
+                "class": "django_workflow_system.utils.log_handlers.QueueLogHandler",
+                # Any handler, given as a dict with its class and arguments.
+                "target": {
+                    "class": "logging.FileHandler",
+                    "filename": "workflow_system.log",
+                },
+                "formatter": "structured",
+                "capacity": 10000,
+                "batch_size": 100,
+                "flush_interval": 1.0,
+                "drop": "newest",
+                "sample_rates": {"REQUEST_PROFILE": 0.1},
+            },
+        },
+        "loggers": {
+            "django_workflow_system": {"handlers": ["workflow_system"]},
+        },
+    }
+"""
+import copy
+import json
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from collections import deque
+
+from django.utils.module_loading import import_string
+
+DROP_NEWEST = "newest"
+DROP_OLDEST = "oldest"
+
+# The attributes every LogRecord has, anything else came from `extra`.
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+# Every QueueLogHandler, so that their state can be reset in forked children.
+_queue_handlers = weakref.WeakSet()
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line, GELF style.
+
+    Along with the message, logger name, level and time, every attribute
+    added with `extra` (for example by `generate_extra`) is included. Values
+    which aren't JSON serializable are included as strings.
+    """
+
+    def format(self, record) -> str:
+        data = {
+            "short_message": record.getMessage(),
+            "logger": record.name,
+            "level": record.levelname,
+            "timestamp": record.created,
+        }
+        if record.exc_info:
+            data["full_message"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["full_message"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                data[key] = value
+        return json.dumps(data, default=str)
+
+
+class QueueLogHandler(logging.Handler):
+    """
+    Hands records to another handler from a background thread.
+
+    `emit` only adds the record to a bounded buffer, so a slow target (a
+    remote log server, a busy disk) never holds up the code doing the
+    logging. A background thread takes up to `batch_size` records at a time
+    from the buffer and passes them to the target. Targets with an
+    `emit_batch(records)` method receive each batch in one call, others
+    have their `handle` method called for each record and are flushed once
+    per batch.
+
+    When the buffer already holds `capacity` records, either the new record
+    (`drop="newest"`) or the oldest waiting record (`drop="oldest"`) is
+    dropped. The number of dropped records is kept in `dropped`.
+
+    `sample_rates` maps event codes to the fraction of their records to
+    keep, e.g. `{"REQUEST_PROFILE": 0.1}`. Other event codes, and records of
+    level WARNING and above, are always kept.
+
+    A process forked from one that has been logging (a pre-forking server's
+    workers, for example) doesn't inherit the background thread, so the
+    child starts its own with an empty buffer. What the parent had buffered
+    is still written by the parent.
+    """
+
+    def __init__(
+        self,
+        target,
+        capacity=10000,
+        batch_size=100,
+        flush_interval=1.0,
+        drop=DROP_NEWEST,
+        sample_rates=None,
+        level=logging.NOTSET,
+    ):
+        super().__init__(level=level)
+        if isinstance(target, dict):
+            target = dict(target)
+            target = import_string(target.pop("class"))(**target)
+        if drop not in (DROP_NEWEST, DROP_OLDEST):
+            raise ValueError(f"drop must be '{DROP_NEWEST}' or '{DROP_OLDEST}'.")
+        if capacity < 1 or batch_size < 1:
+            raise ValueError("capacity and batch_size must be at least 1.")
+
+        self.target = target
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drop = drop
+        self.sample_rates = sample_rates or {}
+        self.dropped = 0
+        self._closed = False
+        self._reset_queue()
+        _queue_handlers.add(self)
+
+    def _reset_queue(self):
+        """Start over with an empty buffer and no background thread."""
+        self._buffer = deque()
+        self._in_flight = 0
+        self._flushing = 0
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def setFormatter(self, fmt):
+        """Format records with the target, which is what writes them."""
+        super().setFormatter(fmt)
+        self.target.setFormatter(fmt)
+
+    def is_sampled(self, record) -> bool:
+        """Determine whether to keep a record, based on its event code."""
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.sample_rates.get(getattr(record, "event_code", None), 1)
+        return rate >= 1 or random.random() < rate
+
+    def prepare(self, record):
+        """
+        Finish the parts of the record which depend on when it was logged.
+
+        The message is merged with its arguments and any traceback is
+        rendered now, while the objects they refer to are as they were when
+        the record was logged. This is done on a copy, as the record is also
+        passed to the logger's other handlers.
+        """
+        message = record.getMessage()
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        if not self.is_sampled(record):
+            return
+        try:
+            record = self.prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._condition:
+            if self._closed:
+                return
+            if len(self._buffer) >= self.capacity:
+                self.dropped += 1
+                if self.drop == DROP_NEWEST:
+                    return
+                self._buffer.popleft()
+            self._buffer.append(record)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="QueueLogHandler", daemon=True
+                )
+                self._thread.start()
+            if len(self._buffer) in (1, self.batch_size):
+                self._condition.notify_all()
+
+    def _take_batch(self) -> list:
+        """
+        Take the next batch from the buffer.
+
+        Waits until a full batch is buffered, or `flush_interval` seconds
+        have passed since the first record of the batch arrived.
+        """
+        with self._condition:
+            while not self._buffer and not self._closed:
+                self._condition.wait()
+            deadline = time.monotonic() + self.flush_interval
+            while not (
+                len(self._buffer) >= self.batch_size or self._closed or self._flushing
+            ):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            count = min(len(self._buffer), self.batch_size)
+            batch = [self._buffer.popleft() for _ in range(count)]
+            self._in_flight = count
+            return batch
+
+    def _write(self, batch):
+        try:
+            if hasattr(self.target, "emit_batch"):
+                self.target.emit_batch(batch)
+            else:
+                for record in batch:
+                    self.target.handle(record)
+                self.target.flush()
+        except Exception:
+            self.handleError(batch[-1])
+        finally:
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if batch:
+                self._write(batch)
+            elif self._closed:
+                return
+
+    def flush(self, timeout=None) -> bool:
+        """
+        Wait until every buffered record has been passed to the target.
+
+        Returns:
+            bool: Whether the buffer was emptied before the timeout.
+        """
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(
+                    lambda: self._thread is None
+                    or not (self._buffer or self._in_flight),
+                    timeout=timeout,
+                )
+            finally:
+                self._flushing -= 1
+
+    def close(self):
+        """Write out what is still buffered, then close the target."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self.target.close()
+        super().close()
+
+
+def _reset_queue_handlers_after_fork():
+    """
+    Reset every QueueLogHandler in a forked child.
+
+    Only the thread which forked exists in the child, and the lock of a
+    handler's condition may have been held by its background thread at the
+    time, so the condition is replaced along with the thread.
+    """
+    for handler in list(_queue_handlers):
+        handler._reset_queue()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_queue_handlers_after_fork)
@@ -1,27 +1,49 @@
-from rest_framework.request import Request
+from collections.abc import Mapping
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.request import Empty, Request
+
+SENSITIVE_KEYS = ("password", "response", "user_responses")
 
 
 def strip_sensitive_data(data: dict):
     """
     Function that strips request data before it is sent to our graylog server.
+
+    The data is written straight into the returned string, rather than
+    copied into a scrubbed dict first.
     """
-    sensitive_keys = ("password", "response", "user_responses")
+    items = dict.items(data) if isinstance(data, dict) else data.items()
+    return "{%s}" % ", ".join(
+        f"{key!r}: {repr('[CENSORED]') if key in SENSITIVE_KEYS else repr(value)}"
+        for key, value in items
+    )
 
-    # don't overwrite request!
-    data = dict(data)
 
-    # Scrub Request Data
-    for key in sensitive_keys:
-        if key in data:
-            data[key] = "[CENSORED]"
+def get_loaded(source, property):
+    """
+    Return `source.property`, but only if getting it won't run a query.
 
-    return str(data)
+    Foreign keys which haven't been fetched yet are treated as missing.
+    """
+    if source is None:
+        return None
+    meta = getattr(source, "_meta", None)
+    if meta is not None:
+        try:
+            field = meta.get_field(property)
+        except FieldDoesNotExist:
+            pass
+        else:
+            if field.many_to_one and not field.is_cached(source):
+                return None
+    return getattr(source, property, None)
 
 
 def find_property(property, *source_list, default):
     """
     Searches through a list of objects for one having the given property with a non-none
-    value.
+    value. Properties which would have to be fetched from the database are skipped.
     Parameters
     ----------
     property
@@ -38,8 +60,52 @@ def find_property(property, *source_list, default):
     if default:
         return default
     for source in source_list:
-        if source is not None and getattr(source, property, None):
-            return getattr(source, property)
+        value = get_loaded(source, property)
+        if value:
+            return value
+
+
+def find_id(property, *source_list):
+    """
+    Searches through a list of objects for the id stored in the `<property>_id`
+    attribute of a foreign key, which doesn't need the related object to be loaded.
+    """
+    for source in source_list:
+        value = getattr(source, f"{property}_id", None)
+        if value:
+            return value
+
+
+class LogContext(Mapping):
+    """
+    The `extra` of a log record, built from the objects it describes only when
+    a logger reads it.
+
+    Loggers only read `extra` when they create a record, so nothing is built
+    for messages below the logger's level.
+    """
+
+    def __init__(self, **sources):
+        self._sources = sources
+        self._extra = None
+
+    @property
+    def extra(self) -> dict:
+        if self._extra is None:
+            self._extra = _build_extra(**self._sources)
+        return self._extra
+
+    def __getitem__(self, key):
+        return self.extra[key]
+
+    def __iter__(self):
+        return iter(self.extra)
+
+    def __len__(self):
+        return len(self.extra)
+
+    def __repr__(self):
+        return repr(self.extra)
 
 
 def generate_extra(
@@ -89,9 +155,42 @@ def generate_extra(
 
     Returns
     -------
-    extra: dict
-
+    extra: LogContext
+        a mapping which is only filled in when a log record is created from it. Only
+        objects which are already loaded are used, so this never runs a query.
     """
+    return LogContext(
+        event_code=event_code,
+        request=request,
+        user=user,
+        activity=activity,
+        activity_assignment=activity_assignment,
+        workflow_collection=workflow_collection,
+        workflow_collection_assignment=workflow_collection_assignment,
+        workflow_collection_engagement=workflow_collection_engagement,
+        workflow_collection_engagement_detail=workflow_collection_engagement_detail,
+        workflow_collection_subscription=workflow_collection_subscription,
+        serializer_errors=serializer_errors,
+        **kwargs,
+    )
+
+
+def _build_extra(
+    *,
+    event_code,
+    request,
+    user,
+    activity,
+    activity_assignment,
+    workflow_collection,
+    workflow_collection_assignment,
+    workflow_collection_engagement,
+    workflow_collection_engagement_detail,
+    workflow_collection_subscription,
+    serializer_errors,
+    **kwargs,
+) -> dict:
+    """Build the dict a LogContext stands for. See `generate_extra`."""
     extra = dict(kwargs)
     if event_code:
         extra["event_code"] = event_code
@@ -104,12 +203,25 @@ def generate_extra(
         workflow_collection_engagement_detail,
         default=workflow_collection_engagement,
     )
-    workflow_collection = find_property(
-        "workflow_collection",
+    workflow_collection_engagement_id = (
+        workflow_collection_engagement.id
+        if workflow_collection_engagement
+        else find_id(
+            "workflow_collection_engagement", workflow_collection_engagement_detail
+        )
+    )
+    collection_sources = (
         workflow_collection_assignment,
         workflow_collection_subscription,
         workflow_collection_engagement,
-        default=workflow_collection,
+    )
+    workflow_collection = find_property(
+        "workflow_collection", *collection_sources, default=workflow_collection
+    )
+    workflow_collection_id = (
+        workflow_collection.id
+        if workflow_collection
+        else find_id("workflow_collection", *collection_sources)
     )
     activity = find_property(
         "activity",
@@ -117,15 +229,14 @@ def generate_extra(
         default=activity,
     )
 
-    user = find_property(
-        "user",
+    user_sources = (
         request,
         workflow_collection_assignment,
         workflow_collection_subscription,
         workflow_collection_engagement,
         activity_assignment,
-        default=user,
     )
+    user = find_property("user", *user_sources, default=user)
 
     # handle request
     if request:
@@ -133,12 +244,18 @@ def generate_extra(
         extra["request__method"] = request.method
         if hasattr(request, "query_params") and request.query_params:
             extra["request__query_params"] = request.query_params
-        if hasattr(request, "data") and request.data:
-            extra["request__data"] = strip_sensitive_data(request.data)
+        # Only use the body if the view already parsed it.
+        data = getattr(request, "_full_data", Empty)
+        if data is not Empty and data:
+            extra["request__data"] = strip_sensitive_data(data)
     # handle user
     if user:
         extra["user__username"] = user.username
         extra["user__id"] = user.id
+    else:
+        user_id = find_id("user", *user_sources)
+        if user_id:
+            extra["user__id"] = user_id
 
     if activity:
         extra["activity__id"] = activity.id
@@ -150,8 +267,9 @@ def generate_extra(
             "activity_assignment__associated_date"
         ] = activity_assignment.associated_date
 
+    if workflow_collection_id:
+        extra["workflow_collection__id"] = workflow_collection_id
     if workflow_collection:
-        extra["workflow_collection__id"] = workflow_collection.id
         extra["workflow_collection__code"] = workflow_collection.code
         extra["workflow_collection__version"] = workflow_collection.version
         extra["workflow_collection__category"] = workflow_collection.category
@@ -165,8 +283,9 @@ def generate_extra(
             "workflow_collection_assignment__status"
         ] = workflow_collection_assignment.status
 
+    if workflow_collection_engagement_id:
+        extra["workflow_collection_engagement__id"] = workflow_collection_engagement_id
     if workflow_collection_engagement:
-        extra["workflow_collection_engagement__id"] = workflow_collection_engagement.id
         extra[
             "workflow_collection_engagement__started"
         ] = workflow_collection_engagement.started
@@ -178,9 +297,9 @@ def generate_extra(
         extra[
             "workflow_collection_engagement_detail__id"
         ] = workflow_collection_engagement_detail.id
-        extra[
-            "workflow_collection_engagement_detail__step__code"
-        ] = workflow_collection_engagement_detail.step.code
+        step = get_loaded(workflow_collection_engagement_detail, "step")
+        if step:
+            extra["workflow_collection_engagement_detail__step__code"] = step.code
         extra[
             "workflow_collection_engagement_detail__started"
         ] = workflow_collection_engagement_detail.started
@@ -0,0 +1,109 @@
+"""Utilities for resolving WorkflowMetadata hierarchies in memory."""
+from django.db.models.signals import post_delete, post_save
+
+from ..models import WorkflowMetadata
+from .caching import bump_cache_version, get_local_cache_version, invalidate_on_commit
+from .profiling import count_cache
+
+TREE_VERSION_CACHE_KEY = "django_workflow_system:metadata_tree"
+
+_cached_tree = None
+
+
+class MetadataTree:
+    """
+    An in-memory copy of every WorkflowMetadata group's name and parent.
+
+    Attributes:
+        groups (dict): Group ids mapped to (name, parent group id) pairs.
+        version (str): The cache version the tree was loaded for.
+    """
+
+    def __init__(self, groups, version=None):
+        self.version = version
+        self.groups = {
+            group_id: (name, parent_id) for group_id, name, parent_id in groups
+        }
+        self._hierarchies = {}
+
+    @classmethod
+    def load(cls, version=None):
+        """Build the tree from the database with a single query."""
+        return cls(
+            WorkflowMetadata.objects.values_list("id", "name", "parent_group_id"),
+            version,
+        )
+
+    def hierarchy(self, group_id):
+        """
+        Return the names of the groups from the root down to `group_id`, the
+        same as WorkflowMetadata.group_hierarchy, or None if the group isn't
+        in the tree.
+        """
+        if group_id not in self._hierarchies:
+            if group_id not in self.groups:
+                return None
+            names = []
+            seen = set()
+            iter_id = group_id
+            # Parents saved before they were validated may form a cycle, which
+            # is followed around once.
+            while iter_id in self.groups and iter_id not in seen:
+                seen.add(iter_id)
+                name, iter_id = self.groups[iter_id]
+                names.append(name)
+            self._hierarchies[group_id] = tuple(reversed(names))
+        return self._hierarchies[group_id]
+
+
+def get_metadata_tree() -> MetadataTree:
+    """
+    Return the metadata tree, loading it only if it changed.
+
+    The tree is kept in memory per process, until its version changes (see
+    `get_local_cache_version`). The version is replaced whenever a group is
+    saved or deleted and the change is committed.
+    """
+    global _cached_tree
+
+    version = get_local_cache_version(TREE_VERSION_CACHE_KEY)
+    tree = _cached_tree
+    current = version is not None and tree is not None and tree.version == version
+    count_cache(current)
+    if not current:
+        tree = MetadataTree.load(version=version)
+        if version is not None:
+            _cached_tree = tree
+    return tree
+
+
+def get_metadata_hierarchies(groups) -> list:
+    """
+    Return the `group_hierarchy` of every WorkflowMetadata in `groups`, with
+    no queries for their parents, however deep they are nested.
+
+    Parameters:
+        groups (iterable): WorkflowMetadata objects.
+
+    Returns:
+        list: One tuple of group names per group.
+    """
+    tree = get_metadata_tree()
+    hierarchies = []
+    for group in groups:
+        hierarchy = tree.hierarchy(group.id)
+        if hierarchy is None:
+            hierarchy = group.group_hierarchy
+        hierarchies.append(hierarchy)
+    return hierarchies
+
+
+def invalidate_metadata_tree(**kwargs):
+    """
+    Mark the cached metadata tree as out of date.
+    """
+    invalidate_on_commit(bump_cache_version, TREE_VERSION_CACHE_KEY)
+
+
+post_save.connect(invalidate_metadata_tree, sender=WorkflowMetadata)
+post_delete.connect(invalidate_metadata_tree, sender=WorkflowMetadata)
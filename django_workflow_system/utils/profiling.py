@@ -0,0 +1,68 @@
+"""
+Per-request counters for ProfilingMiddleware.
+
+Code on hot paths calls `count()` to record work (engagement state
+computations, JSON schema validations, cache hits and misses). Outside of a
+profiled request there is no active profile and `count()` returns straight
+away.
+"""
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+_active_profile = ContextVar("django_workflow_system_profile", default=None)
+
+STATE_COMPUTATIONS = "state_computations"
+JSONSCHEMA_VALIDATIONS = "jsonschema_validations"
+CACHE_HITS = "cache_hits"
+CACHE_MISSES = "cache_misses"
+
+
+class RequestProfile:
+    """The counters and database timings collected for one request."""
+
+    def __init__(self):
+        self.counters = Counter()
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+    def record_query(self, execute, sql, params, many, context):
+        """
+        Time a database query.
+
+        Used as a wrapper with `connection.execute_wrapper()`.
+        """
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_queries += 1
+            self.db_seconds += time.perf_counter() - started
+
+
+def start_profile() -> tuple:
+    """
+    Make a new RequestProfile the active one.
+
+    Returns:
+        tuple: The profile, and a token to pass to `stop_profile`.
+    """
+    profile = RequestProfile()
+    return profile, _active_profile.set(profile)
+
+
+def stop_profile(token):
+    """Restore whichever profile was active before `start_profile`."""
+    _active_profile.reset(token)
+
+
+def count(counter, amount=1):
+    """Add `amount` to a counter of the active profile, if there is one."""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.counters[counter] += amount
+
+
+def count_cache(hit):
+    """Record a cache hit or miss on the active profile, if there is one."""
+    count(CACHE_HITS if hit else CACHE_MISSES)
@@ -0,0 +1,83 @@
+"""Utilities for finding a user's active WorkflowCollectionRecommendations."""
+import math
+
+from django.core.cache import cache
+from django.db.models import Min, Q
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from ..models import WorkflowCollectionRecommendation
+from .caching import invalidate_on_commit, is_invalidation_pending
+
+ACTIVE_RECOMMENDATIONS_CACHE_KEY = "django_workflow_system:active_recommendations:{}"
+
+
+def get_next_boundary(user, now):
+    """
+    Find when the set of a user's active recommendations next changes, which
+    is the earliest start or end still to come.
+
+    Returns:
+        datetime: The boundary, or None if there isn't one.
+    """
+    boundaries = WorkflowCollectionRecommendation.objects.filter(user=user).aggregate(
+        next_start=Min("start", filter=Q(start__gt=now)),
+        next_end=Min("end", filter=Q(end__gt=now)),
+    )
+    return min(filter(None, boundaries.values()), default=None)
+
+
+def get_active_recommendations(user, now=None) -> list:
+    """
+    Return the recommendations which are valid for a user right now.
+
+    The result is cached per user until the next time one of their
+    recommendations starts or ends, or until one of them is saved or deleted.
+
+    Parameters:
+        user (User): The user being recommended collections.
+        now (datetime): Defaults to the current time.
+
+    Returns:
+        list: WorkflowCollectionRecommendation objects.
+    """
+    now = now or timezone.now()
+    key = ACTIVE_RECOMMENDATIONS_CACHE_KEY.format(user.pk)
+
+    # Changes waiting to be committed aren't in the cache yet.
+    pending = is_invalidation_pending(key)
+    cached = None if pending else cache.get(key)
+    if cached is not None:
+        boundary, recommendations = cached
+        if boundary is None or now < boundary:
+            return recommendations
+
+    recommendations = list(
+        WorkflowCollectionRecommendation.objects.active(now).filter(user=user)
+    )
+    boundary = get_next_boundary(user, now)
+    timeout = (
+        None
+        if boundary is None
+        else max(math.ceil((boundary - now).total_seconds()), 1)
+    )
+    if not pending:
+        cache.set(key, (boundary, recommendations), timeout=timeout)
+    return recommendations
+
+
+def invalidate_active_recommendations(instance, **kwargs):
+    """
+    Throw away the cached active recommendations of a recommendation's user.
+    """
+    invalidate_on_commit(
+        cache.delete, ACTIVE_RECOMMENDATIONS_CACHE_KEY.format(instance.user_id)
+    )
+
+
+post_save.connect(
+    invalidate_active_recommendations, sender=WorkflowCollectionRecommendation
+)
+post_delete.connect(
+    invalidate_active_recommendations, sender=WorkflowCollectionRecommendation
+)
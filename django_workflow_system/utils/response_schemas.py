@@ -0,0 +1,77 @@
+"""Utilities for caching the response schemas of WorkflowStepUserInputs."""
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import response_schema_handlers
+from .profiling import count_cache
+
+RESPONSE_SCHEMA_CACHE_KEY = "django_workflow_system:response_schema:{}:{}:{}"
+
+
+def get_response_schema_handlers_version() -> str:
+    """
+    Return a token which changes whenever a response schema handler does.
+
+    It covers the handlers shipped with the package and those in the
+    `INPUT_TYPE_RESPONSE_SCHEMA_HANDLERS` directories, which are loaded again
+    every time a schema is generated, so it is taken from the name, size and
+    modification time of their files rather than computed once per process.
+    """
+    directories = [os.path.dirname(response_schema_handlers.__file__)]
+    directories.extend(
+        getattr(settings, "DJANGO_WORKFLOW_SYSTEM", {}).get(
+            "INPUT_TYPE_RESPONSE_SCHEMA_HANDLERS", []
+        )
+    )
+    digest = hashlib.sha256()
+    for directory in directories:
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(".py") and entry.is_file():
+                stat = entry.stat()
+                digest.update(
+                    f"{entry.path}:{stat.st_size}:{stat.st_mtime_ns};".encode()
+                )
+    return digest.hexdigest()[:16]
+
+
+def get_response_schema_version(step_input) -> str:
+    """
+    Return a token which changes whenever a step input is saved, along with
+    the response schema generated from it.
+    """
+    return format(step_input.modified_date.timestamp(), ".6f")
+
+
+def get_response_schema(step_input) -> dict:
+    """
+    Return the JSON schema a response to a step input has to match.
+
+    Generating a schema loads the configured response schema handlers, so
+    schemas are cached per version of the step input and of the handlers.
+    Saving the input or changing a handler changes the key, so there is
+    nothing to invalidate.
+
+    Parameters:
+        step_input (WorkflowStepUserInput): The input being responded to.
+
+    Returns:
+        dict: The response schema.
+    """
+    key = RESPONSE_SCHEMA_CACHE_KEY.format(
+        step_input.pk,
+        get_response_schema_handlers_version(),
+        get_response_schema_version(step_input),
+    )
+    schema = cache.get(key)
+    count_cache(schema is not None)
+    if schema is None:
+        schema = step_input.response_schema
+        cache.set(key, schema, timeout=None)
+    return schema
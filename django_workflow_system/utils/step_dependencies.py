@@ -0,0 +1,136 @@
+"""Utilities for evaluating WorkflowStep dependencies within an engagement."""
+from collections import defaultdict
+
+from django.db.models.signals import post_delete, post_save
+from jsonschema.validators import validator_for
+
+from ..models.step_dependency_detail import WorkflowStepDependencyDetail
+from ..models.step_dependency_group import WorkflowStepDependencyGroup
+from .caching import bump_cache_version, get_local_cache_version, invalidate_on_commit
+from .profiling import JSONSCHEMA_VALIDATIONS, count, count_cache
+
+EVALUATOR_VERSION_CACHE_KEY = "django_workflow_system:step_dependency_evaluators"
+
+_cached_evaluators = {}
+_cached_version = None
+
+
+class StepDependencyEvaluator:
+    """
+    The step dependencies of a single WorkflowCollection, compiled for reuse.
+
+    Every dependency group is stored as a list of
+    (dependency step id, validator) pairs, indexed by the step the group
+    belongs to. The `required_response` schemas are turned into validators
+    once, when the evaluator is built.
+
+    A step is available when it has no dependency groups, or when every
+    dependency of at least one of its groups is satisfied. A dependency is
+    satisfied when the depended on step was completed and the inputs of its
+    latest response set match `required_response`.
+    """
+
+    def __init__(self, groups_by_step):
+        self.groups_by_step = groups_by_step
+
+    @classmethod
+    def load(cls, workflow_collection_id):
+        """
+        Build the evaluator for a collection with two queries.
+
+        Parameters:
+            workflow_collection_id (uuid): The id of the WorkflowCollection.
+        """
+        groups = {
+            group_id: (step_id, [])
+            for group_id, step_id in WorkflowStepDependencyGroup.objects.filter(
+                workflow_collection_id=workflow_collection_id
+            ).values_list("id", "workflow_step_id")
+        }
+        if not groups:
+            return cls({})
+
+        for (
+            group_id,
+            dependency_step_id,
+            required_response,
+        ) in WorkflowStepDependencyDetail.objects.filter(
+            dependency_group__in=groups
+        ).values_list(
+            "dependency_group_id", "dependency_step_id", "required_response"
+        ):
+            # Honour `$schema`, the same way jsonschema.validate does.
+            validator = validator_for(required_response)(required_response)
+            groups[group_id][1].append((dependency_step_id, validator))
+
+        groups_by_step = defaultdict(list)
+        for step_id, dependencies in groups.values():
+            groups_by_step[step_id].append(dependencies)
+        return cls(dict(groups_by_step))
+
+    def is_satisfied(self, step_id, completed_responses) -> bool:
+        """
+        Determine if a step's dependencies are satisfied.
+
+        Parameters:
+            step_id (uuid): The id of the WorkflowStep being considered.
+            completed_responses (dict): The ids of the steps completed in the
+                                        engagement mapped to their `user_responses`.
+
+        Returns:
+            bool
+        """
+        groups = self.groups_by_step.get(step_id)
+        if not groups:
+            return True
+
+        def is_met(dependency_step_id, validator):
+            responses = completed_responses.get(dependency_step_id)
+            if not responses:
+                return False
+            count(JSONSCHEMA_VALIDATIONS)
+            return validator.is_valid(responses[-1]["inputs"])
+
+        return any(
+            all(
+                is_met(dependency_step_id, validator)
+                for dependency_step_id, validator in dependencies
+            )
+            for dependencies in groups
+        )
+
+
+def get_step_dependency_evaluator(workflow_collection_id) -> StepDependencyEvaluator:
+    """
+    Return the compiled StepDependencyEvaluator for a collection.
+
+    Evaluators are kept in memory per process and thrown away whenever
+    their version changes (see `get_local_cache_version`). The version is
+    replaced each time a dependency group or detail is saved or deleted.
+    """
+    global _cached_version
+
+    version = get_local_cache_version(EVALUATOR_VERSION_CACHE_KEY)
+    if version != _cached_version:
+        _cached_evaluators.clear()
+        _cached_version = version
+
+    evaluator = _cached_evaluators.get(workflow_collection_id)
+    count_cache(evaluator is not None)
+    if evaluator is None:
+        evaluator = StepDependencyEvaluator.load(workflow_collection_id)
+        if version is not None:
+            _cached_evaluators[workflow_collection_id] = evaluator
+    return evaluator
+
+
+def invalidate_step_dependency_evaluators(**kwargs):
+    """
+    Mark every cached StepDependencyEvaluator as out of date.
+    """
+    invalidate_on_commit(bump_cache_version, EVALUATOR_VERSION_CACHE_KEY)
+
+
+for model in (WorkflowStepDependencyGroup, WorkflowStepDependencyDetail):
+    post_save.connect(invalidate_step_dependency_evaluators, sender=model)
+    post_delete.connect(invalidate_step_dependency_evaluators, sender=model)
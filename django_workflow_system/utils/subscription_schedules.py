@@ -0,0 +1,100 @@
+"""Utilities for working out when subscription notifications are due."""
+import datetime
+
+from django.db import transaction
+from django.utils import timezone
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def next_fire_at(
+    day_of_week: int,
+    time_of_day: datetime.time,
+    weekly_interval: int,
+    anchor: datetime.datetime,
+    after: datetime.datetime,
+) -> datetime.datetime:
+    """
+    Return the first notification time strictly later than `after`.
+
+    Notifications happen on `day_of_week` at `time_of_day` (UTC) every
+    `weekly_interval` weeks. Weeks are counted from the week containing
+    `anchor`, so an every-other-week schedule keeps firing on the same
+    weeks no matter when this is evaluated.
+
+    Parameters:
+        day_of_week (int): 0 (Monday) through 6 (Sunday).
+        time_of_day (time): The UTC time of day notifications go out.
+        weekly_interval (int): Notify every n weeks. Values below 1 are treated as 1.
+        anchor (datetime): An aware datetime in the first week of the schedule.
+        after (datetime): An aware datetime.
+
+    Returns:
+        datetime: An aware UTC datetime.
+    """
+    interval = max(weekly_interval, 1)
+    after = after.astimezone(datetime.timezone.utc)
+    anchor = anchor.astimezone(datetime.timezone.utc).date()
+    anchor_week = anchor - datetime.timedelta(days=anchor.weekday())
+    after_week = after.date() - datetime.timedelta(days=after.weekday())
+
+    # Move forward to the first week on the interval that isn't before `after`.
+    weeks_since_anchor = max((after_week - anchor_week).days // 7, 0)
+    weeks_since_anchor += -weeks_since_anchor % interval
+    week = anchor_week + datetime.timedelta(weeks=weeks_since_anchor)
+
+    fire_at = datetime.datetime.combine(
+        week + datetime.timedelta(days=day_of_week),
+        time_of_day,
+        tzinfo=datetime.timezone.utc,
+    )
+    if fire_at <= after:
+        fire_at += datetime.timedelta(weeks=interval)
+    return fire_at
+
+
+def due_subscription_schedules(now=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Yield lists of subscription schedules whose notifications are due.
+
+    Due schedules are found with an indexed range scan on `next_fire_at`
+    rather than by evaluating every schedule. Each batch is claimed with
+    SELECT ... FOR UPDATE SKIP LOCKED and has its `next_fire_at` advanced
+    past `now` before the transaction commits, so concurrent workers never
+    hand out the same notification twice (at-most-once delivery). Schedules
+    that missed several notifications, e.g. because no worker ran for a
+    while, are only reported once.
+
+    Parameters:
+        now (datetime): The current time. Defaults to `timezone.now()`.
+        batch_size (int): How many schedules to claim per transaction.
+
+    Yields:
+        list[WorkflowCollectionSubscriptionSchedule]: The claimed schedules,
+            with `fire_at` set to the notification time that was due.
+    """
+    # Imported here to get around a circular dependency with the models package.
+    from ..models import WorkflowCollectionSubscriptionSchedule
+
+    now = now or timezone.now()
+    queryset = WorkflowCollectionSubscriptionSchedule.objects.filter(
+        next_fire_at__lte=now,
+        workflow_collection_subscription__active=True,
+    )
+
+    while True:
+        with transaction.atomic():
+            batch = list(
+                queryset.select_for_update(skip_locked=True, of=("self",))
+                .select_related("workflow_collection_subscription")
+                .order_by("next_fire_at", "pk")[:batch_size]
+            )
+            if not batch:
+                return
+            for schedule in batch:
+                schedule.fire_at = schedule.next_fire_at
+                schedule.next_fire_at = schedule.get_next_fire_at(now)
+            WorkflowCollectionSubscriptionSchedule.objects.bulk_update(
+                batch, ["next_fire_at"]
+            )
+        yield batch
@@ -0,0 +1,482 @@
+"""
+Builders for large, synthetic workflow datasets.
+
+Every table is written with `bulk_create`, and every random choice (and
+primary key) comes from a single seeded random number generator, so the same
+parameters and seed always produce the same dataset.
+"""
+import random
+import uuid
+from datetime import timedelta
+from itertools import cycle
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from ..models import (
+    Workflow,
+    WorkflowAuthor,
+    WorkflowCollection,
+    WorkflowCollectionAssignment,
+    WorkflowCollectionDependency,
+    WorkflowCollectionEngagement,
+    WorkflowCollectionEngagementDetail,
+    WorkflowCollectionMember,
+    WorkflowCollectionRecommendation,
+    WorkflowCollectionSubscription,
+    WorkflowCollectionSubscriptionSchedule,
+    WorkflowMetadata,
+    WorkflowStep,
+    WorkflowStepUITemplate,
+    WorkflowStepUserInput,
+    WorkflowStepUserInputType,
+)
+from .admin_utils import invalidate_collection_choices
+from .collection_dependencies import invalidate_dependency_graph
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class SyntheticDataset:
+    """
+    Creates synthetic users, collections and engagement histories.
+
+    Parameters:
+        seed (int): Seed for every random choice the builder makes.
+        batch_size (int): How many rows to insert per query.
+        now (datetime): The point in time the generated history leads up to.
+    """
+
+    def __init__(self, seed=0, batch_size=DEFAULT_BATCH_SIZE, now=None):
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+        self.now = now or timezone.now()
+        self.prefix = f"synthetic_{seed}"
+        self.counts = {}
+        self._collection_steps = {}
+
+    def already_seeded(self) -> bool:
+        """
+        Determine whether the database already holds data created with this
+        seed, whose names and primary keys the new data would clash with.
+        """
+        prefix = f"{self.prefix}_"
+        return (
+            get_user_model().objects.filter(username__startswith=prefix).exists()
+            or WorkflowMetadata.objects.filter(name__startswith=prefix).exists()
+            or WorkflowCollection.objects.filter(code__startswith=prefix).exists()
+        )
+
+    def invalidate_caches(self):
+        """
+        Throw away cached data derived from the tables written to.
+
+        `bulk_create` doesn't send the `post_save` signals that normally do
+        this.
+        """
+        invalidate_dependency_graph()
+        invalidate_collection_choices()
+
+    def uuid(self) -> uuid.UUID:
+        """Return a random, but reproducible, UUID."""
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def create(self, model, objects) -> list:
+        """Insert `objects` in batches and return them."""
+        objects = list(objects)
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        name = model._meta.object_name
+        self.counts[name] = self.counts.get(name, 0) + len(objects)
+        return objects
+
+    def build_users(self, count, label="user", is_staff=False, start=0) -> list:
+        """
+        Create users which can't log in with a password.
+
+        Parameters:
+            count (int): How many users to create.
+            label (str): Added to the username, to keep groups of users apart.
+            is_staff (bool): Whether the users are staff members.
+            start (int): The number of the first user, when creating users in
+                         several calls.
+        """
+        user_model = get_user_model()
+        password = make_password(None)
+        users = self.create(
+            user_model,
+            (
+                user_model(
+                    username=f"{self.prefix}_{label}_{number}",
+                    email=f"{self.prefix}_{label}_{number}@example.com",
+                    first_name=label.title(),
+                    last_name=str(number),
+                    password=password,
+                    is_staff=is_staff,
+                )
+                for number in range(start, start + count)
+            ),
+        )
+        if users and users[0].pk is None:
+            # Only some backends (e.g. PostgreSQL) set auto incremented primary
+            # keys on objects created with `bulk_create`.
+            usernames = [user.username for user in users]
+            users = []
+            for index in range(0, len(usernames), 500):
+                users.extend(
+                    user_model.objects.filter(
+                        username__in=usernames[index : index + 500]
+                    ).order_by("pk")
+                )
+        return users
+
+    def build_metadata(self, count) -> list:
+        """
+        Create a forest of WorkflowMetadata.
+
+        About a tenth of the groups are roots, and every other group hangs
+        off a randomly chosen group created before it.
+        """
+        metadata = []
+        for number in range(count):
+            parent = (
+                self.random.choice(metadata) if number >= max(1, count // 10) else None
+            )
+            metadata.append(
+                WorkflowMetadata(
+                    id=self.uuid(),
+                    parent_group=parent,
+                    name=f"{self.prefix}_metadata_{number}",
+                    description=f"Synthetic metadata group {number}.",
+                )
+            )
+        return self.create(WorkflowMetadata, metadata)
+
+    def link_metadata(self, model, objects, metadata, per_object=2):
+        """Link each object to up to `per_object` randomly chosen metadata groups."""
+        if not metadata:
+            return
+        field = model._meta.get_field("metadata")
+        through = field.remote_field.through
+        source = f"{field.m2m_field_name()}_id"
+        target = f"{field.m2m_reverse_field_name()}_id"
+        self.create(
+            through,
+            (
+                through(**{source: obj.id, target: group.id})
+                for obj in objects
+                for group in self.random.sample(
+                    metadata, min(len(metadata), self.random.randint(1, per_object))
+                )
+            ),
+        )
+
+    def build_collections(
+        self, collections, workflows, steps, inputs, metadata=None
+    ) -> list:
+        """
+        Create collections, each with its own workflows, steps and user inputs.
+
+        User inputs cycle through every WorkflowStepUserInputType and use the
+        type's example specification.
+
+        Parameters:
+            collections (int): How many collections to create.
+            workflows (int): How many workflows each collection has.
+            steps (int): How many steps each workflow has.
+            inputs (int): How many user inputs each step has.
+            metadata (list): WorkflowMetadata to link the collections,
+                             workflows and steps to.
+
+        Returns:
+            list: The new WorkflowCollection objects.
+        """
+        (staff,) = self.build_users(1, label="staff", is_staff=True)
+        authors = self.create(
+            WorkflowAuthor,
+            (
+                WorkflowAuthor(
+                    id=self.uuid(),
+                    user=user,
+                    title="Dr.",
+                    biography=f"Author of {user.username}'s workflows.",
+                )
+                for user in self.build_users(max(1, collections), label="author")
+            ),
+        )
+        ui_template, _ = WorkflowStepUITemplate.objects.get_or_create(
+            name=f"{self.prefix}_template"
+        )
+        input_types = cycle(WorkflowStepUserInputType.objects.order_by("name"))
+
+        new_collections = self.create(
+            WorkflowCollection,
+            (
+                WorkflowCollection(
+                    id=self.uuid(),
+                    code=f"{self.prefix}_collection_{number}",
+                    name=f"Synthetic Collection {number}",
+                    description=f"Synthetic collection {number}.",
+                    ordered=self.random.random() < 0.5,
+                    created_by=staff,
+                    active=True,
+                    recommendable=True,
+                    category=self.random.choice(("SURVEY", "ACTIVITY")),
+                )
+                for number in range(collections)
+            ),
+        )
+
+        members, new_steps, new_inputs = [], [], []
+        for collection_number, collection in enumerate(new_collections):
+            author = authors[collection_number % len(authors)]
+            for workflow_number in range(workflows):
+                code = f"{self.prefix}_workflow_{collection_number}_{workflow_number}"
+                workflow = Workflow(
+                    id=self.uuid(),
+                    code=code,
+                    name=f"Synthetic Workflow {collection_number}.{workflow_number}",
+                    author=author,
+                    created_by=staff,
+                )
+                members.append((workflow, collection, workflow_number + 1))
+                for step_number in range(1, steps + 1):
+                    step = WorkflowStep(
+                        id=self.uuid(),
+                        workflow=workflow,
+                        code=f"{code}_step_{step_number}",
+                        order=step_number,
+                        ui_template=ui_template,
+                    )
+                    new_steps.append(step)
+                    for input_number in range(inputs):
+                        input_type = next(input_types, None)
+                        if input_type is None:
+                            continue
+                        new_inputs.append(
+                            WorkflowStepUserInput(
+                                id=self.uuid(),
+                                workflow_step=step,
+                                ui_identifier=f"input_{input_number}",
+                                required=True,
+                                specification=input_type.example_specification,
+                                type=input_type,
+                            )
+                        )
+
+        self.create(Workflow, (workflow for workflow, _, _ in members))
+        self.create(
+            WorkflowCollectionMember,
+            (
+                WorkflowCollectionMember(
+                    id=self.uuid(),
+                    workflow=workflow,
+                    workflow_collection=collection,
+                    order=order,
+                )
+                for workflow, collection, order in members
+            ),
+        )
+        self.create(WorkflowStep, new_steps)
+        self.create(WorkflowStepUserInput, new_inputs)
+        self.link_metadata(WorkflowCollection, new_collections, metadata)
+        self.link_metadata(Workflow, (workflow for workflow, _, _ in members), metadata)
+        self.link_metadata(WorkflowStep, new_steps, metadata)
+        return new_collections
+
+    def build_collection_dependencies(self, collections, count) -> list:
+        """
+        Make collections depend on other collections.
+
+        A collection only ever depends on collections created before it, so
+        the dependencies can't form a cycle.
+        """
+        pairs = set()
+        attempts = 0
+        while len(pairs) < count and attempts < count * 10 and len(collections) > 1:
+            attempts += 1
+            target, source = sorted(self.random.sample(range(len(collections)), 2))
+            pairs.add((source, target))
+        return self.create(
+            WorkflowCollectionDependency,
+            (
+                WorkflowCollectionDependency(
+                    id=self.uuid(),
+                    source=collections[source],
+                    target=collections[target],
+                )
+                for source, target in sorted(pairs)
+            ),
+        )
+
+    def get_collection_steps(self, collections):
+        """
+        Return the steps of each collection, in the order they're engaged
+        with, and the user inputs of each step.
+        """
+        missing = [
+            collection
+            for collection in collections
+            if collection.id not in self._collection_steps
+        ]
+        if missing:
+            steps_by_workflow = {}
+            for step in WorkflowStep.objects.filter(
+                workflow__workflowcollectionmember__workflow_collection__in=missing
+            ).order_by("order"):
+                steps_by_workflow.setdefault(step.workflow_id, []).append(step)
+            inputs_by_step = {}
+            for user_input in WorkflowStepUserInput.objects.filter(
+                workflow_step__workflow__in=steps_by_workflow
+            ):
+                inputs_by_step.setdefault(user_input.workflow_step_id, []).append(
+                    user_input
+                )
+            for collection in missing:
+                self._collection_steps[collection.id] = []
+            for collection_id, workflow_id in (
+                WorkflowCollectionMember.objects.filter(workflow_collection__in=missing)
+                .order_by("order")
+                .values_list("workflow_collection_id", "workflow_id")
+            ):
+                self._collection_steps[collection_id].extend(
+                    (step, inputs_by_step.get(step.id, []))
+                    for step in steps_by_workflow.get(workflow_id, [])
+                )
+        return {
+            collection.id: self._collection_steps[collection.id]
+            for collection in collections
+        }
+
+    def build_history(self, users, collections, engagements, submissions=1, offset=0):
+        """
+        Give every user a history of engagements with the collections.
+
+        Each user works through `engagements` collections, starting at a
+        different one per user. Every engagement but the latest is finished,
+        with a detail for each step; the latest is left half way through.
+        Each user also gets an assignment for their open engagement, a
+        recommendation, and a subscription with one schedule.
+
+        Parameters:
+            users (list): The users to create history for.
+            collections (list): The collections to engage with.
+            engagements (int): How many engagements each user has.
+            submissions (int): How many response sets each detail holds.
+            offset (int): The number of the first user, when creating history
+                          in several calls.
+        """
+        steps_by_collection = self.get_collection_steps(collections)
+
+        # Related objects are set by id below: going through the foreign key
+        # descriptors for every row is a large part of the time spent here.
+        new_engagements, details, assignments = [], [], []
+        for user_number, user in enumerate(users, start=offset):
+            for number in range(engagements):
+                collection = collections[(user_number + number) % len(collections)]
+                started = self.now - timedelta(
+                    days=engagements - number, minutes=number
+                )
+                latest = number == engagements - 1
+                engagement = WorkflowCollectionEngagement(
+                    id=self.uuid(),
+                    workflow_collection_id=collection.id,
+                    user_id=user.pk,
+                    started=started,
+                    finished=None if latest else started + timedelta(hours=1),
+                )
+                new_engagements.append(engagement)
+                steps = steps_by_collection[collection.id]
+                for step_number, (step, user_inputs) in enumerate(
+                    steps[: len(steps) // 2] if latest else steps
+                ):
+                    step_started = started + timedelta(minutes=step_number)
+                    details.append(
+                        WorkflowCollectionEngagementDetail(
+                            id=self.uuid(),
+                            workflow_collection_engagement_id=engagement.id,
+                            step_id=step.id,
+                            started=step_started,
+                            finished=step_started + timedelta(seconds=30),
+                            user_responses=self.build_responses(
+                                user_inputs, step_started, submissions
+                            ),
+                        )
+                    )
+                if latest:
+                    assignments.append(
+                        WorkflowCollectionAssignment(
+                            id=self.uuid(),
+                            workflow_collection_id=collection.id,
+                            user_id=user.pk,
+                            start=started,
+                            status=WorkflowCollectionAssignment.IN_PROGRESS,
+                            engagement_id=engagement.id,
+                        )
+                    )
+
+        self.create(WorkflowCollectionEngagement, new_engagements)
+        self.create(WorkflowCollectionEngagementDetail, details)
+        self.create(WorkflowCollectionAssignment, assignments)
+        self.create(
+            WorkflowCollectionRecommendation,
+            (
+                WorkflowCollectionRecommendation(
+                    id=self.uuid(),
+                    workflow_collection=self.random.choice(collections),
+                    user=user,
+                    start=self.now - timedelta(days=1),
+                )
+                for user in users
+            ),
+        )
+        subscriptions = self.create(
+            WorkflowCollectionSubscription,
+            (
+                WorkflowCollectionSubscription(
+                    id=self.uuid(),
+                    workflow_collection=self.random.choice(collections),
+                    user=user,
+                    active=True,
+                )
+                for user in users
+            ),
+        )
+        schedules = []
+        for subscription in subscriptions:
+            schedule = WorkflowCollectionSubscriptionSchedule(
+                id=self.uuid(),
+                workflow_collection_subscription=subscription,
+                time_of_day="{:02d}:00:00".format(self.random.randrange(24)),
+                day_of_week=self.random.randrange(7),
+                weekly_interval=1,
+            )
+            schedule.next_fire_at = schedule.get_next_fire_at(self.now)
+            schedules.append(schedule)
+        self.create(WorkflowCollectionSubscriptionSchedule, schedules)
+
+    def build_responses(self, user_inputs, submitted, submissions) -> list:
+        """
+        Build the `user_responses` of an engagement detail.
+
+        Each submission answers every input with its specification's correct
+        input, or a free text answer if it doesn't have one, and is stored the
+        way WorkflowCollectionEngagementDetailSerializer stores valid answers.
+        """
+        return [
+            {
+                "submittedTime": (submitted + timedelta(seconds=number)).isoformat(),
+                "inputs": [
+                    {
+                        "stepInputID": str(user_input.id),
+                        "stepInputUIIdentifier": user_input.ui_identifier,
+                        "userInput": user_input.specification.get(
+                            "correctInput", f"Synthetic answer {number}"
+                        ),
+                        "is_valid": True,
+                    }
+                    for user_input in user_inputs
+                ],
+            }
+            for number in range(submissions)
+        ]
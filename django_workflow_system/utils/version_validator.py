@@ -1,5 +1,72 @@
 from django.core.exceptions import ValidationError
-from django.db.models import Max
+from django.db import IntegrityError, router, transaction
+
+
+def get_versions(model_class, codes) -> dict:
+    """
+    Find the existing versions of one or more codes, with a single query.
+
+    This only reads the versions. Nothing stops another transaction from
+    creating a version in the meantime; the unique code and version
+    constraint is what keeps two saves from creating the same one (see
+    `save_version`).
+
+    model_class : Class
+        Workflow or WorkflowCollection
+    codes : iterable
+        The codes to look up
+
+    Returns a dict of each code mapped to a dict of its objects' ids and versions.
+    """
+    codes = set(codes)
+    versions = {code: {} for code in codes}
+    if not codes:
+        return versions
+
+    rows = model_class.objects.filter(code__in=codes).values_list(
+        "code", "id", "version"
+    )
+    for code, pk, version in rows:
+        versions[code][pk] = version
+    return versions
+
+
+def save_version(self, model_class, save):
+    """
+    Validate a model object and save it.
+
+    If another transaction creates the same code and version after it was
+    validated, the unique constraint rejects the save, which is raised as a
+    ValidationError on 'version' rather than an IntegrityError.
+
+    self : obj instance
+        The instance of the object being saved
+    model_class : Class
+        Class type of the object being saved
+    save : callable
+        Saves the instance, without validating it
+    """
+    self.full_clean()
+    using = router.db_for_write(model_class, instance=self)
+    try:
+        # A savepoint, so the transaction can still be used to look for the
+        # conflicting version if the save is rejected.
+        with transaction.atomic(using=using):
+            save()
+    except IntegrityError:
+        conflict = (
+            model_class.objects.using(using)
+            .filter(code=self.code, version=self.version)
+            .exclude(id=self.id)
+        )
+        if not conflict.exists():
+            raise
+        raise ValidationError(
+            {
+                "version": f"Version {self.version} of this "
+                f"{model_class.__name__} code was just created by someone else."
+            }
+        )
 
 
 def version_validator(self, model_class):
@@ -11,8 +78,8 @@ def version_validator(self, model_class):
     model_class : Class
         Class type of the object being validated
     """
-    previous_objects = model_class.objects.filter(code=self.code)
-    latest_version = previous_objects.aggregate(Max("version"))["version__max"]
+    previous_versions = get_versions(model_class, [self.code])[self.code]
+    latest_version = max(previous_versions.values(), default=None)
     model_name = model_class.__name__
 
     # If this is a new code then make sure the version is 1.
@@ -22,11 +89,7 @@ def version_validator(self, model_class):
         )
 
     # If the first and only version of a code is attempting to be updated with a different version
-    if (
-        previous_objects.count() == 1
-        and previous_objects[0].id == self.id
-        and self.version != 1
-    ):
+    if list(previous_versions) == [self.id] and self.version != 1:
         raise ValidationError(
             {"version": f"Version must be 1 for the first " f"{model_name} of a code."}
         )